@@ -0,0 +1,157 @@
+"""
+Application Qt Facturation Coach Pro : séquence de démarrage (lancée par main.py)
+
+La base de données est ouverte dans un thread pendant que Qt s'initialise et
+que la fenêtre principale est construite ; la fenêtre est affichée dès que
+la base est prête (avec un écran d'accueil entre-temps si STARTUP_SPLASH).
+"""
+from utils.startup import StartupTimer  # En premier : origine de la mesure du démarrage
+import sys
+from PyQt6.QtWidgets import QApplication, QSplashScreen, QMessageBox
+from PyQt6.QtCore import Qt, QObject, QThreadPool, QTimer
+from PyQt6.QtGui import QColor, QPixmap
+from config import init_directories, APP_NAME, STARTUP_SPLASH
+
+
+def open_database() -> bool:
+    """
+    Ouvre la base de données (exécutée dans un thread du pool).
+    SQLAlchemy et les modèles sont importés dans ce thread, en parallèle de Qt.
+
+    Returns:
+        bool: True si l'initialisation est réussie
+    """
+    from database import init_database
+    return init_database()
+
+
+def create_splash() -> QSplashScreen:
+    """Crée l'écran d'accueil affiché pendant l'ouverture de la base"""
+    pixmap = QPixmap(420, 200)
+    pixmap.fill(QColor("#1abc9c"))
+
+    splash = QSplashScreen(pixmap)
+    splash.showMessage(
+        f"{APP_NAME}\n\nChargement...",
+        Qt.AlignmentFlag.AlignCenter,
+        QColor("white")
+    )
+    return splash
+
+
+class StartupSequence(QObject):
+    """Enchaînement du démarrage : base de données, fenêtre, tâches différées"""
+
+    def __init__(self, app: QApplication, timer: StartupTimer):
+        """
+        Initialise la séquence de démarrage.
+
+        Args:
+            app: Application Qt
+            timer: Chronomètre du démarrage
+        """
+        super().__init__()
+        self.app = app
+        self.timer = timer
+        self.splash = None
+        self.window = None
+        self.worker_signals = None
+
+    def start(self):
+        """Lance l'ouverture de la base en arrière-plan puis construit la fenêtre"""
+        # Pas d'écran d'accueil sans affichage (plateforme "offscreen" : mesures, tests)
+        if STARTUP_SPLASH and self.app.platformName() != "offscreen":
+            self.splash = create_splash()
+            self.splash.show()
+            self.app.processEvents()
+
+        # Ouverture de la base dans un thread, en parallèle de la construction de la fenêtre
+        from views.workers import QueryWorker
+        worker = QueryWorker(0, open_database)
+        worker.signals.finished.connect(self.on_database_ready)
+        worker.signals.error.connect(self.on_database_error)
+        self.worker_signals = worker.signals
+        QThreadPool.globalInstance().start(worker)
+
+        from views import MainWindow
+        self.window = MainWindow()
+        self.timer.mark("fenetre")
+
+    def on_database_ready(self, generation, success):
+        """Affiche la fenêtre une fois la base ouverte"""
+        if not success:
+            self.on_database_error(generation, "Echec de l'initialisation de la base de donnees")
+            return
+        self.timer.mark("base de donnees")
+
+        self.window.show()
+        if self.splash:
+            self.splash.close()
+
+        print("\n[OK] Application lancee avec succes!")
+        print("[INFO] Interface prête a l'utilisation\n")
+
+        # Tâches différées après le premier affichage (données de test, catalogue, sauvegarde)
+        QTimer.singleShot(0, self.on_window_shown)
+
+    def on_database_error(self, generation, message):
+        """Signale l'échec de l'ouverture de la base et quitte l'application"""
+        print(f"[ERREUR] {message}")
+        if self.splash:
+            self.splash.close()
+        QMessageBox.critical(None, APP_NAME, f"Impossible d'ouvrir la base de données.\n\n{message}")
+        self.app.exit(1)
+
+    def on_window_shown(self):
+        """Enregistre le temps de démarrage puis insère les données de test (premier lancement) en arrière-plan"""
+        self.timer.mark("premier affichage")
+        self.timer.finish()
+
+        # Même en mesure du démarrage : une base créée doit recevoir ses données de test
+        from database.seed_data import seed_first_run
+        from views.workers import QueryWorker
+        worker = QueryWorker(0, seed_first_run)
+        worker.signals.finished.connect(self.on_seeded)
+        worker.signals.error.connect(self.on_seeded)
+        self.worker_signals = worker.signals
+        QThreadPool.globalInstance().start(worker)
+
+    def on_seeded(self, generation, result):
+        """Lance les tâches différées une fois les données de test en place (ou l'erreur signalée)"""
+        if "--mesure-demarrage" in sys.argv:
+            self.app.quit()
+            return
+
+        # Catalogue des prestations indexé en arrière-plan, avant la première saisie de ligne
+        from utils.prestation_catalog import catalogue
+        from views.workers import QueryWorker
+        QThreadPool.globalInstance().start(QueryWorker(0, catalogue.refresh))
+
+        # Sauvegarde quotidienne/hebdomadaire en arrière-plan
+        from utils.backup import start_scheduled_backup
+        start_scheduled_backup()
+
+
+def main():
+    """Fonction principale de l'application"""
+    timer = StartupTimer()
+    timer.mark("imports")
+
+    # Initialiser les répertoires nécessaires
+    init_directories()
+    print("[OK] Repertoires initialises")
+
+    # Créer l'application Qt
+    app = QApplication(sys.argv)
+
+    # Configurer l'application
+    app.setApplicationName("Facturation Coach Pro")
+    app.setOrganizationName("Coach Pro")
+
+    # Base de données en arrière-plan, fenêtre principale affichée dès qu'elle est prête
+    startup = StartupSequence(app, timer)
+    startup.start()
+
+    # Lancer la boucle d'événements
+    sys.exit(app.exec())
+
@@ -0,0 +1,3 @@
+"""
+Mesures de performance de l'application (scripts exécutables avec python -m)
+"""
@@ -0,0 +1,110 @@
+"""
+Benchmark de l'autocomplétion du catalogue de prestations (utils/prestation_catalog.py).
+
+Remplit une base de test avec un grand catalogue, puis mesure pour des saisies
+typiques (une lettre, préfixes, plusieurs mots, accents, sous-chaînes, aucune
+correspondance) le temps de réponse par frappe : chaque saisie est rejouée
+caractère par caractère, comme pendant la frappe. Le p95 est comparé à
+CATALOGUE_LATENCE_CIBLE_MS. Compare aussi à une recherche LIKE en base.
+
+Usage :
+    python -m benchmarks.bench_catalog [--prestations 50000]
+"""
+import argparse
+import random
+import statistics
+import tempfile
+import time
+from decimal import Decimal
+from pathlib import Path
+from sqlalchemy import insert, or_
+from config import CATALOGUE_LATENCE_CIBLE_MS
+from database import init_db, session_scope
+from models import Base, Prestation
+from utils.prestation_catalog import catalogue
+
+
+ACTIVITES = [
+    "Séance de coaching", "Cours collectif", "Préparation physique", "Bilan forme", "Programme",
+    "Stretching", "Renforcement musculaire", "Cardio-training", "Pilates", "Yoga", "Boxe éducative",
+    "Marche nordique", "Aquagym", "Remise en forme", "Mobilité", "Récupération", "Nutrition",
+]
+PUBLICS = ["individuel", "duo", "groupe", "entreprise", "senior", "prénatal", "adolescent", "sportif"]
+FORMATS = ["à domicile", "en salle", "en extérieur", "en visio", "au bureau"]
+CATEGORIES = [
+    "coaching individuel", "cours collectif", "préparation physique", "bien-être", "entreprise",
+    "santé", "programmation", "bilan", "abonnement", "événementiel",
+]
+SAISIES = ["s", "se", "sea", "seance coa", "Séance de coaching ind", "pil", "cardio tr", "yoga dom",
+           "domicile", "visio", "ÉVÉNEMENT", "coaching senior ext", "trai", "pilates duo 12", "xyzw"]
+
+
+def populate(engine, nb_prestations: int):
+    """Crée un catalogue de prestations variées (libellés, catégories et descriptions)"""
+    rng = random.Random(7)
+    rows = []
+    for i in range(nb_prestations):
+        activite, public, format_ = rng.choice(ACTIVITES), rng.choice(PUBLICS), rng.choice(FORMATS)
+        rows.append({
+            'libelle': f"{activite} {public} {format_} n°{i}",
+            'description': f"{activite} pour public {public}, {format_}, durée {rng.choice([30, 45, 60, 90])} min",
+            'categorie': rng.choice(CATEGORIES),
+            'prix_unitaire_ht': Decimal(rng.randint(10, 200)),
+            'unite': rng.choice(["séance", "heure", "forfait", "mois"]),
+            'actif': rng.random() > 0.05,
+        })
+    with engine.begin() as connection:
+        connection.execute(insert(Prestation), rows)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de l'autocompletion du catalogue de prestations")
+    parser.add_argument('--prestations', type=int, default=50_000, help="Nombre de prestations au catalogue")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        init_db.init_database(f"sqlite:///{Path(tmp) / 'bench.db'}")
+        populate(init_db.engine, args.prestations)
+        catalogue.invalidate()
+
+        start = time.perf_counter()
+        nb = len(catalogue)
+        print(f"Catalogue : {nb} prestations actives chargees et indexees en {time.perf_counter() - start:.2f} s")
+
+        print(f"\n{'Saisie':<26} {'Frappes':>7} {'p50 (us)':>9} {'max (us)':>9} {'Suggestions':>11}")
+        durations = []
+        for saisie in SAISIES:
+            par_saisie = []
+            for longueur in range(1, len(saisie) + 1):
+                start = time.perf_counter()
+                suggestions = catalogue.complete(saisie[:longueur])
+                par_saisie.append((time.perf_counter() - start) * 1_000_000)
+            durations += par_saisie
+            print(f"{saisie:<26} {len(par_saisie):>7} {statistics.median(par_saisie):>9.0f} "
+                  f"{max(par_saisie):>9.0f} {len(suggestions):>11}")
+
+        p95 = statistics.quantiles(durations, n=20)[-1] / 1000
+        print(f"\nToutes frappes : p50 {statistics.median(durations):.0f} us, p95 {p95 * 1000:.0f} us, "
+              f"max {max(durations):.0f} us")
+
+        # Référence : LIKE en base à chaque frappe
+        with session_scope() as session:
+            start = time.perf_counter()
+            for saisie in SAISIES:
+                motif = f"%{saisie}%"
+                session.query(Prestation.id).filter(
+                    Prestation.actif == True,
+                    or_(Prestation.libelle.ilike(motif), Prestation.categorie.ilike(motif),
+                        Prestation.description.ilike(motif))
+                ).limit(10).all()
+            like_ms = (time.perf_counter() - start) * 1000 / len(SAISIES)
+        print(f"LIKE en base (reference) : {like_ms:.2f} ms par saisie")
+
+        ok = p95 < CATALOGUE_LATENCE_CIBLE_MS
+        print(f"[{'OK' if ok else 'ECHEC'}] p95 {'sous' if ok else 'au-dessus de'} "
+              f"l'objectif de {CATALOGUE_LATENCE_CIBLE_MS} ms par frappe")
+        init_db.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,125 @@
+"""
+Benchmark du profil de l'engine SQLite : réglages par défaut contre DATABASE_PRAGMAS.
+
+Mesure :
+- écritures : petites transactions successives (comme la création d'un client depuis l'interface)
+- lectures concurrentes : pages de clients lues par plusieurs threads pendant qu'un thread écrit
+
+Usage :
+    python -m benchmarks.bench_engine [--writes 500] [--readers 3] [--duree 3]
+"""
+import argparse
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+from sqlalchemy import insert, select
+from database.init_db import create_database_engine
+from models import Base, Client
+
+
+def make_client(i: int) -> dict:
+    """Retourne les données d'un client de test"""
+    return {
+        'type': 'particulier',
+        'nom': f"Nom{i:06d}",
+        'prenom': "Jean",
+        'email': f"client{i}@example.fr",
+        'actif': True
+    }
+
+
+def bench_writes(engine, nb_writes: int) -> float:
+    """Retourne le temps moyen (ms) d'une transaction d'écriture"""
+    start = time.perf_counter()
+    for i in range(nb_writes):
+        with engine.begin() as connection:
+            connection.execute(insert(Client), make_client(i))
+    return (time.perf_counter() - start) * 1000 / nb_writes
+
+
+def bench_concurrent_reads(engine, nb_readers: int, duree: float) -> dict:
+    """Lit des pages de clients depuis plusieurs threads pendant qu'un thread écrit"""
+    stop = threading.Event()
+    latencies = []
+    lock = threading.Lock()
+    writes = [0]
+
+    def writer():
+        i = 1_000_000
+        while not stop.is_set():
+            with engine.begin() as connection:
+                connection.execute(insert(Client), [make_client(i + k) for k in range(20)])
+            i += 20
+            writes[0] += 1
+
+    def reader():
+        query = select(Client.id, Client.nom, Client.email).order_by(Client.nom).limit(100)
+        local = []
+        while not stop.is_set():
+            start = time.perf_counter()
+            with engine.connect() as connection:
+                connection.execute(query).all()
+            local.append((time.perf_counter() - start) * 1000)
+        with lock:
+            latencies.extend(local)
+
+    threads = [threading.Thread(target=writer)] + [threading.Thread(target=reader) for _ in range(nb_readers)]
+    for thread in threads:
+        thread.start()
+    time.sleep(duree)
+    stop.set()
+    for thread in threads:
+        thread.join()
+
+    latencies.sort()
+    return {
+        'lectures_par_s': len(latencies) / duree,
+        'lecture_p50_ms': statistics.median(latencies) if latencies else 0.0,
+        'lecture_p99_ms': latencies[int(len(latencies) * 0.99)] if latencies else 0.0,
+        'ecritures_par_s': writes[0] / duree
+    }
+
+
+def run_profile(name: str, pragmas: dict, args) -> dict:
+    """Exécute les mesures sur une base neuve avec le profil donné"""
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite:///{Path(tmp) / 'bench.db'}"
+        engine = create_database_engine(url, pragmas=pragmas)
+        Base.metadata.create_all(bind=engine)
+
+        # Base pré-remplie pour des lectures réalistes
+        with engine.begin() as connection:
+            connection.execute(insert(Client), [make_client(i) for i in range(10_000, 30_000)])
+
+        results = {'profil': name, 'ecriture_ms': bench_writes(engine, args.writes)}
+        results.update(bench_concurrent_reads(engine, args.readers, args.duree))
+        engine.dispose()
+        return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du profil SQLite")
+    parser.add_argument('--writes', type=int, default=500, help="Nombre de transactions d'écriture")
+    parser.add_argument('--readers', type=int, default=3, help="Nombre de threads lecteurs")
+    parser.add_argument('--duree', type=float, default=3.0, help="Durée du test concurrent (s)")
+    args = parser.parse_args()
+
+    profiles = [
+        ("defaut", {}),
+        ("optimise", None),  # None = DATABASE_PRAGMAS
+    ]
+
+    rows = [run_profile(name, pragmas, args) for name, pragmas in profiles]
+
+    print(f"\n{'Profil':<10} {'Ecriture (ms)':>14} {'Lectures/s':>11} {'p50 (ms)':>9} {'p99 (ms)':>9} {'Ecritures/s':>12}")
+    for row in rows:
+        print(
+            f"{row['profil']:<10} {row['ecriture_ms']:>14.2f} {row['lectures_par_s']:>11.0f} "
+            f"{row['lecture_p50_ms']:>9.2f} {row['lecture_p99_ms']:>9.2f} {row['ecritures_par_s']:>12.0f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
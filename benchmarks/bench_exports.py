@@ -0,0 +1,92 @@
+"""
+Benchmark des exports CSV en flux (utils/exports.py).
+
+Remplit une base de test de paiements, puis exporte le livre des recettes
+sur des périodes de plus en plus longues en mesurant le pic de mémoire
+Python (tracemalloc) : il doit rester stable quand le nombre de lignes augmente.
+Vérifie aussi que le tri chronologique utilise l'index (pas de tri en mémoire).
+
+Usage :
+    python -m benchmarks.bench_exports [--paiements 1000000]
+"""
+import argparse
+import tempfile
+import time
+import tracemalloc
+from datetime import date, timedelta
+from pathlib import Path
+from sqlalchemy import insert
+from sqlalchemy.orm import sessionmaker
+from database.indexes import capture_statements, query_plan
+from database.init_db import create_database_engine
+from models import Base, Client, Facture, Paiement
+from utils.exports import export_livre_recettes
+
+
+DEBUT = date(2015, 1, 1)
+JOURS = 3650
+
+
+def populate(engine, nb_paiements: int):
+    """Crée des clients, une facture par paiement et les paiements, étalés sur dix ans"""
+    with engine.begin() as connection:
+        connection.execute(insert(Client), [
+            {'type': 'particulier', 'nom': f"Nom{i:05d}", 'prenom': "Jean", 'actif': True} for i in range(1000)
+        ])
+
+        for start in range(0, nb_paiements, 50_000):
+            stop = min(start + 50_000, nb_paiements)
+            factures, paiements = [], []
+            for i in range(start, stop):
+                jour = DEBUT + timedelta(days=i * JOURS // nb_paiements)
+                factures.append({
+                    'id': i + 1, 'numero': f"FACT-{jour.year}-{i + 1:07d}", 'client_id': i % 1000 + 1,
+                    'date_emission': jour, 'date_echeance': jour, 'statut': 'payee', 'montant_total_ht': 60
+                })
+                paiements.append({
+                    'facture_id': i + 1, 'date_paiement': jour, 'montant': 60, 'moyen_paiement': 'virement'
+                })
+            connection.execute(insert(Facture), factures)
+            connection.execute(insert(Paiement), paiements)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark des exports CSV en flux")
+    parser.add_argument('--paiements', type=int, default=1_000_000, help="Nombre de paiements en base")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        engine = create_database_engine(f"sqlite:///{tmp / 'bench.db'}")
+        Base.metadata.create_all(bind=engine)
+
+        start = time.perf_counter()
+        populate(engine, args.paiements)
+        print(f"Base de test : {args.paiements} paiements en {time.perf_counter() - start:.1f} s")
+
+        Session = sessionmaker(bind=engine)
+        print(f"\n{'Periode':<10} {'Lignes':>9} {'Duree (s)':>10} {'Lignes/s':>10} {'Pic memoire (Mio)':>18}")
+
+        for annees in (1, 5, 10):
+            fin = DEBUT + timedelta(days=365 * annees - 1)
+            with Session() as session:
+                tracemalloc.start()
+                start = time.perf_counter()
+                with capture_statements(engine) as statements:
+                    nb = export_livre_recettes(session, tmp / f"recettes_{annees}.csv", DEBUT, fin)
+                duree = time.perf_counter() - start
+                _, peak = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+            print(f"{annees:>3} an(s)  {nb:>9} {duree:>10.2f} {nb / duree:>10.0f} {peak / 1024 / 1024:>18.2f}")
+
+        with engine.connect() as connection:
+            plan = query_plan(connection, *statements[0])
+        tri_en_memoire = any("TEMP B-TREE" in step for step in plan)
+        print(f"\nPlan : {' / '.join(plan)}")
+        print("[ECHEC] Tri en memoire" if tri_en_memoire else "[OK] Parcours dans l'ordre de l'index, sans tri")
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
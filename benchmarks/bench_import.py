@@ -0,0 +1,80 @@
+"""
+Benchmark de l'import CSV en masse (controllers/import_controller.py).
+
+Génère un fichier de clients (dont une part de lignes invalides), l'importe
+dans une base de test avec l'index de recherche plein texte actif, et affiche
+le débit. Vérifie que chaque ligne invalide est signalée et que toutes les
+lignes valides sont en base.
+
+Usage :
+    python -m benchmarks.bench_import [--clients 100000] [--invalides 1]
+"""
+import argparse
+import csv
+import tempfile
+import time
+from pathlib import Path
+from sqlalchemy import func, select
+from controllers.import_controller import ImportController
+from database import init_db, session_scope
+from models import Client
+
+
+def write_clients_csv(path: Path, nb_clients: int, pourcent_invalides: int) -> int:
+    """
+    Écrit un fichier de clients (particuliers et entreprises, en-têtes "à la main").
+
+    Returns:
+        int: Nombre de lignes invalides écrites
+    """
+    invalides = 0
+    with open(path, 'w', encoding='utf-8-sig', newline='') as file:
+        writer = csv.writer(file, delimiter=';')
+        writer.writerow(["Type", "Nom", "Prénom", "Raison sociale", "Adresse", "Code postal", "Ville",
+                         "E-mail", "Téléphone", "SIRET"])
+        for i in range(nb_clients):
+            code_postal = f"{75000 + i % 20:05d}"
+            if pourcent_invalides and i % (100 // pourcent_invalides) == 7:
+                code_postal = "750"
+                invalides += 1
+            if i % 4 == 0:
+                writer.writerow(["entreprise", "", "", f"Société {i}", f"{i} rue du Commerce", code_postal, "Paris",
+                                 f"contact{i}@societe.fr", "01 23 45 67 89", "732 829 320 00074"])
+            else:
+                writer.writerow(["", f"Nom{i}", "Jean", "", f"{i} avenue des Sports", code_postal, "Paris",
+                                 f"jean{i}@exemple.fr", "", ""])
+    return invalides
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de l'import CSV en masse")
+    parser.add_argument('--clients', type=int, default=100_000, help="Nombre de lignes du fichier")
+    parser.add_argument('--invalides', type=int, default=1, help="Pourcentage de lignes invalides")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        # Base de l'application (schéma, index de recherche plein texte, triggers)
+        init_db.init_database(f"sqlite:///{tmp / 'bench.db'}")
+
+        path = tmp / "clients.csv"
+        invalides = write_clients_csv(path, args.clients, args.invalides)
+
+        start = time.perf_counter()
+        rapport = ImportController().import_clients(path)
+        duree = time.perf_counter() - start
+        with session_scope() as session:
+            en_base = session.scalar(select(func.count(Client.id)))
+
+        print(f"\n{rapport['lignes']} lignes en {duree:.2f} s ({rapport['lignes'] / duree:.0f} lignes/s)")
+        print(f"Importees : {rapport['importees']} (en base : {en_base}), erreurs : {len(rapport['erreurs'])}")
+        if rapport['erreurs']:
+            print(f"Premiere erreur : ligne {rapport['erreurs'][0][0]} - {rapport['erreurs'][0][1]}")
+
+        ok = len(rapport['erreurs']) == invalides and en_base == rapport['importees'] == args.clients - invalides
+        print("[OK] Toutes les lignes valides importees, lignes invalides signalees" if ok else "[ECHEC] Rapport incoherent")
+        init_db.engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+"""
+Benchmark de la génération PDF (utils/pdf_generator.py).
+
+Compare, pour des factures de test avec logo :
+- sans cache : le modèle statique est recompilé pour chaque document ;
+- avec cache : le modèle est compilé une fois et réutilisé (fonctionnement normal).
+
+Le temps par document (p50, p95) est comparé à PDF_LATENCE_CIBLE_MS.
+
+Usage :
+    python -m benchmarks.bench_pdf [--documents 200] [--lignes 8]
+"""
+import argparse
+import statistics
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+from PIL import Image
+from config import PDF_LATENCE_CIBLE_MS
+from models import Client, Facture, FactureLigne
+from utils.pdf_generator import PDFGenerator, clear_templates
+
+
+def make_facture(i: int, nb_lignes: int) -> Facture:
+    """Retourne une facture de test (non enregistrée) avec client et lignes"""
+    client = Client(
+        type='particulier', nom=f"Nom{i:05d}", prenom="Jean",
+        adresse="12 rue des Lilas", code_postal="75011", ville="Paris", email=f"client{i}@example.fr"
+    )
+    lignes = [
+        FactureLigne(
+            libelle=f"Séance de coaching individuel n°{k + 1}",
+            description="Renforcement musculaire et cardio" if k % 2 else None,
+            quantite=Decimal('1.5') if k % 3 else Decimal(1),
+            prix_unitaire_ht=Decimal('45.00'),
+            montant_total_ligne_ht=Decimal('67.50') if k % 3 else Decimal('45.00'),
+            ordre=k
+        )
+        for k in range(nb_lignes)
+    ]
+    emission = date(2025, 1, 1) + timedelta(days=i % 365)
+    return Facture(
+        numero=f"FACT-2025-{i + 1:03d}", client=client, lignes=lignes,
+        date_emission=emission, date_prestation_debut=emission, date_echeance=emission + timedelta(days=30),
+        statut='emise', montant_total_ht=sum(ligne.montant_total_ligne_ht for ligne in lignes),
+        mode_paiement='virement'
+    )
+
+
+def make_parametres(tmp: Path) -> dict:
+    """Paramètres de l'émetteur avec un logo volontairement grand (redimensionné par le modèle)"""
+    logo_path = tmp / "logo.png"
+    Image.new('RGB', (1600, 800), (31, 78, 121)).save(logo_path)
+    return {
+        'emetteur_nom': "Marie Martin Coaching",
+        'emetteur_adresse': "5 avenue du Stade",
+        'emetteur_code_postal': "69003",
+        'emetteur_ville': "Lyon",
+        'emetteur_siret': "12345678901234",
+        'emetteur_telephone': "06 12 34 56 78",
+        'emetteur_email': "contact@example.fr",
+        'logo_path': str(logo_path),
+        'iban': "FR76 3000 6000 0112 3456 7890 189",
+        'bic': "AGRIFRPP",
+        'pied_de_page': "Merci de votre confiance !",
+    }
+
+
+def bench(generator: PDFGenerator, factures: list, cache: bool) -> list[float]:
+    """Retourne le temps (ms) de génération de chaque document"""
+    durations = []
+    for facture in factures:
+        if not cache:
+            clear_templates()
+        start = time.perf_counter()
+        generator.render(facture)
+        durations.append((time.perf_counter() - start) * 1000)
+    return durations
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la génération PDF")
+    parser.add_argument('--documents', type=int, default=200, help="Nombre de factures générées")
+    parser.add_argument('--lignes', type=int, default=8, help="Lignes par facture")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        generator = PDFGenerator(make_parametres(Path(tmp)))
+        factures = [make_facture(i, args.lignes) for i in range(args.documents)]
+
+        # Échauffement (imports et polices ReportLab)
+        bench(generator, factures[:5], cache=True)
+
+        results = [
+            ("sans cache", bench(generator, factures, cache=False)),
+            ("avec cache", bench(generator, factures, cache=True)),
+        ]
+
+        taille = len(generator.render(factures[0])) / 1024
+
+    print(f"\n{args.documents} factures de {args.lignes} lignes (PDF ~{taille:.0f} Kio)")
+    print(f"{'Mode':<12} {'p50 (ms)':>9} {'p95 (ms)':>9} {'Docs/s':>8}")
+    for name, durations in results:
+        durations.sort()
+        p50 = statistics.median(durations)
+        p95 = durations[int(len(durations) * 0.95)]
+        print(f"{name:<12} {p50:>9.2f} {p95:>9.2f} {1000 / statistics.mean(durations):>8.0f}")
+
+    p95_cache = sorted(results[1][1])[int(len(results[1][1]) * 0.95)]
+    if p95_cache > PDF_LATENCE_CIBLE_MS:
+        print(f"[ECHEC] p95 avec cache au-dessus de l'objectif ({PDF_LATENCE_CIBLE_MS} ms)")
+        sys.exit(1)
+
+    print(f"[OK] p95 avec cache sous l'objectif de {PDF_LATENCE_CIBLE_MS} ms par document")
+
+
+if __name__ == "__main__":
+    main()
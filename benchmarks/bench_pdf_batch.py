@@ -0,0 +1,71 @@
+"""
+Benchmark de la génération PDF par lot (utils/pdf_batch.py).
+
+Génère le même lot de factures avec 1, 2, 4... processus (jusqu'au nombre de
+cœurs) et affiche le débit et l'accélération par rapport à un seul processus.
+Le démarrage du pool est mesuré à part : il n'est payé qu'une fois par session.
+
+Usage :
+    python -m benchmarks.bench_pdf_batch [--factures 400] [--lignes 8]
+"""
+import argparse
+import os
+import tempfile
+import time
+from pathlib import Path
+from sqlalchemy.orm import sessionmaker
+from benchmarks.bench_pdf import make_facture, make_parametres
+from database.init_db import create_database_engine
+from models import Base
+from utils.document_cache import DocumentCache
+from utils.pdf_batch import BatchPDFGenerator, select_factures
+from utils.pdf_generator import PDFGenerator
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la génération PDF par lot")
+    parser.add_argument('--factures', type=int, default=400, help="Nombre de factures du lot")
+    parser.add_argument('--lignes', type=int, default=8, help="Lignes par facture")
+    args = parser.parse_args()
+
+    cores = os.cpu_count() or 1
+    workers_list = sorted({1, 2, 4, cores} & set(range(1, cores + 1)))
+
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        url = f"sqlite:///{tmp / 'bench.db'}"
+        engine = create_database_engine(url)
+        Base.metadata.create_all(bind=engine)
+
+        with sessionmaker(bind=engine)() as session:
+            session.add_all(make_facture(i, args.lignes) for i in range(args.factures))
+            session.commit()
+            facture_ids = select_factures(session)
+        engine.dispose()
+
+        parametres = make_parametres(tmp)
+        rows = []
+
+        for nb_workers in workers_list:
+            start = time.perf_counter()
+            # Cache vide à chaque mesure : toutes les factures sont générées
+            cache = DocumentCache(PDFGenerator(parametres), index_path=tmp / f"index_{nb_workers}.json")
+            with BatchPDFGenerator(parametres, max_workers=nb_workers, database_url=url, cache=cache) as batch:
+                demarrage = time.perf_counter() - start
+
+                start = time.perf_counter()
+                result = batch.generate(facture_ids, directory=tmp / f"pdf_{nb_workers}")
+                duree = time.perf_counter() - start
+
+            assert not result['erreurs'], result['erreurs'][:3]
+            rows.append((nb_workers, demarrage, duree, len(result['fichiers'])))
+
+    print(f"\n{args.factures} factures de {args.lignes} lignes, {cores} coeur(s)")
+    print(f"{'Processus':>9} {'Demarrage (s)':>14} {'Lot (s)':>8} {'Docs/s':>8} {'Acceleration':>13}")
+    base = rows[0][2]
+    for nb_workers, demarrage, duree, nb_fichiers in rows:
+        print(f"{nb_workers:>9} {demarrage:>14.2f} {duree:>8.2f} {nb_fichiers / duree:>8.0f} {base / duree:>12.2f}x")
+
+
+if __name__ == "__main__":
+    main()
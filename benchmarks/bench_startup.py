@@ -0,0 +1,68 @@
+"""
+Benchmark du temps de démarrage de l'application.
+
+Lance plusieurs fois `python main.py --mesure-demarrage` (l'application quitte
+dès le premier affichage de la fenêtre) et affiche la médiane de chaque étape
+mesurée par utils/startup.py, ainsi que la durée totale du processus
+(interpréteur compris). Chaque lancement ajoute aussi sa mesure au fichier
+de suivi STARTUP_TIMES_FILE.
+
+Sans affichage disponible, Qt est lancé avec la plateforme "offscreen".
+
+Usage :
+    python -m benchmarks.bench_startup [--lancements 5]
+"""
+import argparse
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from config import BASE_DIR
+
+
+def launch() -> tuple[dict[str, float], float]:
+    """
+    Lance l'application une fois.
+
+    Returns:
+        tuple: ({étape: durée en ms}, durée totale du processus en ms)
+    """
+    env = dict(os.environ)
+    if sys.platform.startswith('linux') and not env.get('DISPLAY') and not env.get('WAYLAND_DISPLAY'):
+        env['QT_QPA_PLATFORM'] = 'offscreen'
+
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, str(BASE_DIR / "main.py"), "--mesure-demarrage"],
+        cwd=BASE_DIR, env=env, capture_output=True, text=True, timeout=120
+    )
+    processus = (time.perf_counter() - start) * 1000
+
+    line = next((line for line in result.stdout.splitlines() if line.startswith("[INFO] Demarrage :")), None)
+    if line is None:
+        raise RuntimeError(f"Mesure absente de la sortie de main.py:\n{result.stdout}\n{result.stderr}")
+
+    etapes = {etape.strip(): float(duree) for etape, duree in re.findall(r"([^|:]+?) (\d+) ms", line)}
+    return etapes, processus
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark du temps de démarrage")
+    parser.add_argument('--lancements', type=int, default=5, help="Nombre de lancements mesurés")
+    args = parser.parse_args()
+
+    # Un premier lancement non mesuré : création de la base, caches disque et bytecode
+    launch()
+
+    mesures = [launch() for _ in range(args.lancements)]
+
+    print(f"\nMedianes sur {args.lancements} lancement(s)")
+    for etape in mesures[0][0]:
+        print(f"  {etape:<20} {statistics.median(m[0][etape] for m in mesures):>8.0f} ms")
+    print(f"  {'processus complet':<20} {statistics.median(m[1] for m in mesures):>8.0f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""
+Suite de benchmarks des chemins critiques sur des jeux de données synthétiques
+(benchmarks/datasets.py : 1k, 100k ou 1M lignes de factures).
+
+Chemins mesurés pour chaque échelle :
+- clients : première page avec totaux, page suivante (curseur), recherche,
+  statistiques de la page et d'un client (ClientController) ;
+- tableau de bord : indicateurs et suivi du plafond (DashboardController) ;
+- PDF : rendu d'une facture chargée depuis la base ;
+- exports : livre des recettes et factures de l'année.
+
+Chaque mesure est précédée d'un passage à vide ; on retient la médiane et le
+minimum des répétitions. Les résultats sont écrits en JSON et peuvent être
+comparés à une référence : une mesure est en régression si sa médiane dépasse
+celle de la référence de plus de --seuil (en proportion) et de --ecart-min ms.
+Le code de sortie est alors 1 (utilisable en intégration continue).
+
+Usage :
+    python -m benchmarks.bench_suite [--echelles 1k 100k] [--repetitions 5]
+        [--sortie resultats.json] [--reference reference.json] [--seuil 0.20]
+    python -m benchmarks.bench_suite --echelles 1k --sortie reference.json   # nouvelle référence
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import date, datetime
+from pathlib import Path
+from sqlalchemy.orm import joinedload, selectinload
+from config import APP_VERSION, BASE_DIR
+from database import init_database, get_session
+from models import Facture
+from utils.exports import export_livre_recettes, export_factures
+from utils.pdf_generator import PDFGenerator
+from benchmarks.bench_pdf import make_parametres
+from benchmarks.datasets import SCALES, ensure_dataset
+
+
+def measure(func, repetitions: int) -> dict:
+    """
+    Mesure une fonction : un passage à vide puis `repetitions` exécutions.
+
+    Returns:
+        dict: médiane et minimum en millisecondes
+    """
+    func()
+    durations = []
+    for _ in range(repetitions):
+        start = time.perf_counter()
+        func()
+        durations.append((time.perf_counter() - start) * 1000)
+    return {'median_ms': round(statistics.median(durations), 3), 'min_ms': round(min(durations), 3)}
+
+
+def scenarios(tmp: Path) -> dict:
+    """
+    Retourne les chemins mesurés (nom -> fonction sans argument) pour la base ouverte.
+    Les contrôleurs sont créés une fois, comme dans l'application.
+    """
+    from controllers.client_controller import ClientController
+    from controllers.dashboard_controller import DashboardController
+
+    clients = ClientController()
+    dashboard = DashboardController()
+    session = get_session()
+
+    premiere_page = clients.get_clients_page()
+    page_ids = [client.id for client in premiere_page['clients']]
+    annee = session.query(Facture.date_emission).order_by(Facture.date_emission.desc()).limit(1).scalar().year
+
+    # Facture la plus longue de l'échantillon, chargée comme pour l'aperçu
+    facture = (
+        session.query(Facture)
+        .options(joinedload(Facture.client), selectinload(Facture.lignes))
+        .filter(Facture.id <= 1000)
+        .order_by(Facture.montant_total_ht.desc())
+        .first()
+    )
+    generator = PDFGenerator(make_parametres(tmp))
+
+    return {
+        'clients.page_1': lambda: clients.get_clients_page(),
+        'clients.page_suivante': lambda: clients.get_clients_page(cursor=premiere_page['cursor'], with_total=False),
+        'clients.recherche': lambda: clients.get_clients_page(query="mar"),
+        'clients.statistiques_page': lambda: clients.get_clients_statistics(page_ids),
+        'clients.statistiques_client': lambda: clients.get_client_statistics(page_ids[0]),
+        'dashboard.indicateurs': lambda: dashboard.get_dashboard(),
+        'dashboard.suivi_plafond': lambda: dashboard.get_suivi_plafond(),
+        'pdf.facture': lambda: generator.render(facture),
+        'exports.livre_recettes': lambda: export_livre_recettes(
+            session, tmp / "recettes.csv", date(annee, 1, 1), date(annee, 12, 31)),
+        'exports.factures': lambda: export_factures(
+            session, tmp / "factures.csv", date(annee, 1, 1), date(annee, 12, 31)),
+    }
+
+
+def run_scale(scale: str, repetitions: int) -> dict:
+    """Génère (ou réutilise) la base d'une échelle et mesure tous les chemins"""
+    path = ensure_dataset(scale)
+    if not init_database(f"sqlite:///{path}"):
+        raise RuntimeError(f"Impossible d'ouvrir la base {path}")
+
+    results = {}
+    with tempfile.TemporaryDirectory() as tmp:
+        for name, func in scenarios(Path(tmp)).items():
+            results[name] = measure(func, repetitions)
+            print(f"  {name:<30} {results[name]['median_ms']:>10.2f} {results[name]['min_ms']:>10.2f}")
+    return results
+
+
+def environment() -> dict:
+    """Décrit l'environnement de mesure (pour interpréter une comparaison)"""
+    try:
+        commit = subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], cwd=BASE_DIR, capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+
+    return {
+        'date': datetime.now().isoformat(timespec='seconds'),
+        'version': APP_VERSION,
+        'commit': commit,
+        'python': platform.python_version(),
+        'plateforme': platform.platform(),
+        'processeurs': os.cpu_count(),
+    }
+
+
+def compare(results: dict, reference: dict, seuil: float, ecart_min: float) -> list[str]:
+    """
+    Compare les médianes aux résultats de référence (mêmes échelles et mesures).
+
+    Args:
+        results: Résultats de la suite {échelle: {mesure: {...}}}
+        reference: Résultats de référence (même format)
+        seuil: Hausse relative tolérée (0.20 = +20 %)
+        ecart_min: Hausse absolue (ms) en dessous de laquelle on ne signale rien
+
+    Returns:
+        list[str]: Mesures en régression ("échelle/mesure")
+    """
+    regressions = []
+    print(f"\n{'Mesure':<36} {'Reference':>10} {'Actuel':>10} {'Ratio':>7}")
+
+    for scale, mesures in results.items():
+        for name, mesure in mesures.items():
+            avant = reference.get(scale, {}).get(name)
+            if avant is None:
+                continue
+
+            ratio = mesure['median_ms'] / avant['median_ms'] if avant['median_ms'] else 1.0
+            regression = (ratio > 1 + seuil and mesure['median_ms'] - avant['median_ms'] > ecart_min)
+            if regression:
+                regressions.append(f"{scale}/{name}")
+
+            print(f"{scale + '/' + name:<36} {avant['median_ms']:>10.2f} {mesure['median_ms']:>10.2f} "
+                  f"{ratio:>6.2f}x{'  [REGRESSION]' if regression else ''}")
+
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Suite de benchmarks sur des jeux de donnees synthetiques")
+    parser.add_argument('--echelles', nargs='+', choices=list(SCALES), default=['1k', '100k'],
+                        help="Echelles mesurees (lignes de factures)")
+    parser.add_argument('--repetitions', type=int, default=5, help="Repetitions par mesure")
+    parser.add_argument('--sortie', type=Path, help="Fichier JSON des resultats")
+    parser.add_argument('--reference', type=Path, help="Resultats de reference (JSON) a comparer")
+    parser.add_argument('--seuil', type=float, default=0.20, help="Hausse relative toleree (0.20 = +20 %%)")
+    parser.add_argument('--ecart-min', type=float, default=2.0,
+                        help="Hausse absolue (ms) en dessous de laquelle on ne signale pas de regression")
+    args = parser.parse_args()
+
+    results = {}
+    for scale in args.echelles:
+        print(f"\nEchelle {scale} ({SCALES[scale]} lignes de factures)")
+        print(f"  {'Mesure':<30} {'Mediane ms':>10} {'Min ms':>10}")
+        results[scale] = run_scale(scale, args.repetitions)
+
+    if args.sortie:
+        args.sortie.write_text(json.dumps(
+            {'environnement': environment(), 'resultats': results}, indent=2, ensure_ascii=False
+        ), encoding='utf-8')
+        print(f"\n[OK] Resultats enregistres : {args.sortie}")
+
+    if args.reference:
+        reference = json.loads(args.reference.read_text(encoding='utf-8'))
+        regressions = compare(results, reference['resultats'], args.seuil, args.ecart_min)
+        if regressions:
+            print(f"\n[ECHEC] {len(regressions)} regression(s) au-dela de +{args.seuil:.0%} : {', '.join(regressions)}")
+            sys.exit(1)
+        print(f"\n[OK] Aucune regression au-dela de +{args.seuil:.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""
+Benchmark de la validation par colonnes (utils/validators.py).
+
+Valide le même jeu de clients ligne par ligne (validate_client_data) et par
+colonnes (validate_clients_batch), compare les durées et vérifie que les deux
+interfaces relèvent exactement les mêmes erreurs. Mesure aussi les contrôles
+de colonne seuls (email, SIRET avec clé de Luhn) face aux validateurs unitaires.
+
+Usage :
+    python -m benchmarks.bench_validators [--lignes 1000000]
+"""
+import argparse
+import random
+import time
+from utils.validators import (
+    validate_client_data, validate_clients_batch, validate_email, validate_siret,
+    check_email, check_siret
+)
+
+
+def make_clients(nb_lignes: int) -> list[dict]:
+    """Clients aléatoires, environ 5 % invalides (code postal, email, SIRET, téléphone)"""
+    random.seed(42)
+    sirets = ["732 829 320 00074", "12345678901237", "356-000-000-00048", "45678901234567"]
+    clients = []
+    for i in range(nb_lignes):
+        client = {
+            'adresse': f"{i} rue des Sports", 'code_postal': "75011", 'ville': "Paris",
+            'email': f"client{i}@exemple.fr", 'telephone': "06 12 34 56 78" if i % 3 else "",
+        }
+        if i % 4 == 0:
+            client.update(type='entreprise', raison_sociale=f"Société {i}", siret=random.choice(sirets))
+        else:
+            client.update(type='particulier', nom=f"Nom{i}", prenom="Jean")
+
+        defaut = random.randrange(80)
+        if defaut == 0:
+            client['code_postal'] = "750"
+        elif defaut == 1:
+            client['email'] = "client.exemple.fr"
+        elif defaut == 2:
+            client['siret'] = "73282932000075"
+        elif defaut == 3:
+            client['telephone'] = "6123"
+        clients.append(client)
+    return clients
+
+
+def timed(function, *args):
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de la validation par colonnes")
+    parser.add_argument('--lignes', type=int, default=1_000_000, help="Nombre de clients validés")
+    args = parser.parse_args()
+
+    clients = make_clients(args.lignes)
+
+    scalaire, duree_scalaire = timed(lambda: {
+        i: msg for i, client in enumerate(clients) for valid, msg in [validate_client_data(client)] if not valid
+    })
+    colonnes, duree_colonnes = timed(validate_clients_batch, clients)
+    identiques = scalaire == {i: msg for i, (_, msg) in colonnes.items()}
+
+    emails = [client['email'] for client in clients]
+    sirets = [client['siret'] for client in clients if client['type'] == 'entreprise']
+
+    _, email_scalaire = timed(lambda: [validate_email(email) for email in emails])
+    _, email_colonne = timed(check_email, emails)
+    _, siret_scalaire = timed(lambda: [validate_siret(siret)[0] for siret in sirets])
+    _, siret_colonne = timed(check_siret, sirets)
+
+    print(f"\n{args.lignes} clients, {len(scalaire)} invalide(s)")
+    print(f"{'Validation':<22} {'Unitaire (s)':>13} {'Colonnes (s)':>13} {'Acceleration':>13}")
+    for nom, avant, apres in (
+        ("Fiche client complete", duree_scalaire, duree_colonnes),
+        (f"Email ({len(emails)})", email_scalaire, email_colonne),
+        (f"SIRET + Luhn ({len(sirets)})", siret_scalaire, siret_colonne),
+    ):
+        print(f"{nom:<22} {avant:>13.2f} {apres:>13.2f} {avant / apres:>12.2f}x")
+
+    print("[OK] Memes erreurs par ligne et par colonnes" if identiques else "[ECHEC] Resultats differents")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,238 @@
+"""
+Jeux de données synthétiques pour les benchmarks, à plusieurs échelles.
+
+L'échelle est exprimée en lignes de factures ; les autres volumes en découlent
+(environ 4 lignes par facture, 20 factures par client, un catalogue de
+40 prestations). Les données sont réalistes pour les chemins mesurés :
+noms et villes français (recherche plein texte), factures étalées sur trois
+ans avec des statuts variés, paiements des factures réglées, quelques avoirs.
+
+La génération est déterministe (graine fixe) et passe par des insertions en
+masse (executemany) ; l'index plein texte et les tables de synthèse sont
+ensuite construits en une fois par init_database. Chaque base générée est
+conservée dans DATASETS_DIR et réutilisée tant que le schéma ne change pas.
+
+Usage :
+    path = ensure_dataset('100k')
+    init_database(f"sqlite:///{path}")
+"""
+import random
+import tempfile
+import time
+from datetime import date, timedelta
+from decimal import Decimal
+from pathlib import Path
+from sqlalchemy import insert
+from database.init_db import create_database_engine
+from database.schema import schema_fingerprint
+from models import Base, Client, Prestation, Facture, FactureLigne, Paiement, Avoir
+
+
+# Échelles disponibles : nom -> nombre de lignes de factures
+SCALES = {
+    '1k': 1_000,
+    '100k': 100_000,
+    '1M': 1_000_000,
+}
+
+# Version du générateur : à incrémenter quand les données produites changent
+DATASET_VERSION = 1
+
+DATASETS_DIR = Path(tempfile.gettempdir()) / "facturation_benchmarks"
+
+INSERT_CHUNK_SIZE = 50_000
+
+NOMS = [
+    "Martin", "Bernard", "Dubois", "Thomas", "Robert", "Richard", "Petit", "Durand", "Leroy", "Moreau",
+    "Simon", "Laurent", "Lefèvre", "Michel", "Garcia", "David", "Bertrand", "Roux", "Vincent", "Fournier",
+    "Morel", "Girard", "André", "Lefebvre", "Mercier", "Dupont", "Lambert", "Bonnet", "François", "Martinez",
+    "Legrand", "Garnier", "Faure", "Rousseau", "Blanc", "Guérin", "Muller", "Henry", "Roussel", "Nicolas",
+]
+PRENOMS = [
+    "Marie", "Jean", "Pierre", "Sophie", "Luc", "Camille", "Hélène", "Nicolas", "Julie", "Thomas",
+    "Léa", "Hugo", "Chloé", "Louis", "Emma", "Gabriel", "Inès", "Raphaël", "Manon", "Arthur",
+]
+VILLES = [
+    ("75011", "Paris"), ("69003", "Lyon"), ("13006", "Marseille"), ("31000", "Toulouse"), ("33000", "Bordeaux"),
+    ("44000", "Nantes"), ("59000", "Lille"), ("67000", "Strasbourg"), ("34000", "Montpellier"), ("35000", "Rennes"),
+]
+SOCIETES = ["Fitness", "Sport Santé", "Bien-être", "Performance", "Vitalité", "Énergie", "Club", "Studio"]
+PRESTATIONS = [
+    ("Séance de coaching individuel", "séance", "coaching individuel", Decimal('50.00')),
+    ("Séance de coaching duo", "séance", "coaching individuel", Decimal('70.00')),
+    ("Cours collectif", "séance", "cours collectif", Decimal('15.00')),
+    ("Programme personnalisé", "forfait", "programmation", Decimal('120.00')),
+    ("Bilan forme", "forfait", "bilan", Decimal('60.00')),
+    ("Coaching en entreprise", "heure", "entreprise", Decimal('90.00')),
+    ("Abonnement mensuel", "mois", "abonnement", Decimal('180.00')),
+    ("Séance de préparation physique", "séance", "préparation physique", Decimal('55.00')),
+]
+
+# Répartition des statuts de factures (cumulée dans generate_dataset)
+STATUTS = [
+    ('payee', 70), ('emise', 10), ('partiellement_payee', 5),
+    ('en_retard', 5), ('brouillon', 5), ('annulee', 5),
+]
+MOYENS_PAIEMENT = ['virement', 'cb', 'cheque', 'especes']
+
+
+def dataset_path(scale: str) -> Path:
+    """Chemin de la base générée pour une échelle (dépend du schéma et du générateur)"""
+    return DATASETS_DIR / f"bench_{scale}_v{DATASET_VERSION}_{schema_fingerprint():08x}.db"
+
+
+def ensure_dataset(scale: str) -> Path:
+    """
+    Retourne la base d'une échelle, générée si elle n'existe pas encore.
+
+    Args:
+        scale: Échelle (clé de SCALES)
+
+    Returns:
+        Path: Chemin de la base SQLite
+    """
+    path = dataset_path(scale)
+    if path.exists():
+        return path
+
+    DATASETS_DIR.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix('.tmp')
+    tmp_path.unlink(missing_ok=True)
+
+    start = time.perf_counter()
+    counts = generate_dataset(f"sqlite:///{tmp_path}", SCALES[scale])
+    tmp_path.replace(path)
+
+    print(f"[OK] Jeu de donnees {scale} genere en {time.perf_counter() - start:.1f} s : "
+          + ", ".join(f"{count} {name}" for name, count in counts.items()))
+    return path
+
+
+def generate_dataset(url: str, nb_lignes: int, seed: int = 42) -> dict:
+    """
+    Génère un jeu de données dans une base vide.
+
+    Args:
+        url: URL de la base SQLite
+        nb_lignes: Nombre de lignes de factures
+        seed: Graine du générateur aléatoire
+
+    Returns:
+        dict: Nombre de lignes insérées par table
+    """
+    rng = random.Random(seed)
+    engine = create_database_engine(url)
+    Base.metadata.create_all(bind=engine)
+
+    nb_factures = max(1, nb_lignes // 4)
+    nb_clients = max(20, nb_factures // 20)
+    fin = date.today()
+    debut = date(fin.year - 2, 1, 1)
+    jours = (fin - debut).days
+
+    poids_statuts = [poids for _, poids in STATUTS]
+    statuts = [statut for statut, _ in STATUTS]
+
+    counts = {}
+    with engine.begin() as connection:
+        connection.execute(insert(Prestation), [
+            {'id': i + 1, 'libelle': f"{libelle} {niveau}".strip(), 'unite': unite, 'categorie': categorie,
+             'prix_unitaire_ht': prix + 5 * k, 'description': f"{libelle} ({categorie})", 'actif': True}
+            for i, (k, (libelle, unite, categorie, prix), niveau) in enumerate(
+                (k, prestation, niveau)
+                for k, niveau in enumerate(["", "débutant", "intermédiaire", "avancé", "intensif"])
+                for prestation in PRESTATIONS
+            )
+        ])
+        prestations = connection.execute(Prestation.__table__.select()).all()
+        counts['prestations'] = len(prestations)
+
+        clients = []
+        for i in range(nb_clients):
+            code_postal, ville = rng.choice(VILLES)
+            nom, prenom = rng.choice(NOMS), rng.choice(PRENOMS)
+            entreprise = i % 10 == 0
+            clients.append({
+                'id': i + 1,
+                'type': 'entreprise' if entreprise else 'particulier',
+                'nom': None if entreprise else f"{nom}{'' if i < len(NOMS) else i // len(NOMS)}",
+                'prenom': None if entreprise else prenom,
+                'raison_sociale': f"{rng.choice(SOCIETES)} {nom} {i}" if entreprise else None,
+                'adresse': f"{rng.randint(1, 120)} rue de la République",
+                'code_postal': code_postal, 'ville': ville,
+                'email': f"{prenom.lower()}.{nom.lower()}{i}@exemple.fr",
+                'telephone': f"06{rng.randint(0, 99_999_999):08d}",
+                'siret': "73282932000074" if entreprise else None,
+                'actif': rng.random() > 0.1,
+            })
+        _insert_chunks(connection, Client, clients)
+        counts['clients'] = nb_clients
+
+        factures, lignes, paiements, avoirs = [], [], [], []
+        numeros = {}
+        ligne_id = 0
+        for facture_id in range(1, nb_factures + 1):
+            emission = debut + timedelta(days=jours * facture_id // nb_factures)
+            statut = rng.choices(statuts, poids_statuts)[0]
+            numeros[emission.year] = numeros.get(emission.year, 0) + 1
+
+            total = Decimal(0)
+            nb = rng.randint(1, 7) if facture_id < nb_factures else max(1, nb_lignes - ligne_id)
+            for ordre in range(nb):
+                if ligne_id >= nb_lignes:
+                    break
+                prestation = rng.choice(prestations)
+                quantite = Decimal(rng.choice([1, 1, 1, 2, 4, 10]))
+                montant = prestation.prix_unitaire_ht * quantite
+                total += montant
+                ligne_id += 1
+                lignes.append({
+                    'id': ligne_id, 'facture_id': facture_id, 'prestation_id': prestation.id,
+                    'libelle': prestation.libelle, 'quantite': quantite,
+                    'prix_unitaire_ht': prestation.prix_unitaire_ht, 'montant_total_ligne_ht': montant, 'ordre': ordre,
+                })
+
+            factures.append({
+                'id': facture_id, 'numero': f"FACT-{emission.year}-{numeros[emission.year]:05d}",
+                'client_id': rng.randint(1, nb_clients), 'date_emission': emission,
+                'date_prestation_debut': emission, 'date_echeance': emission + timedelta(days=30),
+                'statut': statut, 'montant_total_ht': total, 'mode_paiement': rng.choice(MOYENS_PAIEMENT),
+            })
+
+            if statut in ('payee', 'partiellement_payee'):
+                paiements.append({
+                    'facture_id': facture_id, 'date_paiement': min(fin, emission + timedelta(days=rng.randint(0, 30))),
+                    'montant': total if statut == 'payee' else (total / 2).quantize(Decimal('0.01')),
+                    'moyen_paiement': rng.choice(MOYENS_PAIEMENT),
+                })
+                if statut == 'payee' and rng.random() < 0.01:
+                    avoirs.append({
+                        'numero': f"AV-{emission.year}-{len(avoirs) + 1:05d}", 'facture_id': facture_id,
+                        'date_emission': emission + timedelta(days=15), 'montant_total': total,
+                        'motif': "Annulation de la prestation",
+                    })
+
+            if len(lignes) >= INSERT_CHUNK_SIZE:
+                _flush(connection, factures, lignes, paiements, counts)
+
+        _flush(connection, factures, lignes, paiements, counts)
+        _insert_chunks(connection, Avoir, avoirs)
+        counts['avoirs'] = len(avoirs)
+
+    engine.dispose()
+    return counts
+
+
+def _insert_chunks(connection, model, rows: list[dict]):
+    """Insère des lignes par paquets (une requête executemany par paquet)"""
+    for start in range(0, len(rows), INSERT_CHUNK_SIZE):
+        connection.execute(insert(model).execution_options(render_nulls=True), rows[start:start + INSERT_CHUNK_SIZE])
+
+
+def _flush(connection, factures: list, lignes: list, paiements: list, counts: dict):
+    """Insère les factures, lignes et paiements accumulés puis vide les listes"""
+    for model, rows, name in ((Facture, factures, 'factures'), (FactureLigne, lignes, 'lignes'),
+                              (Paiement, paiements, 'paiements')):
+        _insert_chunks(connection, model, rows)
+        counts[name] = counts.get(name, 0) + len(rows)
+        rows.clear()
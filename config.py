@@ -10,15 +10,60 @@ DATABASE_DIR = BASE_DIR / "database"
 DOCUMENTS_DIR = BASE_DIR / "documents"
 RESOURCES_DIR = BASE_DIR / "resources"
 TEMPLATES_DIR = BASE_DIR / "templates"
+BACKUP_DIR = BASE_DIR / "backups"
 
 # Base de données
 DATABASE_PATH = DATABASE_DIR / "facturation.db"
 DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
 
+# Profil de l'engine SQLite : PRAGMA appliqués à chaque nouvelle connexion
+DATABASE_PRAGMAS = {
+    'journal_mode': 'WAL',      # Lectures (threads de recherche) non bloquées par les écritures
+    'synchronous': 'NORMAL',    # Sûr en WAL, évite un fsync par transaction
+    'cache_size': -64000,       # Cache de pages : 64 Mo (valeur négative = Kio)
+    'mmap_size': 268435456,     # Lecture par mmap jusqu'à 256 Mo
+    'temp_store': 'MEMORY',     # Tris et tables temporaires en mémoire
+    'foreign_keys': 'ON',       # Intégrité référentielle
+    'busy_timeout': 5000,       # Attente (ms) si un autre thread écrit
+}
+
+# Pool de connexions (une connexion par thread actif : interface + workers)
+DATABASE_POOL_SIZE = 5
+DATABASE_MAX_OVERFLOW = 5
+DATABASE_POOL_TIMEOUT = 30  # secondes
+
 # Répertoires de sauvegarde des PDF
 FACTURES_DIR = DOCUMENTS_DIR / "factures"
 DEVIS_DIR = DOCUMENTS_DIR / "devis"
 AVOIRS_DIR = DOCUMENTS_DIR / "avoirs"
+EXPORTS_DIR = DOCUMENTS_DIR / "exports"
+
+# Sauvegardes (base + documents, voir utils/backup.py)
+BACKUP_KEEP_DAILY = 7               # Sauvegardes quotidiennes conservées
+BACKUP_KEEP_WEEKLY = 4              # Sauvegardes hebdomadaires conservées
+BACKUP_RESTORE_WORKERS = 4          # Fichiers restaurés en parallèle
+
+# Exports comptables (CSV)
+EXPORT_BATCH_SIZE = 1000            # Lignes lues et écrites par lot (mémoire constante)
+EXPORT_CSV_DELIMITER = ';'          # Séparateur attendu par les tableurs en français
+
+# Imports CSV (clients, catalogue de prestations)
+IMPORT_BATCH_SIZE = 2000            # Lignes validées et insérées par transaction
+
+# Catalogue des prestations (autocomplétion des lignes, voir utils/prestation_catalog.py)
+CATALOGUE_SUGGESTIONS_MAX = 10      # Suggestions proposées pendant la saisie
+CATALOGUE_LATENCE_CIBLE_MS = 1      # Objectif de temps de réponse par frappe
+
+# Génération des PDF
+PDF_MARGE_MM = 20                   # Marges de la page A4
+PDF_LOGO_MAX_HAUTEUR_PX = 150       # Logo redimensionné une fois, à la compilation du modèle
+PDF_LATENCE_CIBLE_MS = 50           # Objectif de temps de génération par document (modèle en cache)
+PDF_BATCH_WORKERS = None            # Processus de génération par lot (None = nombre de cœurs)
+PDF_BATCH_CHUNK_SIZE = 8            # Factures envoyées à un processus par tâche
+
+# Cache des documents générés (empreinte du contenu -> PDF)
+DOCUMENT_CACHE_INDEX = DOCUMENTS_DIR / ".cache_documents.json"
+DOCUMENT_CACHE_PREVIEW_MAX_MO = 32  # Taille maximale des prévisualisations gardées en mémoire
 
 # Paramètres de numérotation par défaut
 FACTURE_PREFIX = "FACT"
@@ -39,8 +84,12 @@ APP_VERSION = "1.0.0"
 WINDOW_MIN_WIDTH = 1280
 WINDOW_MIN_HEIGHT = 720
 
+# Pagination des listes (nombre de lignes chargées par page)
+CLIENTS_PAGE_SIZE = 100
+
 # Plafond auto-entrepreneur (prestations de services)
 PLAFOND_AUTO_ENTREPRENEUR = 77700  # euros pour 2025
+PLAFOND_SEUILS_ALERTE = (50, 80, 90, 100)  # pourcentages du plafond déclenchant une alerte
 
 # Délai de validité devis par défaut
 DEVIS_VALIDITE_DEFAUT = 90  # jours (3 mois)
@@ -48,6 +97,16 @@ DEVIS_VALIDITE_DEFAUT = 90  # jours (3 mois)
 # Logging
 LOG_FILE = BASE_DIR / "logs" / "facturation.log"
 LOG_LEVEL = "INFO"
+STARTUP_TIMES_FILE = BASE_DIR / "logs" / "demarrage.csv"  # Durées de démarrage (une ligne par lancement)
+
+# Instrumentation des requêtes SQL (voir database/instrumentation.py)
+SQL_INSTRUMENTATION = os.environ.get("FACTURATION_SQL_STATS") == "1"  # Activée par FACTURATION_SQL_STATS=1
+SQL_SLOW_QUERY_MS = 100             # Requêtes signalées comme lentes à partir de cette durée
+SQL_N_PLUS_ONE_SEUIL = 10           # Exécutions d'une même requête dans une action signalées comme N+1
+SQL_SLOW_LOG_FILE = BASE_DIR / "logs" / "requetes_lentes.log"
+
+# Démarrage
+STARTUP_SPLASH = True  # Écran d'accueil affiché pendant l'ouverture de la base
 
 # Créer les répertoires s'ils n'existent pas
 def init_directories():
@@ -58,8 +117,10 @@ def init_directories():
         FACTURES_DIR,
         DEVIS_DIR,
         AVOIRS_DIR,
+        EXPORTS_DIR,
         RESOURCES_DIR,
         TEMPLATES_DIR,
+        BACKUP_DIR,
         BASE_DIR / "logs"
     ]
 
@@ -2,21 +2,71 @@
 Controller pour la gestion des clients
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import or_, func
-from database import get_session
+from sqlalchemy import or_, and_, func, case, select
+from config import CLIENTS_PAGE_SIZE
+from database import session_scope
+from database import search_index
+from database.search_index import build_fts_query, client_search_subquery
 from models import Client, Facture, Devis
-from utils.validators import (
-    validate_email, validate_siret, validate_code_postal,
-    validate_telephone, validate_required_field
-)
+from utils.validators import validate_client_data
 
 
-class ClientController:
-    """Contrôleur pour gérer les opérations CRUD sur les clients"""
+# Nombre maximal d'IDs par requête de statistiques groupées
+STATISTICS_CHUNK_SIZE = 500
+
+
+def _after_cursor(sort_key: list, cursor: tuple):
+    """
+    Condition "ligne strictement après le curseur" pour une clé de tri composite.
+
+    Écrite sous la forme a >= x AND (a > x OR (a = x AND ...)) plutôt qu'en
+    comparaison de tuples : SQLite peut ainsi se positionner directement dans
+    l'index (SEARCH) au lieu de le parcourir depuis le début.
+    """
+    return and_(sort_key[0] >= cursor[0], _strictly_after(sort_key, cursor))
+
+
+def _strictly_after(sort_key: list, cursor: tuple):
+    """Condition lexicographique (a, b, ...) > (x, y, ...)"""
+    first, value = sort_key[0], cursor[0]
+    if len(sort_key) == 1:
+        return first > value
+    return or_(first > value, and_(first == value, _strictly_after(sort_key[1:], cursor[1:])))
+
+
+def client_values(data: dict) -> dict:
+    """
+    Valeurs des colonnes d'un client, nettoyées à partir des données saisies ou importées
+    (données supposées validées, voir validate_client_data).
 
-    def __init__(self):
-        """Initialise le contrôleur"""
-        self.session: Session = get_session()
+    Args:
+        data: Dictionnaire des champs du client
+
+    Returns:
+        dict: Colonnes de la table clients (hors actif)
+    """
+    telephone = data.get('telephone', '')
+    return {
+        'type': data.get('type', 'particulier'),
+        'nom': data.get('nom', '').strip(),
+        'prenom': data.get('prenom', '').strip(),
+        'raison_sociale': data.get('raison_sociale', '').strip(),
+        'adresse': data.get('adresse', '').strip(),
+        'code_postal': data.get('code_postal', '').strip(),
+        'ville': data.get('ville', '').strip(),
+        'email': data.get('email', '').strip(),
+        'telephone': telephone.strip() if telephone else None,
+        'siret': data.get('siret', '').replace(' ', '').replace('-', '') if data.get('siret') else None,
+        'notes': data.get('notes', '').strip(),
+    }
+
+
+class ClientController:
+    """
+    Contrôleur pour gérer les opérations CRUD sur les clients.
+    Chaque opération travaille dans sa propre session (session_scope) :
+    le contrôleur ne garde aucun état et peut être partagé entre les vues.
+    """
 
     def get_all_clients(self, actif_only: bool = False) -> list[Client]:
         """
@@ -28,17 +78,18 @@ class ClientController:
         Returns:
             list[Client]: Liste des clients
         """
-        try:
-            query = self.session.query(Client)
+        with session_scope() as session:
+            try:
+                query = session.query(Client)
 
-            if actif_only:
-                query = query.filter(Client.actif == True)
+                if actif_only:
+                    query = query.filter(Client.actif == True)
 
-            return query.order_by(Client.nom, Client.prenom).all()
+                return query.order_by(Client.nom, Client.prenom).all()
 
-        except Exception as e:
-            print(f"[ERREUR] get_all_clients: {e}")
-            return []
+            except Exception as e:
+                print(f"[ERREUR] get_all_clients: {e}")
+                return []
 
     def get_client_by_id(self, client_id: int) -> Client | None:
         """
@@ -50,12 +101,13 @@ class ClientController:
         Returns:
             Client | None: Le client trouvé ou None
         """
-        try:
-            return self.session.query(Client).filter(Client.id == client_id).first()
+        with session_scope() as session:
+            try:
+                return session.query(Client).filter(Client.id == client_id).first()
 
-        except Exception as e:
-            print(f"[ERREUR] get_client_by_id: {e}")
-            return None
+            except Exception as e:
+                print(f"[ERREUR] get_client_by_id: {e}")
+                return None
 
     def search_clients(
         self,
@@ -65,6 +117,8 @@ class ClientController:
     ) -> list[Client]:
         """
         Recherche des clients par nom, email ou SIRET.
+        Utilise l'index plein texte (préfixes, sans accents, résultats classés
+        par pertinence) et se replace sur un LIKE si FTS5 est indisponible.
 
         Args:
             query: Texte de recherche
@@ -74,33 +128,139 @@ class ClientController:
         Returns:
             list[Client]: Liste des clients correspondants
         """
-        try:
-            db_query = self.session.query(Client)
-
-            # Recherche textuelle
-            if query:
-                search_filter = or_(
-                    Client.nom.ilike(f"%{query}%"),
-                    Client.prenom.ilike(f"%{query}%"),
-                    Client.raison_sociale.ilike(f"%{query}%"),
-                    Client.email.ilike(f"%{query}%"),
-                    Client.siret.ilike(f"%{query}%")
+        with session_scope() as session:
+            try:
+                db_query, rank = self._filtered_clients_query(
+                    session.query(Client), query, type_client, actif
                 )
-                db_query = db_query.filter(search_filter)
 
-            # Filtre par type
-            if type_client:
-                db_query = db_query.filter(Client.type == type_client)
+                order_by = [Client.nom, Client.prenom]
+                if rank is not None:
+                    order_by = [rank] + order_by
 
-            # Filtre par statut actif
-            if actif is not None:
-                db_query = db_query.filter(Client.actif == actif)
+                return db_query.order_by(*order_by).all()
 
-            return db_query.order_by(Client.nom, Client.prenom).all()
+            except Exception as e:
+                print(f"[ERREUR] search_clients: {e}")
+                return []
 
-        except Exception as e:
-            print(f"[ERREUR] search_clients: {e}")
-            return []
+    def get_clients_page(
+        self,
+        query: str = "",
+        type_client: str | None = None,
+        actif: bool | None = None,
+        cursor: tuple | None = None,
+        page_size: int = CLIENTS_PAGE_SIZE,
+        with_total: bool = True
+    ) -> dict:
+        """
+        Retourne une page de clients par pagination par clé (keyset).
+
+        La page suivante est obtenue en repassant le curseur retourné : la requête
+        reprend directement après la dernière ligne (pas d'OFFSET), le coût est
+        donc le même quelle que soit la profondeur de la page.
+        Tri : nom/raison sociale, prénom, id ; ou pertinence, id pour une recherche.
+
+        Args:
+            query: Texte de recherche (vide pour lister tous les clients)
+            type_client: Filtre par type ('particulier', 'entreprise', ou None)
+            actif: Filtre par statut actif (True, False, ou None)
+            cursor: Curseur retourné par la page précédente (None pour la première)
+            page_size: Nombre de clients par page
+            with_total: Si True, calcule aussi le total (utile pour la première page)
+
+        Returns:
+            dict: clients (list[Client]), cursor (tuple | None s'il n'y a plus de page),
+                  total et actifs (int | None si with_total est False)
+        """
+        with session_scope() as session:
+            try:
+                db_query, rank = self._filtered_clients_query(
+                    session.query(Client), query, type_client, actif
+                )
+
+                if rank is not None:
+                    db_query = db_query.add_columns(rank)
+                    sort_key = [rank, Client.id]
+                else:
+                    sort_key = [Client.nom_tri, Client.prenom_tri, Client.id]
+
+                if cursor is not None:
+                    db_query = db_query.filter(_after_cursor(sort_key, cursor))
+
+                # Une ligne de plus pour savoir s'il reste une page
+                rows = db_query.order_by(*sort_key).limit(page_size + 1).all()
+                has_more = len(rows) > page_size
+                rows = rows[:page_size]
+
+                if rank is not None:
+                    clients = [client for client, _ in rows]
+                    next_cursor = (rows[-1][1], rows[-1][0].id) if has_more else None
+                else:
+                    clients = rows
+                    last = rows[-1] if has_more else None
+                    next_cursor = (last.nom_tri, last.prenom_tri, last.id) if last else None
+
+                total = actifs = None
+                if with_total:
+                    count_query, _ = self._filtered_clients_query(
+                        session.query(
+                            func.count(Client.id),
+                            func.coalesce(func.sum(case((Client.actif == True, 1), else_=0)), 0)
+                        ),
+                        query, type_client, actif
+                    )
+                    total, actifs = count_query.one()
+
+                return {
+                    'clients': clients,
+                    'cursor': next_cursor,
+                    'total': total,
+                    'actifs': actifs
+                }
+
+            except Exception as e:
+                print(f"[ERREUR] get_clients_page: {e}")
+                return {'clients': [], 'cursor': None, 'total': 0, 'actifs': 0}
+
+    def _filtered_clients_query(self, db_query, query: str, type_client: str | None, actif: bool | None):
+        """
+        Applique la recherche textuelle et les filtres type/actif à une requête.
+        Utilise l'index plein texte (préfixes, sans accents) et se replace sur
+        un LIKE si FTS5 est indisponible.
+
+        Returns:
+            tuple: (requête filtrée, colonne de pertinence FTS ou None)
+        """
+        rank = None
+
+        # Recherche textuelle
+        fts_query = build_fts_query(query) if query else None
+
+        if fts_query and search_index.fts_available:
+            matches = client_search_subquery(fts_query)
+            db_query = db_query.join(matches, matches.c.id == Client.id)
+            rank = matches.c.rank
+
+        elif query:
+            search_filter = or_(
+                Client.nom.ilike(f"%{query}%"),
+                Client.prenom.ilike(f"%{query}%"),
+                Client.raison_sociale.ilike(f"%{query}%"),
+                Client.email.ilike(f"%{query}%"),
+                Client.siret.ilike(f"%{query}%")
+            )
+            db_query = db_query.filter(search_filter)
+
+        # Filtre par type
+        if type_client:
+            db_query = db_query.filter(Client.type == type_client)
+
+        # Filtre par statut actif
+        if actif is not None:
+            db_query = db_query.filter(Client.actif == actif)
+
+        return db_query, rank
 
     def create_client(self, data: dict) -> tuple[bool, str, Client | None]:
         """
@@ -112,74 +272,25 @@ class ClientController:
         Returns:
             tuple: (success: bool, message: str, client: Client | None)
         """
-        try:
-            # Validation des champs obligatoires selon le type
-            type_client = data.get('type', 'particulier')
-
-            if type_client == 'entreprise':
-                valid, msg = validate_required_field(data.get('raison_sociale', ''), "La raison sociale")
-                if not valid:
-                    return False, msg, None
-
-                # Valider SIRET
-                valid, msg = validate_siret(data.get('siret', ''))
+        with session_scope() as session:
+            try:
+                valid, msg = validate_client_data(data)
                 if not valid:
                     return False, msg, None
 
-            else:  # particulier
-                valid, msg = validate_required_field(data.get('nom', ''), "Le nom")
-                if not valid:
-                    return False, msg, None
+                # Créer le client
+                client = Client(**client_values(data), actif=data.get('actif', True))
 
-            # Valider adresse
-            valid, msg = validate_required_field(data.get('adresse', ''), "L'adresse")
-            if not valid:
-                return False, msg, None
-
-            # Valider code postal
-            if not validate_code_postal(data.get('code_postal', '')):
-                return False, "Le code postal doit contenir 5 chiffres", None
-
-            # Valider ville
-            valid, msg = validate_required_field(data.get('ville', ''), "La ville")
-            if not valid:
-                return False, msg, None
-
-            # Valider email
-            if not validate_email(data.get('email', '')):
-                return False, "L'adresse email n'est pas valide", None
-
-            # Valider téléphone (optionnel)
-            telephone = data.get('telephone', '')
-            if telephone and not validate_telephone(telephone):
-                return False, "Le numéro de téléphone n'est pas valide (10 chiffres)", None
-
-            # Créer le client
-            client = Client(
-                type=type_client,
-                nom=data.get('nom', '').strip(),
-                prenom=data.get('prenom', '').strip(),
-                raison_sociale=data.get('raison_sociale', '').strip(),
-                adresse=data.get('adresse', '').strip(),
-                code_postal=data.get('code_postal', '').strip(),
-                ville=data.get('ville', '').strip(),
-                email=data.get('email', '').strip(),
-                telephone=telephone.strip() if telephone else None,
-                siret=data.get('siret', '').replace(' ', '').replace('-', '') if data.get('siret') else None,
-                notes=data.get('notes', '').strip(),
-                actif=data.get('actif', True)
-            )
+                session.add(client)
+                session.commit()
+                session.refresh(client)
 
-            self.session.add(client)
-            self.session.commit()
-            self.session.refresh(client)
+                return True, "Client créé avec succès", client
 
-            return True, "Client créé avec succès", client
-
-        except Exception as e:
-            self.session.rollback()
-            print(f"[ERREUR] create_client: {e}")
-            return False, f"Erreur lors de la création du client: {str(e)}", None
+            except Exception as e:
+                session.rollback()
+                print(f"[ERREUR] create_client: {e}")
+                return False, f"Erreur lors de la création du client: {str(e)}", None
 
     def update_client(self, client_id: int, data: dict) -> tuple[bool, str, Client | None]:
         """
@@ -192,78 +303,34 @@ class ClientController:
         Returns:
             tuple: (success: bool, message: str, client: Client | None)
         """
-        try:
-            client = self.get_client_by_id(client_id)
-
-            if not client:
-                return False, "Client introuvable", None
+        with session_scope() as session:
+            try:
+                client = self.get_client_by_id(client_id)
 
-            # Validation des champs obligatoires selon le type
-            type_client = data.get('type', client.type)
+                if not client:
+                    return False, "Client introuvable", None
 
-            if type_client == 'entreprise':
-                valid, msg = validate_required_field(data.get('raison_sociale', ''), "La raison sociale")
+                type_client = data.get('type', client.type)
+                valid, msg = validate_client_data({**data, 'type': type_client})
                 if not valid:
                     return False, msg, None
 
-                # Valider SIRET
-                valid, msg = validate_siret(data.get('siret', ''))
-                if not valid:
-                    return False, msg, None
+                # Mettre à jour les champs
+                for field, value in client_values({**data, 'type': type_client}).items():
+                    setattr(client, field, value)
 
-            else:  # particulier
-                valid, msg = validate_required_field(data.get('nom', ''), "Le nom")
-                if not valid:
-                    return False, msg, None
+                if 'actif' in data:
+                    client.actif = data['actif']
+
+                session.commit()
+                session.refresh(client)
 
-            # Valider adresse
-            valid, msg = validate_required_field(data.get('adresse', ''), "L'adresse")
-            if not valid:
-                return False, msg, None
-
-            # Valider code postal
-            if not validate_code_postal(data.get('code_postal', '')):
-                return False, "Le code postal doit contenir 5 chiffres", None
-
-            # Valider ville
-            valid, msg = validate_required_field(data.get('ville', ''), "La ville")
-            if not valid:
-                return False, msg, None
-
-            # Valider email
-            if not validate_email(data.get('email', '')):
-                return False, "L'adresse email n'est pas valide", None
-
-            # Valider téléphone (optionnel)
-            telephone = data.get('telephone', '')
-            if telephone and not validate_telephone(telephone):
-                return False, "Le numéro de téléphone n'est pas valide (10 chiffres)", None
-
-            # Mettre à jour les champs
-            client.type = type_client
-            client.nom = data.get('nom', '').strip()
-            client.prenom = data.get('prenom', '').strip()
-            client.raison_sociale = data.get('raison_sociale', '').strip()
-            client.adresse = data.get('adresse', '').strip()
-            client.code_postal = data.get('code_postal', '').strip()
-            client.ville = data.get('ville', '').strip()
-            client.email = data.get('email', '').strip()
-            client.telephone = telephone.strip() if telephone else None
-            client.siret = data.get('siret', '').replace(' ', '').replace('-', '') if data.get('siret') else None
-            client.notes = data.get('notes', '').strip()
-
-            if 'actif' in data:
-                client.actif = data['actif']
-
-            self.session.commit()
-            self.session.refresh(client)
-
-            return True, "Client modifié avec succès", client
-
-        except Exception as e:
-            self.session.rollback()
-            print(f"[ERREUR] update_client: {e}")
-            return False, f"Erreur lors de la modification du client: {str(e)}", None
+                return True, "Client modifié avec succès", client
+
+            except Exception as e:
+                session.rollback()
+                print(f"[ERREUR] update_client: {e}")
+                return False, f"Erreur lors de la modification du client: {str(e)}", None
 
     def delete_client(self, client_id: int) -> tuple[bool, str]:
         """
@@ -276,38 +343,39 @@ class ClientController:
         Returns:
             tuple: (success: bool, message: str)
         """
-        try:
-            client = self.get_client_by_id(client_id)
+        with session_scope() as session:
+            try:
+                client = self.get_client_by_id(client_id)
 
-            if not client:
-                return False, "Client introuvable"
+                if not client:
+                    return False, "Client introuvable"
 
-            # Vérifier s'il y a des factures
-            nb_factures = self.session.query(func.count(Facture.id)).filter(
-                Facture.client_id == client_id
-            ).scalar()
+                # Vérifier s'il y a des factures
+                nb_factures = session.query(func.count(Facture.id)).filter(
+                    Facture.client_id == client_id
+                ).scalar()
 
-            if nb_factures > 0:
-                return False, f"Impossible de supprimer: le client a {nb_factures} facture(s) associée(s)"
+                if nb_factures > 0:
+                    return False, f"Impossible de supprimer: le client a {nb_factures} facture(s) associée(s)"
 
-            # Vérifier s'il y a des devis
-            nb_devis = self.session.query(func.count(Devis.id)).filter(
-                Devis.client_id == client_id
-            ).scalar()
+                # Vérifier s'il y a des devis
+                nb_devis = session.query(func.count(Devis.id)).filter(
+                    Devis.client_id == client_id
+                ).scalar()
 
-            if nb_devis > 0:
-                return False, f"Impossible de supprimer: le client a {nb_devis} devis associé(s)"
+                if nb_devis > 0:
+                    return False, f"Impossible de supprimer: le client a {nb_devis} devis associé(s)"
 
-            # Supprimer le client
-            self.session.delete(client)
-            self.session.commit()
+                # Supprimer le client
+                session.delete(client)
+                session.commit()
 
-            return True, "Client supprimé avec succès"
+                return True, "Client supprimé avec succès"
 
-        except Exception as e:
-            self.session.rollback()
-            print(f"[ERREUR] delete_client: {e}")
-            return False, f"Erreur lors de la suppression du client: {str(e)}"
+            except Exception as e:
+                session.rollback()
+                print(f"[ERREUR] delete_client: {e}")
+                return False, f"Erreur lors de la suppression du client: {str(e)}"
 
     def toggle_active(self, client_id: int) -> tuple[bool, str, bool]:
         """
@@ -319,22 +387,23 @@ class ClientController:
         Returns:
             tuple: (success: bool, message: str, new_status: bool)
         """
-        try:
-            client = self.get_client_by_id(client_id)
+        with session_scope() as session:
+            try:
+                client = self.get_client_by_id(client_id)
 
-            if not client:
-                return False, "Client introuvable", False
+                if not client:
+                    return False, "Client introuvable", False
 
-            client.actif = not client.actif
-            self.session.commit()
+                client.actif = not client.actif
+                session.commit()
 
-            status_text = "activé" if client.actif else "désactivé"
-            return True, f"Client {status_text} avec succès", client.actif
+                status_text = "activé" if client.actif else "désactivé"
+                return True, f"Client {status_text} avec succès", client.actif
 
-        except Exception as e:
-            self.session.rollback()
-            print(f"[ERREUR] toggle_active: {e}")
-            return False, f"Erreur lors du changement de statut: {str(e)}", False
+            except Exception as e:
+                session.rollback()
+                print(f"[ERREUR] toggle_active: {e}")
+                return False, f"Erreur lors du changement de statut: {str(e)}", False
 
     def get_client_statistics(self, client_id: int) -> dict:
         """
@@ -346,38 +415,108 @@ class ClientController:
         Returns:
             dict: Dictionnaire avec nb_factures, nb_devis, ca_total
         """
-        try:
-            # Nombre de factures
-            nb_factures = self.session.query(func.count(Facture.id)).filter(
-                Facture.client_id == client_id
-            ).scalar() or 0
-
-            # Nombre de devis
-            nb_devis = self.session.query(func.count(Devis.id)).filter(
-                Devis.client_id == client_id
-            ).scalar() or 0
-
-            # CA total (somme des factures payées)
-            ca_total = self.session.query(func.sum(Facture.montant_total_ht)).filter(
-                Facture.client_id == client_id,
-                Facture.statut == 'payee'
-            ).scalar() or 0
-
-            return {
+        with session_scope() as session:
+            try:
+                # Nombre de factures
+                nb_factures = session.query(func.count(Facture.id)).filter(
+                    Facture.client_id == client_id
+                ).scalar() or 0
+
+                # Nombre de devis
+                nb_devis = session.query(func.count(Devis.id)).filter(
+                    Devis.client_id == client_id
+                ).scalar() or 0
+
+                # CA total (somme des factures payées)
+                ca_total = session.query(func.sum(Facture.montant_total_ht)).filter(
+                    Facture.client_id == client_id,
+                    Facture.statut == 'payee'
+                ).scalar() or 0
+
+                return {
+                    'nb_factures': nb_factures,
+                    'nb_devis': nb_devis,
+                    'ca_total': float(ca_total)
+                }
+
+            except Exception as e:
+                print(f"[ERREUR] get_client_statistics: {e}")
+                return {
+                    'nb_factures': 0,
+                    'nb_devis': 0,
+                    'ca_total': 0.0
+                }
+
+    def get_clients_statistics(self, client_ids: list[int] | None = None) -> dict[int, dict]:
+        """
+        Retourne les statistiques de plusieurs clients en une seule requête groupée.
+
+        Args:
+            client_ids: IDs des clients concernés (None pour tous les clients)
+
+        Returns:
+            dict[int, dict]: Statistiques (nb_factures, nb_devis, ca_total) par ID client
+        """
+        with session_scope() as session:
+            try:
+                if client_ids is None:
+                    return self._query_clients_statistics(session, None)
+
+                statistics = {}
+                ids = list(client_ids)
+
+                # Découper pour rester sous la limite de paramètres de SQLite
+                for start in range(0, len(ids), STATISTICS_CHUNK_SIZE):
+                    chunk = ids[start:start + STATISTICS_CHUNK_SIZE]
+                    statistics.update(self._query_clients_statistics(session, chunk))
+
+                return statistics
+
+            except Exception as e:
+                print(f"[ERREUR] get_clients_statistics: {e}")
+                return {}
+
+    def _query_clients_statistics(self, session: Session, client_ids: list[int] | None) -> dict[int, dict]:
+        """Exécute la requête groupée de statistiques pour un lot de clients"""
+        factures_stats = select(
+            Facture.client_id.label('client_id'),
+            func.count(Facture.id).label('nb_factures'),
+            func.sum(
+                case((Facture.statut == 'payee', Facture.montant_total_ht), else_=0)
+            ).label('ca_total')
+        ).group_by(Facture.client_id)
+
+        devis_stats = select(
+            Devis.client_id.label('client_id'),
+            func.count(Devis.id).label('nb_devis')
+        ).group_by(Devis.client_id)
+
+        if client_ids is not None:
+            factures_stats = factures_stats.where(Facture.client_id.in_(client_ids))
+            devis_stats = devis_stats.where(Devis.client_id.in_(client_ids))
+
+        factures_stats = factures_stats.subquery()
+        devis_stats = devis_stats.subquery()
+
+        query = session.query(
+            Client.id,
+            func.coalesce(factures_stats.c.nb_factures, 0),
+            func.coalesce(devis_stats.c.nb_devis, 0),
+            func.coalesce(factures_stats.c.ca_total, 0)
+        ).outerjoin(
+            factures_stats, factures_stats.c.client_id == Client.id
+        ).outerjoin(
+            devis_stats, devis_stats.c.client_id == Client.id
+        )
+
+        if client_ids is not None:
+            query = query.filter(Client.id.in_(client_ids))
+
+        return {
+            client_id: {
                 'nb_factures': nb_factures,
                 'nb_devis': nb_devis,
                 'ca_total': float(ca_total)
             }
-
-        except Exception as e:
-            print(f"[ERREUR] get_client_statistics: {e}")
-            return {
-                'nb_factures': 0,
-                'nb_devis': 0,
-                'ca_total': 0.0
-            }
-
-    def __del__(self):
-        """Ferme la session à la destruction du contrôleur"""
-        if hasattr(self, 'session'):
-            self.session.close()
\ No newline at end of file
+            for client_id, nb_factures, nb_devis, ca_total in query
+        }
@@ -0,0 +1,244 @@
+"""
+Controller pour le tableau de bord (chiffre d'affaires et factures en attente)
+"""
+import math
+from datetime import date, timedelta
+from decimal import Decimal, ROUND_HALF_UP
+from sqlalchemy.orm import Session
+from sqlalchemy import func
+from database import session_scope
+from database.revenue_summary import rebuild_revenue_summary
+from config import PLAFOND_AUTO_ENTREPRENEUR, PLAFOND_SEUILS_ALERTE
+from models import ResumeFactures, ResumeCategories, ResumeEncaissements
+
+
+# Statuts comptés dans le chiffre d'affaires facturé (hors brouillons et annulations)
+STATUTS_FACTURES_EMISES = ('emise', 'payee', 'partiellement_payee', 'en_retard')
+
+# Statuts des factures en attente de paiement
+STATUTS_EN_ATTENTE = ('emise', 'partiellement_payee', 'en_retard')
+
+
+def centimes_to_decimal(centimes: int | None) -> Decimal:
+    """Convertit un montant en centimes en Decimal à deux décimales"""
+    return Decimal(centimes or 0).scaleb(-2)
+
+
+def ca_encaisse_annee(session: Session, annee: int) -> Decimal:
+    """
+    Chiffre d'affaires encaissé sur une année civile, lu dans resume_encaissements
+    (au plus 12 lignes, tenues à jour par triggers à chaque paiement).
+
+    Args:
+        session: Session SQLAlchemy (voit les paiements non encore validés de la session)
+        annee: Année civile
+
+    Returns:
+        Decimal: Montant encaissé
+    """
+    centimes = session.query(
+        func.coalesce(func.sum(ResumeEncaissements.montant_centimes), 0)
+    ).filter(ResumeEncaissements.annee == annee).scalar()
+    return centimes_to_decimal(centimes)
+
+
+def pourcentage_plafond(ca_encaisse: Decimal) -> Decimal:
+    """Pourcentage du plafond auto-entrepreneur atteint (arrondi au dixième)"""
+    return (ca_encaisse * 100 / Decimal(PLAFOND_AUTO_ENTREPRENEUR)).quantize(Decimal('0.1'), rounding=ROUND_HALF_UP)
+
+
+def seuils_franchis(pourcentage_avant: Decimal, pourcentage_apres: Decimal) -> list[int]:
+    """
+    Retourne les seuils d'alerte du plafond franchis entre deux pourcentages.
+    Exemple: seuils_franchis(75, 92) -> [80, 90]
+
+    Args:
+        pourcentage_avant: Pourcentage du plafond avant l'opération (ex: enregistrement d'un paiement)
+        pourcentage_apres: Pourcentage du plafond après l'opération
+
+    Returns:
+        list[int]: Seuils franchis à la hausse (liste vide si aucun)
+    """
+    return [seuil for seuil in PLAFOND_SEUILS_ALERTE if pourcentage_avant < seuil <= pourcentage_apres]
+
+
+class DashboardController:
+    """
+    Contrôleur du tableau de bord.
+    Lit uniquement les tables de synthèse (resume_*), maintenues par triggers :
+    le coût ne dépend pas du nombre de factures ou de paiements.
+    Chaque opération travaille dans sa propre session (session_scope).
+    """
+
+    def get_dashboard(self, annee: int | None = None, mois: int | None = None) -> dict:
+        """
+        Retourne les indicateurs du tableau de bord.
+
+        Args:
+            annee: Année de référence (année en cours par défaut)
+            mois: Mois de référence (mois en cours par défaut)
+
+        Returns:
+            dict: ca_mois/ca_trimestre/ca_annee (encaissé), facture_mois/facture_trimestre/
+                  facture_annee (facturé), evolution_mensuelle, en_attente, en_retard,
+                  repartition_categories
+        """
+        today = date.today()
+        annee = annee or today.year
+        mois = mois or today.month
+        trimestre = range(3 * ((mois - 1) // 3) + 1, 3 * ((mois - 1) // 3) + 4)
+
+        with session_scope() as session:
+            try:
+                # Encaissements par mois de l'année (au plus 12 lignes)
+                encaisse = dict(session.query(
+                    ResumeEncaissements.mois, ResumeEncaissements.montant_centimes
+                ).filter(ResumeEncaissements.annee == annee).all())
+
+                # Facturé par mois de l'année (au plus 12 x nb statuts lignes)
+                facture = dict(session.query(
+                    ResumeFactures.mois, func.sum(ResumeFactures.montant_ht_centimes)
+                ).filter(
+                    ResumeFactures.annee == annee,
+                    ResumeFactures.statut.in_(STATUTS_FACTURES_EMISES)
+                ).group_by(ResumeFactures.mois).all())
+
+                evolution = [
+                    {
+                        'mois': m,
+                        'encaisse': centimes_to_decimal(encaisse.get(m)),
+                        'facture': centimes_to_decimal(facture.get(m))
+                    }
+                    for m in range(1, 13)
+                ]
+
+                # Répartition du facturé de l'année par catégorie de prestation
+                categories = session.query(
+                    ResumeCategories.categorie, func.sum(ResumeCategories.montant_ht_centimes)
+                ).filter(
+                    ResumeCategories.annee == annee,
+                    ResumeCategories.statut.in_(STATUTS_FACTURES_EMISES)
+                ).group_by(ResumeCategories.categorie).all()
+
+                repartition = sorted(
+                    (
+                        {'categorie': categorie or "Autre", 'montant': centimes_to_decimal(montant)}
+                        for categorie, montant in categories if montant
+                    ),
+                    key=lambda item: item['montant'],
+                    reverse=True
+                )
+
+                return {
+                    'annee': annee,
+                    'mois': mois,
+                    'ca_mois': centimes_to_decimal(encaisse.get(mois)),
+                    'ca_trimestre': centimes_to_decimal(sum(encaisse.get(m, 0) for m in trimestre)),
+                    'ca_annee': centimes_to_decimal(sum(encaisse.values())),
+                    'facture_mois': centimes_to_decimal(facture.get(mois)),
+                    'facture_trimestre': centimes_to_decimal(sum(facture.get(m, 0) for m in trimestre)),
+                    'facture_annee': centimes_to_decimal(sum(facture.values())),
+                    'evolution_mensuelle': evolution,
+                    'en_attente': self._restant_du(session, STATUTS_EN_ATTENTE),
+                    'en_retard': self._restant_du(session, ('en_retard',)),
+                    'repartition_categories': repartition
+                }
+
+            except Exception as e:
+                print(f"[ERREUR] get_dashboard: {e}")
+                return {}
+
+    def _restant_du(self, session: Session, statuts: tuple) -> dict:
+        """Nombre de factures et montant restant dû (toutes années) pour des statuts"""
+        nb, montant_ht, montant_paye = session.query(
+            func.coalesce(func.sum(ResumeFactures.nb_factures), 0),
+            func.coalesce(func.sum(ResumeFactures.montant_ht_centimes), 0),
+            func.coalesce(func.sum(ResumeFactures.montant_paye_centimes), 0)
+        ).filter(ResumeFactures.statut.in_(statuts)).one()
+
+        return {
+            'nb': nb,
+            'montant': centimes_to_decimal(montant_ht - montant_paye)
+        }
+
+    def get_suivi_plafond(self, annee: int | None = None, today: date | None = None) -> dict:
+        """
+        Suivi du chiffre d'affaires encaissé par rapport au plafond auto-entrepreneur.
+        Le cumul est lu dans resume_encaissements (au plus 12 lignes), tenu à jour
+        par triggers à chaque paiement enregistré, modifié ou supprimé.
+
+        Args:
+            annee: Année civile suivie (année en cours par défaut)
+            today: Date de référence pour la projection (aujourd'hui par défaut)
+
+        Returns:
+            dict: annee, plafond, ca_encaisse, restant, pourcentage, seuils_atteints,
+                  alerte (message ou None), depasse, date_depassement_prevue (date ou None)
+        """
+        today = today or date.today()
+        annee = annee or today.year
+        plafond = Decimal(PLAFOND_AUTO_ENTREPRENEUR)
+
+        with session_scope() as session:
+            try:
+                ca_encaisse = ca_encaisse_annee(session, annee)
+
+            except Exception as e:
+                print(f"[ERREUR] get_suivi_plafond: {e}")
+                ca_encaisse = Decimal('0.00')
+
+        pourcentage = pourcentage_plafond(ca_encaisse)
+        seuils_atteints = [seuil for seuil in PLAFOND_SEUILS_ALERTE if pourcentage >= seuil]
+        depasse = ca_encaisse > plafond
+
+        alerte = None
+        if depasse:
+            alerte = f"Plafond auto-entrepreneur dépassé : {ca_encaisse} € encaissés pour {plafond} €"
+        elif seuils_atteints:
+            alerte = f"{pourcentage} % du plafond auto-entrepreneur atteint ({ca_encaisse} € / {plafond} €)"
+
+        return {
+            'annee': annee,
+            'plafond': plafond,
+            'ca_encaisse': ca_encaisse,
+            'restant': max(plafond - ca_encaisse, Decimal('0.00')),
+            'pourcentage': pourcentage,
+            'seuils_atteints': seuils_atteints,
+            'alerte': alerte,
+            'depasse': depasse,
+            'date_depassement_prevue': self._projeter_depassement(annee, ca_encaisse, plafond, today)
+        }
+
+    @staticmethod
+    def _projeter_depassement(annee: int, ca_encaisse: Decimal, plafond: Decimal, today: date) -> date | None:
+        """
+        Projette la date de dépassement du plafond au rythme d'encaissement moyen
+        depuis le 1er janvier. Retourne None si l'année est écoulée, si le plafond
+        est déjà dépassé ou si le dépassement n'interviendrait pas avant la fin de l'année.
+        """
+        debut, fin = date(annee, 1, 1), date(annee, 12, 31)
+        if not debut <= today <= fin or ca_encaisse <= 0 or ca_encaisse > plafond:
+            return None
+
+        rythme_journalier = ca_encaisse / ((today - debut).days + 1)
+        projection = today + timedelta(days=math.ceil((plafond - ca_encaisse) / rythme_journalier))
+
+        return projection if projection <= fin else None
+
+    def rebuild_summary(self) -> tuple[bool, str]:
+        """
+        Recalcule les tables de synthèse à partir des factures et paiements.
+
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        with session_scope() as session:
+            try:
+                rebuild_revenue_summary(session.connection())
+                session.commit()
+                return True, "Statistiques recalculées avec succès"
+
+            except Exception as e:
+                session.rollback()
+                print(f"[ERREUR] rebuild_summary: {e}")
+                return False, f"Erreur lors du recalcul des statistiques: {str(e)}"
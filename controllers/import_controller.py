@@ -0,0 +1,319 @@
+"""
+Controller pour l'import en masse de clients et de prestations depuis un fichier CSV
+
+Le fichier est lu au fil de l'eau et traité par lots (IMPORT_BATCH_SIZE) :
+chaque lot est validé par colonnes avec les mêmes règles que la saisie (utils.validators),
+les lignes valides d'un lot sont insérées en une seule requête (executemany)
+puis validées par une transaction. Une ligne invalide est signalée avec son
+numéro et n'interrompt pas l'import.
+
+Format accepté : UTF-8 (avec ou sans BOM), séparateur ';' ou ',' (détecté),
+première ligne d'en-têtes (casse, accents et espaces ignorés, ex: "Code postal",
+"code_postal" ou "CP").
+
+Usage :
+    controller = ImportController()
+    rapport = controller.import_clients("clients.csv")
+    # {'lignes': 1200, 'importees': 1195, 'erreurs': [(14, "Le code postal doit contenir 5 chiffres"), ...]}
+"""
+import csv
+import unicodedata
+from decimal import Decimal, InvalidOperation
+from itertools import islice
+from pathlib import Path
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+from database import session_scope
+from config import IMPORT_BATCH_SIZE
+from models import Client, Prestation
+from controllers.client_controller import client_values
+from utils.prestation_catalog import catalogue
+from utils.validators import validate_clients_batch, validate_required_field
+
+
+# En-têtes reconnus (après normalisation) -> champ du modèle
+CLIENT_COLONNES = {
+    'type': 'type', 'type_client': 'type',
+    'nom': 'nom',
+    'prenom': 'prenom',
+    'raison_sociale': 'raison_sociale', 'societe': 'raison_sociale', 'entreprise': 'raison_sociale',
+    'adresse': 'adresse',
+    'code_postal': 'code_postal', 'cp': 'code_postal',
+    'ville': 'ville',
+    'email': 'email', 'e_mail': 'email', 'mail': 'email',
+    'telephone': 'telephone', 'tel': 'telephone',
+    'siret': 'siret',
+    'notes': 'notes',
+    'actif': 'actif',
+}
+
+PRESTATION_COLONNES = {
+    'libelle': 'libelle', 'designation': 'libelle', 'intitule': 'libelle',
+    'description': 'description',
+    'prix_unitaire_ht': 'prix_unitaire_ht', 'prix_unitaire': 'prix_unitaire_ht', 'prix_ht': 'prix_unitaire_ht',
+    'prix': 'prix_unitaire_ht',
+    'unite': 'unite',
+    'categorie': 'categorie',
+    'actif': 'actif',
+}
+
+TYPES_CLIENT = {
+    'particulier': 'particulier',
+    'entreprise': 'entreprise', 'professionnel': 'entreprise', 'pro': 'entreprise',
+    'societe': 'entreprise', 'société': 'entreprise',
+}
+
+VALEURS_VRAI = {'', '1', 'oui', 'o', 'vrai', 'true', 'yes', 'x'}
+VALEURS_FAUX = {'0', 'non', 'n', 'faux', 'false', 'no'}
+
+
+def normalize_header(header: str) -> str:
+    """
+    Normalise un en-tête de colonne : minuscules, sans accents, séparateurs en '_'.
+    Exemple: "Code Postal" -> "code_postal", "Téléphone" -> "telephone"
+
+    Args:
+        header: En-tête tel qu'il figure dans le fichier
+
+    Returns:
+        str: En-tête normalisé
+    """
+    header = unicodedata.normalize('NFKD', header or '').encode('ascii', 'ignore').decode('ascii')
+    for separator in (' ', '-', "'", '.'):
+        header = header.replace(separator, '_')
+    return '_'.join(part for part in header.lower().split('_') if part)
+
+
+def parse_booleen(value: str) -> bool | None:
+    """Convertit 'oui'/'non', '1'/'0'... en booléen (None si la valeur n'est pas reconnue)"""
+    value = (value or '').strip().lower()
+    if value in VALEURS_VRAI:
+        return True
+    if value in VALEURS_FAUX:
+        return False
+    return None
+
+
+def parse_montant(value: str) -> Decimal | None:
+    """
+    Convertit un montant saisi en Decimal : "1 234,50", "45.00", "45 €".
+
+    Args:
+        value: Montant tel qu'il figure dans le fichier
+
+    Returns:
+        Decimal | None: Montant arrondi au centime, None s'il n'est pas valide
+    """
+    value = (value or '').replace('€', '').replace('\xa0', '').replace(' ', '').replace(',', '.')
+    try:
+        montant = Decimal(value)
+    except InvalidOperation:
+        return None
+    return montant.quantize(Decimal('0.01')) if montant.is_finite() else None
+
+
+def numbered_rows(reader):
+    """
+    Parcourt les enregistrements d'un csv.reader avec le numéro de leur première
+    ligne dans le fichier (un champ entre guillemets peut s'étendre sur plusieurs
+    lignes : reader.line_num donne alors la dernière). Les lignes vides sont ignorées.
+
+    Args:
+        reader: csv.reader positionné après l'en-tête
+
+    Yields:
+        tuple: (numéro de la première ligne de l'enregistrement, cellules)
+    """
+    while True:
+        # Numéro lu avant l'enregistrement : dernière ligne du précédent + 1
+        debut = reader.line_num + 1
+        row = next(reader, None)
+        if row is None:
+            return
+        if any(cell.strip() for cell in row):
+            yield debut, row
+
+
+class ImportController:
+    """Controller pour l'import en masse depuis des fichiers CSV"""
+
+    def __init__(self, batch_size: int = IMPORT_BATCH_SIZE):
+        """
+        Initialise le contrôleur (chaque import travaille dans sa propre session).
+
+        Args:
+            batch_size: Nombre de lignes validées et insérées par transaction
+        """
+        self.batch_size = batch_size
+
+    def import_clients(self, path, progress=None) -> dict:
+        """
+        Importe des clients depuis un fichier CSV.
+        Sans colonne 'type', un client avec raison sociale ou SIRET est une entreprise.
+
+        Args:
+            path: Chemin du fichier CSV
+            progress: Fonction appelée avec le nombre de lignes traitées après chaque lot
+
+        Returns:
+            dict: {'lignes': int, 'importees': int, 'erreurs': [(numéro de ligne, message)]}
+        """
+        return self._import(path, Client, CLIENT_COLONNES, self._client_rows, progress)
+
+    def import_prestations(self, path, progress=None) -> dict:
+        """
+        Importe le catalogue de prestations depuis un fichier CSV.
+
+        Args:
+            path: Chemin du fichier CSV
+            progress: Fonction appelée avec le nombre de lignes traitées après chaque lot
+
+        Returns:
+            dict: {'lignes': int, 'importees': int, 'erreurs': [(numéro de ligne, message)]}
+        """
+        rapport = self._import(path, Prestation, PRESTATION_COLONNES, self._prestation_rows, progress)
+
+        # Insertions en masse (sans événements d'ORM) : le catalogue en mémoire est à relire
+        if rapport['importees']:
+            catalogue.invalidate()
+        return rapport
+
+    @staticmethod
+    def _client_rows(rows: list[dict]) -> list[tuple[dict | None, str]]:
+        """Valide un lot de clients (par colonnes) et retourne les valeurs à insérer ou le message d'erreur"""
+        results = [None] * len(rows)
+
+        for i, data in enumerate(rows):
+            type_client = data.get('type', '').strip().lower()
+            if not type_client:
+                type_client = 'entreprise' if data.get('raison_sociale', '').strip() or data.get('siret', '').strip() else 'particulier'
+            elif type_client not in TYPES_CLIENT:
+                results[i] = (None, f"Type de client inconnu: {data['type']}")
+                continue
+            data['type'] = TYPES_CLIENT[type_client]
+
+        errors = validate_clients_batch(rows)
+
+        for i, data in enumerate(rows):
+            if results[i] is not None:
+                continue
+            if i in errors:
+                results[i] = (None, errors[i][1])
+                continue
+
+            actif = parse_booleen(data.get('actif', ''))
+            if actif is None:
+                results[i] = (None, f"Valeur 'actif' non reconnue: {data['actif']}")
+            else:
+                results[i] = ({**client_values(data), 'actif': actif}, "")
+
+        return results
+
+    @classmethod
+    def _prestation_rows(cls, rows: list[dict]) -> list[tuple[dict | None, str]]:
+        """Valide un lot de prestations et retourne les valeurs à insérer ou le message d'erreur"""
+        return [cls._prestation_row(data) for data in rows]
+
+    @staticmethod
+    def _prestation_row(data: dict) -> tuple[dict | None, str]:
+        """Valide une ligne de prestation et retourne les valeurs à insérer (ou le message d'erreur)"""
+        valid, msg = validate_required_field(data.get('libelle', ''), "Le libellé")
+        if not valid:
+            return None, msg
+
+        prix = parse_montant(data.get('prix_unitaire_ht', ''))
+        if prix is None:
+            return None, "Le prix unitaire n'est pas valide"
+        if prix < 0:
+            return None, "Le prix unitaire ne peut pas être négatif"
+
+        valid, msg = validate_required_field(data.get('unite', ''), "L'unité")
+        if not valid:
+            return None, msg
+
+        actif = parse_booleen(data.get('actif', ''))
+        if actif is None:
+            return None, f"Valeur 'actif' non reconnue: {data['actif']}"
+
+        return {
+            'libelle': data['libelle'].strip(),
+            'description': data.get('description', '').strip() or None,
+            'prix_unitaire_ht': prix,
+            'unite': data['unite'].strip(),
+            'categorie': data.get('categorie', '').strip() or None,
+            'actif': actif,
+        }, ""
+
+    def _import(self, path, model, colonnes: dict, validate_rows, progress) -> dict:
+        """
+        Lit le fichier par lots, valide chaque ligne et insère les lignes valides.
+
+        Args:
+            path: Chemin du fichier CSV
+            model: Modèle des lignes insérées
+            colonnes: En-têtes reconnus -> champ du modèle
+            validate_rows: Fonction (lot de données) -> [(valeurs à insérer | None, message d'erreur)]
+            progress: Fonction appelée avec le nombre de lignes traitées après chaque lot
+
+        Returns:
+            dict: {'lignes': int, 'importees': int, 'erreurs': [(numéro de ligne, message)]}
+        """
+        rapport = {'lignes': 0, 'importees': 0, 'erreurs': []}
+
+        with open(Path(path), encoding='utf-8-sig', newline='') as file, session_scope() as session:
+            sample = file.read(4096)
+            file.seek(0)
+            try:
+                delimiter = csv.Sniffer().sniff(sample, delimiters=';,\t').delimiter
+            except csv.Error:
+                delimiter = ';'
+
+            reader = csv.reader(file, delimiter=delimiter)
+            headers = next(reader, None)
+            if headers is None:
+                return rapport
+
+            # Index des colonnes reconnues (les colonnes inconnues sont ignorées)
+            champs = [(index, colonnes[normalize_header(header)])
+                      for index, header in enumerate(headers) if normalize_header(header) in colonnes]
+            if not champs:
+                rapport['erreurs'].append((1, "Aucune colonne reconnue dans l'en-tête"))
+                return rapport
+
+            rows = numbered_rows(reader)
+
+            while batch := list(islice(rows, self.batch_size)):
+                self._import_batch(session, batch, model, champs, validate_rows, rapport)
+                if progress:
+                    progress(rapport['lignes'])
+
+        print(f"[OK] Import {model.__tablename__}: {rapport['importees']}/{rapport['lignes']} ligne(s) importee(s), "
+              f"{len(rapport['erreurs'])} erreur(s)")
+        return rapport
+
+    def _import_batch(self, session: Session, batch: list, model, champs: list, validate_rows, rapport: dict):
+        """Valide un lot de lignes et insère les lignes valides dans une transaction"""
+        values, lignes = [], []
+        rows = [{champ: row[index] if index < len(row) else '' for index, champ in champs} for _, row in batch]
+        rapport['lignes'] += len(rows)
+
+        for (line_num, _), (row_values, msg) in zip(batch, validate_rows(rows)):
+            if row_values is None:
+                rapport['erreurs'].append((line_num, msg))
+            else:
+                values.append(row_values)
+                lignes.append(line_num)
+
+        if not values:
+            return
+
+        try:
+            # render_nulls : les valeurs None sont envoyées telles quelles, ce qui garde un seul
+            # executemany par lot (sinon les lignes sont regroupées par colonnes renseignées)
+            session.execute(insert(model).execution_options(render_nulls=True), values)
+            session.commit()
+            rapport['importees'] += len(values)
+        except Exception as e:
+            session.rollback()
+            print(f"[ERREUR] Import {model.__tablename__}: {e}")
+            rapport['erreurs'] += [(line_num, f"Erreur lors de l'enregistrement: {str(e)}") for line_num in lignes]
@@ -0,0 +1,173 @@
+"""
+Controller pour l'enregistrement des paiements de factures
+"""
+from datetime import date
+from decimal import Decimal, InvalidOperation
+from database import session_scope
+from config import PLAFOND_AUTO_ENTREPRENEUR
+from controllers.dashboard_controller import ca_encaisse_annee, pourcentage_plafond, seuils_franchis
+from models import Facture, Paiement
+
+
+def validate_paiement_data(data: dict) -> tuple[bool, str]:
+    """
+    Valide les données d'un paiement.
+
+    Args:
+        data: Dictionnaire contenant facture_id, date_paiement, montant, moyen_paiement
+
+    Returns:
+        tuple: (valide: bool, message: str)
+    """
+    if not data.get('facture_id'):
+        return False, "La facture est obligatoire"
+
+    if not isinstance(data.get('date_paiement'), date):
+        return False, "La date de paiement est obligatoire"
+
+    try:
+        montant = Decimal(str(data.get('montant')))
+    except (InvalidOperation, ValueError):
+        return False, "Montant invalide"
+    if not montant.is_finite() or montant <= 0:
+        return False, "Le montant doit être positif"
+
+    if not (data.get('moyen_paiement') or '').strip():
+        return False, "Le moyen de paiement est obligatoire"
+
+    return True, ""
+
+
+class PaiementController:
+    """
+    Contrôleur des paiements.
+    Chaque écriture compare le pourcentage du plafond auto-entrepreneur avant
+    et après l'opération (tables de synthèse tenues à jour par triggers) et
+    retourne les seuils d'alerte franchis (PLAFOND_SEUILS_ALERTE).
+    """
+
+    def add_paiement(self, data: dict) -> tuple[bool, str, Paiement | None, list[int]]:
+        """
+        Enregistre un paiement.
+
+        Args:
+            data: Dictionnaire contenant les données du paiement
+
+        Returns:
+            tuple: (success: bool, message: str, paiement: Paiement | None, seuils franchis: list[int])
+        """
+        with session_scope() as session:
+            try:
+                valid, msg = validate_paiement_data(data)
+                if not valid:
+                    return False, msg, None, []
+
+                if session.get(Facture, data['facture_id']) is None:
+                    return False, "Facture introuvable", None, []
+
+                annee = data['date_paiement'].year
+                avant = ca_encaisse_annee(session, annee)
+
+                paiement = Paiement(**self._paiement_values(data))
+                session.add(paiement)
+                session.flush()
+
+                seuils = seuils_franchis(pourcentage_plafond(avant), pourcentage_plafond(ca_encaisse_annee(session, annee)))
+                session.commit()
+
+                return True, self._message("Paiement enregistré avec succès", seuils), paiement, seuils
+
+            except Exception as e:
+                session.rollback()
+                print(f"[ERREUR] add_paiement: {e}")
+                return False, f"Erreur lors de l'enregistrement du paiement: {str(e)}", None, []
+
+    def update_paiement(self, paiement_id: int, data: dict) -> tuple[bool, str, Paiement | None, list[int]]:
+        """
+        Modifie un paiement existant.
+
+        Args:
+            paiement_id: ID du paiement à modifier
+            data: Dictionnaire contenant les nouvelles données
+
+        Returns:
+            tuple: (success: bool, message: str, paiement: Paiement | None, seuils franchis: list[int])
+        """
+        with session_scope() as session:
+            try:
+                paiement = session.get(Paiement, paiement_id)
+                if paiement is None:
+                    return False, "Paiement introuvable", None, []
+
+                valid, msg = validate_paiement_data(data)
+                if not valid:
+                    return False, msg, None, []
+
+                if session.get(Facture, data['facture_id']) is None:
+                    return False, "Facture introuvable", None, []
+
+                # Seuils suivis sur l'année du paiement après modification
+                annee = data['date_paiement'].year
+                avant = ca_encaisse_annee(session, annee)
+
+                for colonne, valeur in self._paiement_values(data).items():
+                    setattr(paiement, colonne, valeur)
+                session.flush()
+
+                seuils = seuils_franchis(pourcentage_plafond(avant), pourcentage_plafond(ca_encaisse_annee(session, annee)))
+                session.commit()
+
+                return True, self._message("Paiement modifié avec succès", seuils), paiement, seuils
+
+            except Exception as e:
+                session.rollback()
+                print(f"[ERREUR] update_paiement: {e}")
+                return False, f"Erreur lors de la modification du paiement: {str(e)}", None, []
+
+    def delete_paiement(self, paiement_id: int) -> tuple[bool, str]:
+        """
+        Supprime un paiement (le chiffre d'affaires encaissé ne peut que baisser :
+        aucun seuil n'est franchi).
+
+        Args:
+            paiement_id: ID du paiement à supprimer
+
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        with session_scope() as session:
+            try:
+                paiement = session.get(Paiement, paiement_id)
+                if paiement is None:
+                    return False, "Paiement introuvable"
+
+                session.delete(paiement)
+                session.commit()
+
+                return True, "Paiement supprimé avec succès"
+
+            except Exception as e:
+                session.rollback()
+                print(f"[ERREUR] delete_paiement: {e}")
+                return False, f"Erreur lors de la suppression du paiement: {str(e)}"
+
+    @staticmethod
+    def _paiement_values(data: dict) -> dict:
+        """Colonnes de la table paiements à partir des données validées"""
+        return {
+            'facture_id': data['facture_id'],
+            'date_paiement': data['date_paiement'],
+            'montant': Decimal(str(data['montant'])),
+            'moyen_paiement': data['moyen_paiement'].strip(),
+            'reference': (data.get('reference') or '').strip() or None,
+            'notes': (data.get('notes') or '').strip() or None,
+        }
+
+    @staticmethod
+    def _message(message: str, seuils: list[int]) -> str:
+        """Ajoute au message l'alerte des seuils du plafond franchis"""
+        if not seuils:
+            return message
+        alerte = f"{seuils[-1]} % du plafond auto-entrepreneur ({PLAFOND_AUTO_ENTREPRENEUR} €) atteint"
+        print(f"[ALERTE] {alerte}")
+        return f"{message}. Attention : {alerte}"
@@ -0,0 +1,242 @@
+"""
+Controller pour la gestion du catalogue de prestations
+"""
+from decimal import Decimal, InvalidOperation
+from sqlalchemy import func
+from database import session_scope
+from models import Prestation, FactureLigne, DevisLigne, AvoirLigne
+from utils.prestation_catalog import catalogue
+from utils.validators import validate_required_field
+
+
+def validate_prestation_data(data: dict) -> tuple[bool, str]:
+    """
+    Valide les données d'une prestation.
+
+    Args:
+        data: Dictionnaire contenant libelle, prix_unitaire_ht, unite
+
+    Returns:
+        tuple: (valide: bool, message: str)
+    """
+    valid, msg = validate_required_field(data.get('libelle', ''), "Le libellé")
+    if not valid:
+        return False, msg
+
+    try:
+        prix = Decimal(str(data.get('prix_unitaire_ht')))
+    except (InvalidOperation, ValueError):
+        return False, "Le prix unitaire n'est pas valide"
+    if not prix.is_finite():
+        return False, "Le prix unitaire n'est pas valide"
+    if prix < 0:
+        return False, "Le prix unitaire ne peut pas être négatif"
+
+    valid, msg = validate_required_field(data.get('unite', ''), "L'unité")
+    if not valid:
+        return False, msg
+
+    return True, ""
+
+
+def prestation_values(data: dict) -> dict:
+    """
+    Valeurs des colonnes d'une prestation (données supposées validées, voir validate_prestation_data).
+
+    Args:
+        data: Dictionnaire des champs de la prestation
+
+    Returns:
+        dict: Colonnes de la table prestations (hors actif)
+    """
+    return {
+        'libelle': data['libelle'].strip(),
+        'description': (data.get('description') or '').strip() or None,
+        'prix_unitaire_ht': Decimal(str(data['prix_unitaire_ht'])).quantize(Decimal('0.01')),
+        'unite': data['unite'].strip(),
+        'categorie': (data.get('categorie') or '').strip() or None,
+    }
+
+
+class PrestationController:
+    """
+    Contrôleur pour gérer les opérations CRUD sur les prestations.
+    Chaque écriture validée invalide le catalogue en mémoire (autocomplétion
+    des lignes), relu à la recherche suivante.
+    """
+
+    def get_all_prestations(self, actif_only: bool = False) -> list[Prestation]:
+        """
+        Récupère toutes les prestations.
+
+        Args:
+            actif_only: Si True, ne retourne que les prestations actives
+
+        Returns:
+            list[Prestation]: Liste des prestations
+        """
+        with session_scope() as session:
+            try:
+                query = session.query(Prestation)
+
+                if actif_only:
+                    query = query.filter(Prestation.actif == True)
+
+                return query.order_by(Prestation.libelle).all()
+
+            except Exception as e:
+                print(f"[ERREUR] get_all_prestations: {e}")
+                return []
+
+    def get_prestation_by_id(self, prestation_id: int) -> Prestation | None:
+        """
+        Récupère une prestation par son ID.
+
+        Args:
+            prestation_id: ID de la prestation
+
+        Returns:
+            Prestation | None: La prestation trouvée ou None
+        """
+        with session_scope() as session:
+            try:
+                return session.get(Prestation, prestation_id)
+
+            except Exception as e:
+                print(f"[ERREUR] get_prestation_by_id: {e}")
+                return None
+
+    def create_prestation(self, data: dict) -> tuple[bool, str, Prestation | None]:
+        """
+        Crée une nouvelle prestation avec validation.
+
+        Args:
+            data: Dictionnaire contenant les données de la prestation
+
+        Returns:
+            tuple: (success: bool, message: str, prestation: Prestation | None)
+        """
+        with session_scope() as session:
+            try:
+                valid, msg = validate_prestation_data(data)
+                if not valid:
+                    return False, msg, None
+
+                prestation = Prestation(**prestation_values(data), actif=data.get('actif', True))
+
+                session.add(prestation)
+                session.commit()
+                session.refresh(prestation)
+                catalogue.invalidate()
+
+                return True, "Prestation créée avec succès", prestation
+
+            except Exception as e:
+                session.rollback()
+                print(f"[ERREUR] create_prestation: {e}")
+                return False, f"Erreur lors de la création de la prestation: {str(e)}", None
+
+    def update_prestation(self, prestation_id: int, data: dict) -> tuple[bool, str, Prestation | None]:
+        """
+        Met à jour une prestation existante.
+
+        Args:
+            prestation_id: ID de la prestation à modifier
+            data: Dictionnaire contenant les nouvelles données
+
+        Returns:
+            tuple: (success: bool, message: str, prestation: Prestation | None)
+        """
+        with session_scope() as session:
+            try:
+                prestation = session.get(Prestation, prestation_id)
+
+                if not prestation:
+                    return False, "Prestation introuvable", None
+
+                valid, msg = validate_prestation_data(data)
+                if not valid:
+                    return False, msg, None
+
+                for field, value in prestation_values(data).items():
+                    setattr(prestation, field, value)
+
+                if 'actif' in data:
+                    prestation.actif = data['actif']
+
+                session.commit()
+                session.refresh(prestation)
+                catalogue.invalidate()
+
+                return True, "Prestation modifiée avec succès", prestation
+
+            except Exception as e:
+                session.rollback()
+                print(f"[ERREUR] update_prestation: {e}")
+                return False, f"Erreur lors de la modification de la prestation: {str(e)}", None
+
+    def delete_prestation(self, prestation_id: int) -> tuple[bool, str]:
+        """
+        Supprime une prestation.
+        Refuse la suppression si des lignes de documents y font référence (la désactiver).
+
+        Args:
+            prestation_id: ID de la prestation à supprimer
+
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        with session_scope() as session:
+            try:
+                prestation = session.get(Prestation, prestation_id)
+
+                if not prestation:
+                    return False, "Prestation introuvable"
+
+                nb_lignes = sum(
+                    session.query(func.count(model.id)).filter(model.prestation_id == prestation_id).scalar()
+                    for model in (FactureLigne, DevisLigne, AvoirLigne)
+                )
+
+                if nb_lignes > 0:
+                    return False, f"Impossible de supprimer: la prestation est utilisée dans {nb_lignes} ligne(s)"
+
+                session.delete(prestation)
+                session.commit()
+                catalogue.invalidate()
+
+                return True, "Prestation supprimée avec succès"
+
+            except Exception as e:
+                session.rollback()
+                print(f"[ERREUR] delete_prestation: {e}")
+                return False, f"Erreur lors de la suppression de la prestation: {str(e)}"
+
+    def toggle_active(self, prestation_id: int) -> tuple[bool, str, bool]:
+        """
+        Active ou désactive une prestation (une prestation inactive n'est plus proposée à la saisie).
+
+        Args:
+            prestation_id: ID de la prestation
+
+        Returns:
+            tuple: (success: bool, message: str, new_status: bool)
+        """
+        with session_scope() as session:
+            try:
+                prestation = session.get(Prestation, prestation_id)
+
+                if not prestation:
+                    return False, "Prestation introuvable", False
+
+                prestation.actif = not prestation.actif
+                session.commit()
+                catalogue.invalidate()
+
+                status_text = "activée" if prestation.actif else "désactivée"
+                return True, f"Prestation {status_text} avec succès", prestation.actif
+
+            except Exception as e:
+                session.rollback()
+                print(f"[ERREUR] toggle_active: {e}")
+                return False, f"Erreur lors du changement de statut: {str(e)}", False
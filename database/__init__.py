@@ -1,6 +1,6 @@
 """
 Gestion de la base de données
 """
-from .init_db import init_database, get_session
+from .init_db import init_database, get_session, session_scope, is_first_run
 
-__all__ = ['init_database', 'get_session']
\ No newline at end of file
+__all__ = ['init_database', 'get_session', 'session_scope', 'is_first_run']
\ No newline at end of file
@@ -0,0 +1,83 @@
+"""
+Index secondaires : création sur les bases existantes et vérification des plans de requête
+"""
+from contextlib import contextmanager
+from sqlalchemy import event, text
+from models import Base
+
+
+def ensure_indexes(engine) -> list[str]:
+    """
+    Crée les index déclarés sur les modèles qui manquent dans la base.
+    create_all ne crée les index qu'avec leur table : les bases créées par
+    une version antérieure ont besoin de ce rattrapage.
+
+    Args:
+        engine: Engine SQLAlchemy
+
+    Returns:
+        list[str]: Noms des index créés
+    """
+    # Lecture directe de sqlite_master : la réflexion SQLAlchemy ignore les index sur expression
+    with engine.connect() as connection:
+        rows = connection.execute(text(
+            "SELECT type, name FROM sqlite_master WHERE type IN ('table', 'index')"
+        )).all()
+
+    existing_tables = {name for kind, name in rows if kind == 'table'}
+    existing_indexes = {name for kind, name in rows if kind == 'index'}
+    created = []
+
+    for table in Base.metadata.sorted_tables:
+        if table.name not in existing_tables:
+            continue
+
+        for index in table.indexes:
+            if index.name not in existing_indexes:
+                index.create(bind=engine)
+                created.append(index.name)
+
+    if created:
+        # Mettre à jour les statistiques utilisées par le planificateur
+        with engine.begin() as connection:
+            connection.execute(text("ANALYZE"))
+
+    return created
+
+
+def query_plan(connection, statement: str, parameters=()) -> list[str]:
+    """
+    Retourne le plan d'exécution SQLite (EXPLAIN QUERY PLAN) d'une requête.
+
+    Args:
+        connection: Connexion SQLAlchemy
+        statement: Requête SQL telle qu'envoyée au driver
+        parameters: Paramètres de la requête
+
+    Returns:
+        list[str]: Étapes du plan (ex: "SEARCH factures USING INDEX ix_factures_client_statut ...")
+    """
+    rows = connection.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+    return [row[-1] for row in rows]
+
+
+@contextmanager
+def capture_statements(engine):
+    """
+    Enregistre les requêtes SELECT exécutées sur l'engine dans le bloc.
+
+    Yields:
+        list[tuple]: (requête, paramètres) dans l'ordre d'exécution
+    """
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+
@@ -1,20 +1,83 @@
 """
 Initialisation et gestion de la base de données SQLite
 """
-from sqlalchemy import create_engine
+from contextlib import contextmanager
+from contextvars import ContextVar
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
-from config import DATABASE_URL, DATABASE_PATH
-from models import Base
+from sqlalchemy.pool import QueuePool
+from config import (
+    DATABASE_URL, DATABASE_PATH, DATABASE_PRAGMAS,
+    DATABASE_POOL_SIZE, DATABASE_MAX_OVERFLOW, DATABASE_POOL_TIMEOUT, SQL_INSTRUMENTATION
+)
+from models import Base, Client, Parametre, Prestation
+from database import search_index
+from database.search_index import ensure_client_search_index
+from database.indexes import ensure_indexes
+from database.revenue_summary import ensure_revenue_summary
+from database.schema import schema_fingerprint, read_schema_version, write_schema_version
+from database.instrumentation import install_instrumentation
 
 
 # Engine global
 engine = None
 SessionLocal = None
 
+# Paramètre enregistré une fois les données de test insérées (voir is_first_run)
+PREMIER_LANCEMENT_CLE = 'premier_lancement_termine'
 
-def init_database():
+# Session de l'unité de travail en cours dans le thread courant (voir session_scope)
+_current_session: ContextVar = ContextVar('current_session', default=None)
+
+# Clé de Session.info : une opération imbriquée a été annulée (voir NestedSession)
+ANNULATION_DEMANDEE = 'annulation_demandee'
+
+
+def create_database_engine(url: str = None, pragmas: dict = None, echo: bool = False):
+    """
+    Crée un engine SQLite avec le profil de l'application : PRAGMA appliqués
+    à chaque connexion et pool de connexions partagé entre les threads.
+
+    Args:
+        url: URL de la base (DATABASE_URL par défaut)
+        pragmas: PRAGMA à appliquer (DATABASE_PRAGMAS par défaut, {} pour aucun)
+        echo: Si True, affiche les requêtes SQL (debug)
+
+    Returns:
+        Engine: Engine SQLAlchemy
+    """
+    if pragmas is None:
+        pragmas = DATABASE_PRAGMAS
+
+    new_engine = create_engine(
+        url or DATABASE_URL,
+        echo=echo,
+        poolclass=QueuePool,
+        pool_size=DATABASE_POOL_SIZE,
+        max_overflow=DATABASE_MAX_OVERFLOW,
+        pool_timeout=DATABASE_POOL_TIMEOUT,
+        connect_args={"check_same_thread": False}  # Connexions partagées entre threads
+    )
+
+    @event.listens_for(new_engine, "connect")
+    def apply_pragmas(dbapi_connection, connection_record):
+        """Applique les PRAGMA à chaque nouvelle connexion SQLite"""
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name} = {value}")
+        cursor.close()
+
+    return new_engine
+
+
+def init_database(url: str = None):
     """
     Initialise la base de données et crée toutes les tables si elles n'existent pas.
+    Les vérifications du schéma sont sautées si l'empreinte enregistrée dans la
+    base correspond au schéma attendu (voir database/schema.py).
+
+    Args:
+        url: URL de la base (DATABASE_URL par défaut ; autre base pour les benchmarks)
 
     Returns:
         bool: True si l'initialisation est réussie
@@ -23,22 +86,33 @@ def init_database():
 
     try:
         # Créer le répertoire database s'il n'existe pas
-        DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
+        if url is None:
+            DATABASE_PATH.parent.mkdir(parents=True, exist_ok=True)
+
+        # Remplacer l'engine d'une initialisation précédente
+        if engine is not None:
+            engine.dispose()
+
+        # Créer l'engine SQLAlchemy (echo=True pour voir toutes les requêtes SQL)
+        engine = create_database_engine(url or DATABASE_URL, echo=False)
+
+        # Requêtes par action, requêtes lentes et N+1 (FACTURATION_SQL_STATS=1)
+        if SQL_INSTRUMENTATION:
+            install_instrumentation(engine)
 
-        # Créer l'engine SQLAlchemy
-        engine = create_engine(
-            DATABASE_URL,
-            echo=False,  # Mettre à True pour voir les requêtes SQL (debug)
-            connect_args={"check_same_thread": False}  # Nécessaire pour SQLite
-        )
+        with engine.connect() as connection:
+            version = read_schema_version(connection)
 
-        # Créer toutes les tables
-        Base.metadata.create_all(bind=engine)
+        if version == schema_fingerprint():
+            # Schéma à jour : FTS5 était disponible lors de l'enregistrement de l'empreinte
+            search_index.fts_available = True
+        else:
+            update_schema(engine)
 
         # Créer la factory de session
         SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-        print(f"[OK] Base de donnees initialisee avec succes : {DATABASE_PATH}")
+        print(f"[OK] Base de donnees initialisee avec succes : {engine.url.database}")
         return True
 
     except Exception as e:
@@ -46,6 +120,52 @@ def init_database():
         return False
 
 
+def update_schema(engine):
+    """
+    Crée ou met à jour le schéma complet (tables, index, FTS, triggers),
+    puis enregistre son empreinte.
+
+    Args:
+        engine: Engine SQLAlchemy
+    """
+    # Créer toutes les tables
+    Base.metadata.create_all(bind=engine)
+
+    # Index ajoutés après la création des tables (bases existantes)
+    created_indexes = ensure_indexes(engine)
+    if created_indexes:
+        print(f"[OK] {len(created_indexes)} index crees : {', '.join(created_indexes)}")
+
+    # Index de recherche plein texte des clients (FTS5)
+    ensure_client_search_index(engine)
+
+    # Tables de synthèse du chiffre d'affaires (maintenues par triggers)
+    if ensure_revenue_summary(engine):
+        print("[OK] Tables de synthese du chiffre d'affaires reconstruites")
+
+    # Sans FTS5, l'empreinte n'est pas enregistrée : la disponibilité est revérifiée à chaque lancement
+    if search_index.fts_available:
+        with engine.begin() as connection:
+            write_schema_version(connection, schema_fingerprint())
+        print("[OK] Schema de la base verifie")
+
+
+def is_first_run() -> bool:
+    """
+    Indique si le premier lancement n'est pas terminé : données de test jamais
+    insérées (paramètre PREMIER_LANCEMENT_CLE absent) dans une base sans client
+    ni prestation. Une base créée par un lancement interrompu avant l'insertion
+    reste donc un premier lancement ; une base déjà utilisée avant ce paramètre n'en est pas un.
+
+    Returns:
+        bool: True tant que les données de test n'ont pas été insérées
+    """
+    with session_scope() as session:
+        if session.query(Parametre.id).filter(Parametre.cle == PREMIER_LANCEMENT_CLE).first() is not None:
+            return False
+        return session.query(Client.id).first() is None and session.query(Prestation.id).first() is None
+
+
 def get_session() -> Session:
     """
     Retourne une nouvelle session de base de données.
@@ -61,6 +181,89 @@ def get_session() -> Session:
     return SessionLocal()
 
 
+class NestedSession:
+    """
+    Session d'un bloc session_scope imbriqué : seul le bloc extérieur valide
+    ou annule l'unité de travail.
+    - commit() envoie les modifications à la base (flush) sans les valider ;
+    - rollback() n'annule rien immédiatement mais interdit la validation de
+      l'unité de travail (le commit du bloc extérieur lève une exception).
+    Les autres attributs sont ceux de la session englobante.
+    """
+
+    def __init__(self, session: Session):
+        self._session = session
+
+    def __getattr__(self, name):
+        return getattr(self._session, name)
+
+    def commit(self):
+        self._session.flush()
+
+    def rollback(self):
+        self._session.info[ANNULATION_DEMANDEE] = True
+
+
+def _refuse_cancelled_commit(session):
+    """Refuse de valider une unité de travail dont une opération imbriquée a été annulée"""
+    if session.info.pop(ANNULATION_DEMANDEE, False):
+        raise RuntimeError("Validation impossible : une opération imbriquée a été annulée")
+
+
+def _forget_cancellation(session, previous_transaction):
+    """L'unité de travail annulée par le bloc extérieur peut repartir de zéro"""
+    session.info.pop(ANNULATION_DEMANDEE, None)
+
+
+@contextmanager
+def session_scope():
+    """
+    Unité de travail : fournit une session courte, fermée à la sortie du bloc.
+
+    Chaque opération d'un contrôleur travaille dans sa propre session : la
+    carte d'identité ne grossit pas au fil de l'utilisation et chaque lecture
+    voit l'état courant de la base. Les objets retournés restent lisibles
+    après la fermeture (expire_on_commit=False : attributs déjà chargés).
+    Un bloc imbriqué (une opération qui en appelle une autre) travaille dans
+    la session englobante au travers d'une NestedSession : ses commit() et
+    rollback() ne valident ni n'annulent l'unité de travail du bloc extérieur.
+    En cas d'exception, les modifications non validées sont annulées.
+
+    Usage :
+        with session_scope() as session:
+            client = session.get(Client, client_id)
+            client.actif = False
+            session.commit()
+
+    Yields:
+        Session: Session SQLAlchemy (NestedSession dans un bloc imbriqué)
+    """
+    session = _current_session.get()
+    if session is not None:
+        nested = NestedSession(session)
+        try:
+            yield nested
+        except Exception:
+            nested.rollback()
+            raise
+        return
+
+    if SessionLocal is None:
+        init_database()
+
+    session = SessionLocal(expire_on_commit=False)
+    event.listen(session, 'before_commit', _refuse_cancelled_commit)
+    event.listen(session, 'after_soft_rollback', _forget_cancellation)
+    token = _current_session.set(session)
+    try:
+        yield session
+    except Exception:
+        session.rollback()
+        raise
+    finally:
+        _current_session.reset(token)
+        session.close()
+
 def get_engine():
     """
     Retourne l'engine SQLAlchemy global.
@@ -0,0 +1,278 @@
+"""
+Instrumentation des requêtes SQL (événements before/after_cursor_execute)
+
+Alternative ciblée à echo=True : les requêtes sont regroupées par action de
+l'interface (sql_action), avec pour chaque action le nombre de requêtes et
+le temps cumulé. Sont signalées :
+- les requêtes plus lentes que SQL_SLOW_QUERY_MS, avec leurs paramètres
+  (affichées et ajoutées à SQL_SLOW_LOG_FILE) ;
+- les N+1 probables : une même forme de requête exécutée au moins
+  SQL_N_PLUS_ONE_SEUIL fois dans une action (ex : statistiques chargées
+  client par client au remplissage du tableau).
+
+Activée au démarrage si SQL_INSTRUMENTATION (variable d'environnement
+FACTURATION_SQL_STATS=1) ; sinon sql_action ne fait rien.
+
+Usage :
+    with sql_action("clients.recherche"):
+        controller.get_clients_page(query)
+"""
+import atexit
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from sqlalchemy import event
+from config import SQL_SLOW_QUERY_MS, SQL_N_PLUS_ONE_SEUIL, SQL_SLOW_LOG_FILE
+
+
+# Listes de paramètres (IN (?, ?, ?)) ramenées à une seule forme quel que soit leur nombre
+PARAMETER_LIST_PATTERN = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
+# Longueur maximale des requêtes et paramètres dans les messages
+MESSAGE_MAX_LENGTH = 300
+
+# Action en cours dans le thread (ou la tâche) courant
+_current_action: ContextVar = ContextVar('sql_action', default=None)
+
+# Instrumentation installée sur l'engine de l'application (None si désactivée)
+instrumentation = None
+
+
+def statement_shape(statement: str) -> str:
+    """
+    Retourne la forme d'une requête : espaces normalisés et listes de
+    paramètres réduites, pour reconnaître une même requête répétée.
+
+    Args:
+        statement: Requête SQL (paramètres liés, '?')
+
+    Returns:
+        str: Forme de la requête
+    """
+    statement = WHITESPACE_PATTERN.sub(' ', statement).strip()
+    return PARAMETER_LIST_PATTERN.sub('(?, ...)', statement)
+
+
+def _shorten(value, max_length: int = MESSAGE_MAX_LENGTH) -> str:
+    """Tronque une requête ou des paramètres pour l'affichage"""
+    text = value if isinstance(value, str) else repr(value)
+    return text if len(text) <= max_length else text[:max_length] + "..."
+
+
+class ActionStats:
+    """Requêtes exécutées pendant une action de l'interface"""
+
+    def __init__(self, nom: str):
+        """
+        Initialise les compteurs.
+
+        Args:
+            nom: Nom de l'action (ex: "clients.recherche")
+        """
+        self.nom = nom
+        self.nb_requetes = 0
+        self.duree_ms = 0.0
+        self.formes: Counter = Counter()
+        self.lentes: list[tuple[float, str, str]] = []
+
+    def record(self, statement: str, duree_ms: float):
+        """Comptabilise une requête exécutée dans l'action"""
+        self.nb_requetes += 1
+        self.duree_ms += duree_ms
+        self.formes[statement_shape(statement)] += 1
+
+    def n_plus_one(self, seuil: int = SQL_N_PLUS_ONE_SEUIL) -> list[tuple[str, int]]:
+        """
+        Retourne les formes de requêtes répétées au moins `seuil` fois.
+
+        Returns:
+            list[tuple[str, int]]: (forme, nombre d'exécutions), la plus répétée en premier
+        """
+        return [(forme, count) for forme, count in self.formes.most_common() if count >= seuil]
+
+
+class SQLInstrumentation:
+    """Collecte des requêtes d'un ou plusieurs engines, par action"""
+
+    def __init__(
+        self,
+        slow_query_ms: float = SQL_SLOW_QUERY_MS,
+        n_plus_one_seuil: int = SQL_N_PLUS_ONE_SEUIL,
+        slow_log_file: Path | None = SQL_SLOW_LOG_FILE,
+        verbose: bool = True
+    ):
+        """
+        Initialise l'instrumentation.
+
+        Args:
+            slow_query_ms: Durée (ms) à partir de laquelle une requête est signalée comme lente
+            n_plus_one_seuil: Répétitions d'une même requête dans une action signalées comme N+1
+            slow_log_file: Fichier où ajouter les requêtes lentes (None pour aucun)
+            verbose: Si True, affiche le bilan de chaque action
+        """
+        self.slow_query_ms = slow_query_ms
+        self.n_plus_one_seuil = n_plus_one_seuil
+        self.slow_log_file = slow_log_file
+        self.verbose = verbose
+
+        # Cumul par action : exécutions, requêtes, durée (ms), N+1 détectés
+        self.totaux: dict[str, dict] = {}
+        self.lock = threading.Lock()
+
+    def install(self, engine):
+        """Attache les événements de l'instrumentation à un engine"""
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def uninstall(self, engine):
+        """Détache les événements de l'instrumentation d'un engine"""
+        event.remove(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.remove(engine, "after_cursor_execute", self._after_cursor_execute)
+
+    def _before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        # Début porté par le contexte d'exécution : rien ne reste sur la connexion si la requête échoue
+        if context is not None:
+            context._sql_start = time.perf_counter()
+
+    def _after_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        start = getattr(context, '_sql_start', None)
+        if start is None:
+            return
+        duree_ms = (time.perf_counter() - start) * 1000
+
+        stats = _current_action.get()
+        if stats is not None:
+            stats.record(statement, duree_ms)
+
+        if duree_ms >= self.slow_query_ms:
+            self._log_slow_query(stats, statement, parameters, duree_ms)
+
+    def _log_slow_query(self, stats: ActionStats | None, statement: str, parameters, duree_ms: float):
+        """Affiche une requête lente et l'ajoute au journal des requêtes lentes"""
+        action = stats.nom if stats else "hors action"
+        statement = WHITESPACE_PATTERN.sub(' ', statement).strip()
+        print(f"[ALERTE] Requete lente ({duree_ms:.0f} ms, {action}) : "
+              f"{_shorten(statement)} | parametres : {_shorten(parameters)}")
+
+        if stats is not None:
+            stats.lentes.append((duree_ms, statement, repr(parameters)))
+
+        if self.slow_log_file is None:
+            return
+        try:
+            with self.lock:
+                self.slow_log_file.parent.mkdir(parents=True, exist_ok=True)
+                with open(self.slow_log_file, 'a', encoding='utf-8') as file:
+                    file.write(f"{datetime.now().isoformat(timespec='seconds')}\t{action}\t{duree_ms:.1f} ms\t"
+                               f"{statement}\t{parameters!r}\n")
+        except OSError as e:
+            print(f"[ERREUR] Journal des requetes lentes: {e}")
+
+    @contextmanager
+    def action(self, nom: str):
+        """
+        Regroupe les requêtes exécutées dans le bloc sous une action.
+        Une action imbriquée est comptée dans l'action englobante.
+
+        Args:
+            nom: Nom de l'action
+
+        Yields:
+            ActionStats: Compteurs de l'action
+        """
+        current = _current_action.get()
+        if current is not None:
+            yield current
+            return
+
+        stats = ActionStats(nom)
+        token = _current_action.set(stats)
+        try:
+            yield stats
+        finally:
+            _current_action.reset(token)
+            self._report(stats)
+
+    def _report(self, stats: ActionStats):
+        """Cumule les compteurs d'une action terminée et signale les N+1"""
+        n_plus_one = stats.n_plus_one(self.n_plus_one_seuil)
+
+        with self.lock:
+            totaux = self.totaux.setdefault(
+                stats.nom, {'executions': 0, 'requetes': 0, 'duree_ms': 0.0, 'n_plus_one': 0}
+            )
+            totaux['executions'] += 1
+            totaux['requetes'] += stats.nb_requetes
+            totaux['duree_ms'] += stats.duree_ms
+            totaux['n_plus_one'] += len(n_plus_one)
+
+        if self.verbose:
+            print(f"[SQL] {stats.nom} : {stats.nb_requetes} requete(s), {stats.duree_ms:.1f} ms")
+        for forme, count in n_plus_one:
+            print(f"[ALERTE] N+1 probable dans '{stats.nom}' : {count} executions de {_shorten(forme)}")
+
+    def summary(self) -> str:
+        """
+        Retourne le bilan cumulé par action, les plus coûteuses en premier.
+
+        Returns:
+            str: Tableau texte (action, exécutions, requêtes, durée, N+1)
+        """
+        with self.lock:
+            totaux = sorted(self.totaux.items(), key=lambda item: item[1]['duree_ms'], reverse=True)
+
+        lines = [f"{'Action':<32} {'Executions':>10} {'Requetes':>9} {'Duree (ms)':>11} {'N+1':>5}"]
+        for nom, total in totaux:
+            lines.append(f"{nom:<32} {total['executions']:>10} {total['requetes']:>9} "
+                         f"{total['duree_ms']:>11.1f} {total['n_plus_one']:>5}")
+        return "\n".join(lines)
+
+
+def install_instrumentation(engine, **options) -> SQLInstrumentation:
+    """
+    Installe l'instrumentation de l'application sur un engine (une seule instance,
+    dont le bilan est affiché à la fermeture de l'application).
+
+    Args:
+        engine: Engine SQLAlchemy
+        **options: Options de SQLInstrumentation (seuils, journal, verbose)
+
+    Returns:
+        SQLInstrumentation: Instrumentation installée
+    """
+    global instrumentation
+
+    if instrumentation is None:
+        instrumentation = SQLInstrumentation(**options)
+        atexit.register(lambda: print(f"\n[INFO] Bilan des requetes SQL\n{instrumentation.summary()}"))
+
+    instrumentation.install(engine)
+    print(f"[INFO] Instrumentation SQL active (requetes lentes >= {instrumentation.slow_query_ms} ms)")
+    return instrumentation
+
+
+@contextmanager
+def sql_action(nom: str):
+    """
+    Regroupe les requêtes du bloc sous une action de l'interface
+    (sans effet si l'instrumentation n'est pas active).
+
+    Args:
+        nom: Nom de l'action (ex: "clients.recherche")
+
+    Yields:
+        ActionStats | None: Compteurs de l'action (None si l'instrumentation est inactive)
+    """
+    if instrumentation is None:
+        yield None
+        return
+
+    with instrumentation.action(nom) as stats:
+        yield stats
+
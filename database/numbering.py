@@ -0,0 +1,127 @@
+"""
+Numérotation des documents (factures, devis, avoirs) sans trou ni doublon
+
+Chaque (type de document, année) a un compteur dans la table sequences_documents.
+L'attribution incrémente ce compteur dans la transaction de la session appelante :
+- la transaction prend le verrou d'écriture SQLite avant toute lecture
+  (BEGIN IMMEDIATE) : les attributions concurrentes (autres fenêtres,
+  traitements par lot) sont sérialisées, et la lecture du compteur ne peut
+  pas porter sur un instantané dépassé (SQLITE_BUSY_SNAPSHOT en WAL) ;
+- si la transaction est annulée, le compteur l'est aussi : pas de trou ;
+- le coût est constant (accès par clé primaire), quel que soit le nombre de documents.
+
+Usage :
+    facture.numero = allocate_number(session, 'facture')
+    session.add(facture)
+    session.commit()  # numéro et facture validés ensemble
+"""
+from datetime import date
+from sqlalchemy import select, update, insert
+from sqlalchemy.orm import Session
+from config import FACTURE_PREFIX, DEVIS_PREFIX, AVOIR_PREFIX, NUMERO_FORMAT
+from models import SequenceDocument, Facture, Devis, Avoir
+
+
+# Préfixe et modèle numéroté par type de document
+DOCUMENT_TYPES = {
+    'facture': (FACTURE_PREFIX, Facture),
+    'devis': (DEVIS_PREFIX, Devis),
+    'avoir': (AVOIR_PREFIX, Avoir),
+}
+
+
+def format_numero(type_document: str, annee: int, numero: int) -> str:
+    """
+    Formate un numéro de document selon NUMERO_FORMAT.
+    Exemple: format_numero('facture', 2025, 1) -> "FACT-2025-001"
+    """
+    prefix, _ = DOCUMENT_TYPES[type_document]
+    return NUMERO_FORMAT.format(prefix=prefix, annee=annee, numero=numero)
+
+
+def _dernier_numero_existant(session: Session, type_document: str, annee: int) -> int:
+    """
+    Dernier numéro déjà utilisé par les documents de l'année (bases antérieures au compteur).
+    Appelé une seule fois par (type, année), à la création du compteur.
+    """
+    prefix, model = DOCUMENT_TYPES[type_document]
+    # Partie fixe du numéro, avant le compteur (ex: "FACT-2025-")
+    debut = NUMERO_FORMAT.split('{numero')[0].format(prefix=prefix, annee=annee)
+
+    numeros = session.execute(
+        select(model.numero).where(model.numero.startswith(debut, autoescape=True))
+    ).scalars()
+
+    suffixes = (numero[len(debut):] for numero in numeros)
+    return max((int(suffixe) for suffixe in suffixes if suffixe.isdigit()), default=0)
+
+
+def _begin_immediate(session: Session):
+    """
+    Ouvre la transaction de la session avec le verrou d'écriture (BEGIN IMMEDIATE),
+    en attendant au besoin (busy_timeout) que l'écriture en cours se termine.
+    Si une transaction est déjà ouverte, elle a écrit (pysqlite n'ouvre une
+    transaction qu'avant une écriture) et détient donc déjà ce verrou.
+    """
+    connection = session.connection()
+    if not connection.connection.driver_connection.in_transaction:
+        connection.exec_driver_sql("BEGIN IMMEDIATE")
+
+
+def reserve_numbers(session: Session, type_document: str, count: int, annee: int = None) -> list[str]:
+    """
+    Réserve un bloc de numéros consécutifs (traitements par lot).
+    Tous les numéros doivent être utilisés dans la même transaction :
+    la numérotation reste sans trou car un rollback libère le bloc entier.
+
+    Args:
+        session: Session dont la transaction recevra les documents
+        type_document: 'facture', 'devis' ou 'avoir'
+        count: Nombre de numéros à réserver
+        annee: Année de numérotation (année en cours par défaut)
+
+    Returns:
+        list[str]: Numéros réservés, dans l'ordre
+    """
+    if type_document not in DOCUMENT_TYPES:
+        raise ValueError(f"Type de document inconnu : {type_document}")
+    if count < 1:
+        raise ValueError("Le nombre de numéros à réserver doit être positif")
+
+    annee = annee or date.today().year
+    cle = (SequenceDocument.type_document == type_document, SequenceDocument.annee == annee)
+
+    # Verrou d'écriture jusqu'à la fin de la transaction, pris avant toute lecture
+    _begin_immediate(session)
+
+    result = session.execute(
+        update(SequenceDocument).where(*cle).values(
+            dernier_numero=SequenceDocument.dernier_numero + count
+        )
+    )
+
+    if result.rowcount:
+        dernier = session.execute(select(SequenceDocument.dernier_numero).where(*cle)).scalar_one()
+    else:
+        # Premier document de l'année : le compteur reprend après les numéros existants
+        dernier = _dernier_numero_existant(session, type_document, annee) + count
+        session.execute(insert(SequenceDocument).values(
+            type_document=type_document, annee=annee, dernier_numero=dernier
+        ))
+
+    return [format_numero(type_document, annee, numero) for numero in range(dernier - count + 1, dernier + 1)]
+
+
+def allocate_number(session: Session, type_document: str, annee: int = None) -> str:
+    """
+    Attribue le prochain numéro d'un type de document.
+
+    Args:
+        session: Session dont la transaction recevra le document
+        type_document: 'facture', 'devis' ou 'avoir'
+        annee: Année de numérotation (année en cours par défaut)
+
+    Returns:
+        str: Numéro attribué (ex: "FACT-2025-042")
+    """
+    return reserve_numbers(session, type_document, 1, annee)[0]
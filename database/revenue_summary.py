@@ -0,0 +1,244 @@
+"""
+Maintenance incrémentale des tables de synthèse du chiffre d'affaires (models/resume.py)
+
+Des triggers SQLite répercutent chaque insertion, modification ou suppression
+de facture, ligne de facture, paiement ou catégorie de prestation sur les
+tables resume_* : le tableau de bord lit quelques dizaines de lignes quel que
+soit l'historique, sans jamais parcourir factures ni factures_lignes.
+"""
+from sqlalchemy import text
+
+
+def _annee(date_sql: str) -> str:
+    return f"CAST(strftime('%Y', {date_sql}) AS INTEGER)"
+
+
+def _mois(date_sql: str) -> str:
+    return f"CAST(strftime('%m', {date_sql}) AS INTEGER)"
+
+
+def _centimes(montant_sql: str) -> str:
+    return f"CAST(ROUND({montant_sql} * 100) AS INTEGER)"
+
+
+_UPSERT_FACTURES = """
+ON CONFLICT (annee, mois, statut) DO UPDATE SET
+    nb_factures = nb_factures + excluded.nb_factures,
+    montant_ht_centimes = montant_ht_centimes + excluded.montant_ht_centimes,
+    montant_paye_centimes = montant_paye_centimes + excluded.montant_paye_centimes"""
+
+_UPSERT_CATEGORIES = """
+ON CONFLICT (annee, mois, statut, categorie) DO UPDATE SET
+    nb_lignes = nb_lignes + excluded.nb_lignes,
+    montant_ht_centimes = montant_ht_centimes + excluded.montant_ht_centimes"""
+
+_UPSERT_ENCAISSEMENTS = """
+ON CONFLICT (annee, mois) DO UPDATE SET
+    nb_paiements = nb_paiements + excluded.nb_paiements,
+    montant_centimes = montant_centimes + excluded.montant_centimes"""
+
+
+def _facture_delta(row: str, sign: str) -> str:
+    """Ajoute (+) ou retire (-) une facture (row = new ou old) de son mois/statut"""
+    paye = f"(SELECT COALESCE(SUM({_centimes('montant')}), 0) FROM paiements WHERE facture_id = {row}.id)"
+    return f"""
+    INSERT INTO resume_factures (annee, mois, statut, nb_factures, montant_ht_centimes, montant_paye_centimes)
+    VALUES (
+        {_annee(f'{row}.date_emission')}, {_mois(f'{row}.date_emission')}, {row}.statut,
+        {sign}1, {sign}{_centimes(f'{row}.montant_total_ht')}, {sign}{paye}
+    ){_UPSERT_FACTURES};"""
+
+
+def _facture_lignes_delta(row: str, sign: str) -> str:
+    """Ajoute ou retire toutes les lignes d'une facture (row = new ou old) de leurs catégories"""
+    return f"""
+    INSERT INTO resume_categories (annee, mois, statut, categorie, nb_lignes, montant_ht_centimes)
+    SELECT {_annee(f'{row}.date_emission')}, {_mois(f'{row}.date_emission')}, {row}.statut,
+           COALESCE(p.categorie, ''), {sign}COUNT(*), {sign}SUM({_centimes('l.montant_total_ligne_ht')})
+    FROM factures_lignes l
+    LEFT JOIN prestations p ON p.id = l.prestation_id
+    WHERE l.facture_id = {row}.id
+    GROUP BY COALESCE(p.categorie, ''){_UPSERT_CATEGORIES};"""
+
+
+def _ligne_delta(row: str, sign: str) -> str:
+    """Ajoute ou retire une ligne de facture (row = new ou old) de sa catégorie"""
+    categorie = f"COALESCE((SELECT categorie FROM prestations WHERE id = {row}.prestation_id), '')"
+    return f"""
+    INSERT INTO resume_categories (annee, mois, statut, categorie, nb_lignes, montant_ht_centimes)
+    SELECT {_annee('f.date_emission')}, {_mois('f.date_emission')}, f.statut,
+           {categorie}, {sign}1, {sign}{_centimes(f'{row}.montant_total_ligne_ht')}
+    FROM factures f
+    WHERE f.id = {row}.facture_id{_UPSERT_CATEGORIES};"""
+
+
+def _paiement_delta(row: str, sign: str) -> str:
+    """Ajoute ou retire un paiement (row = new ou old) des encaissements et de sa facture"""
+    return f"""
+    INSERT INTO resume_encaissements (annee, mois, nb_paiements, montant_centimes)
+    VALUES (
+        {_annee(f'{row}.date_paiement')}, {_mois(f'{row}.date_paiement')},
+        {sign}1, {sign}{_centimes(f'{row}.montant')}
+    ){_UPSERT_ENCAISSEMENTS};
+    INSERT INTO resume_factures (annee, mois, statut, nb_factures, montant_ht_centimes, montant_paye_centimes)
+    SELECT {_annee('f.date_emission')}, {_mois('f.date_emission')}, f.statut,
+           0, 0, {sign}{_centimes(f'{row}.montant')}
+    FROM factures f
+    WHERE f.id = {row}.facture_id{_UPSERT_FACTURES};"""
+
+
+def _prestation_categorie_delta(categorie: str, sign: str) -> str:
+    """Déplace les lignes liées à une prestation dont la catégorie change"""
+    return f"""
+    INSERT INTO resume_categories (annee, mois, statut, categorie, nb_lignes, montant_ht_centimes)
+    SELECT {_annee('f.date_emission')}, {_mois('f.date_emission')}, f.statut,
+           COALESCE({categorie}, ''), {sign}COUNT(*), {sign}SUM({_centimes('l.montant_total_ligne_ht')})
+    FROM factures_lignes l
+    JOIN factures f ON f.id = l.facture_id
+    WHERE l.prestation_id = new.id
+    GROUP BY 1, 2, 3{_UPSERT_CATEGORIES};"""
+
+
+# Triggers par nom (leur présence indique que les tables de synthèse sont à jour)
+REVENUE_SUMMARY_TRIGGERS = {
+    'resume_factures_ai': f"""
+        CREATE TRIGGER resume_factures_ai AFTER INSERT ON factures BEGIN
+            {_facture_delta('new', '+')}
+        END""",
+    'resume_factures_ad': f"""
+        CREATE TRIGGER resume_factures_ad AFTER DELETE ON factures BEGIN
+            {_facture_delta('old', '-')}
+        END""",
+    'resume_factures_au': f"""
+        CREATE TRIGGER resume_factures_au AFTER UPDATE OF date_emission, statut, montant_total_ht ON factures
+        BEGIN
+            {_facture_delta('old', '-')}
+            {_facture_delta('new', '+')}
+        END""",
+    'resume_factures_categories_au': f"""
+        CREATE TRIGGER resume_factures_categories_au AFTER UPDATE OF date_emission, statut ON factures
+        WHEN old.date_emission IS NOT new.date_emission OR old.statut IS NOT new.statut
+        BEGIN
+            {_facture_lignes_delta('old', '-')}
+            {_facture_lignes_delta('new', '+')}
+        END""",
+    'resume_lignes_ai': f"""
+        CREATE TRIGGER resume_lignes_ai AFTER INSERT ON factures_lignes BEGIN
+            {_ligne_delta('new', '+')}
+        END""",
+    'resume_lignes_ad': f"""
+        CREATE TRIGGER resume_lignes_ad AFTER DELETE ON factures_lignes BEGIN
+            {_ligne_delta('old', '-')}
+        END""",
+    'resume_lignes_au': f"""
+        CREATE TRIGGER resume_lignes_au
+        AFTER UPDATE OF facture_id, prestation_id, montant_total_ligne_ht ON factures_lignes
+        BEGIN
+            {_ligne_delta('old', '-')}
+            {_ligne_delta('new', '+')}
+        END""",
+    'resume_paiements_ai': f"""
+        CREATE TRIGGER resume_paiements_ai AFTER INSERT ON paiements BEGIN
+            {_paiement_delta('new', '+')}
+        END""",
+    'resume_paiements_ad': f"""
+        CREATE TRIGGER resume_paiements_ad AFTER DELETE ON paiements BEGIN
+            {_paiement_delta('old', '-')}
+        END""",
+    'resume_paiements_au': f"""
+        CREATE TRIGGER resume_paiements_au AFTER UPDATE OF facture_id, date_paiement, montant ON paiements
+        BEGIN
+            {_paiement_delta('old', '-')}
+            {_paiement_delta('new', '+')}
+        END""",
+    'resume_prestations_au': f"""
+        CREATE TRIGGER resume_prestations_au AFTER UPDATE OF categorie ON prestations
+        WHEN old.categorie IS NOT new.categorie
+        BEGIN
+            {_prestation_categorie_delta('old.categorie', '-')}
+            {_prestation_categorie_delta('new.categorie', '+')}
+        END""",
+}
+
+# Reconstruction complète à partir des tables sources
+REBUILD_STATEMENTS = [
+    "DELETE FROM resume_factures",
+    "DELETE FROM resume_categories",
+    "DELETE FROM resume_encaissements",
+    f"""
+    INSERT INTO resume_factures (annee, mois, statut, nb_factures, montant_ht_centimes, montant_paye_centimes)
+    SELECT {_annee('f.date_emission')}, {_mois('f.date_emission')}, f.statut,
+           COUNT(*), SUM({_centimes('f.montant_total_ht')}), SUM(COALESCE(p.paye, 0))
+    FROM factures f
+    LEFT JOIN (
+        SELECT facture_id, SUM({_centimes('montant')}) AS paye FROM paiements GROUP BY facture_id
+    ) p ON p.facture_id = f.id
+    GROUP BY 1, 2, 3
+    """,
+    f"""
+    INSERT INTO resume_categories (annee, mois, statut, categorie, nb_lignes, montant_ht_centimes)
+    SELECT {_annee('f.date_emission')}, {_mois('f.date_emission')}, f.statut,
+           COALESCE(p.categorie, ''), COUNT(*), SUM({_centimes('l.montant_total_ligne_ht')})
+    FROM factures_lignes l
+    JOIN factures f ON f.id = l.facture_id
+    LEFT JOIN prestations p ON p.id = l.prestation_id
+    GROUP BY 1, 2, 3, 4
+    """,
+    f"""
+    INSERT INTO resume_encaissements (annee, mois, nb_paiements, montant_centimes)
+    SELECT {_annee('date_paiement')}, {_mois('date_paiement')}, COUNT(*), SUM({_centimes('montant')})
+    FROM paiements
+    GROUP BY 1, 2
+    """,
+]
+
+
+def rebuild_revenue_summary(connection):
+    """
+    Recalcule entièrement les tables de synthèse (parcours complet des tables sources).
+
+    Args:
+        connection: Connexion SQLAlchemy dans une transaction
+    """
+    for statement in REBUILD_STATEMENTS:
+        connection.execute(text(statement))
+
+
+def _normalize_ddl(ddl: str | None) -> str | None:
+    """Définition d'un trigger sans les différences d'espacement"""
+    return ' '.join(ddl.split()) if ddl else None
+
+
+def ensure_revenue_summary(engine) -> bool:
+    """
+    Installe les triggers de maintenance des tables de synthèse s'ils manquent
+    ou si leur définition a changé. Lors de l'installation, les tables sont
+    reconstruites à partir de l'existant.
+
+    Args:
+        engine: Engine SQLAlchemy
+
+    Returns:
+        bool: True si les triggers viennent d'être installés (tables reconstruites)
+    """
+    with engine.begin() as connection:
+        existing = dict(connection.execute(text(
+            "SELECT name, sql FROM sqlite_master WHERE type = 'trigger' AND name LIKE 'resume_%'"
+        )).all())
+        # SQLite conserve le texte du CREATE TRIGGER : une définition modifiée est détectée
+        outdated = [
+            name for name, ddl in REVENUE_SUMMARY_TRIGGERS.items()
+            if _normalize_ddl(existing.get(name)) != _normalize_ddl(ddl)
+        ]
+        if not outdated:
+            return False
+
+        # Réinstaller l'ensemble pour repartir d'un état cohérent
+        for name in existing:
+            connection.execute(text(f"DROP TRIGGER IF EXISTS {name}"))
+        for ddl in REVENUE_SUMMARY_TRIGGERS.values():
+            connection.execute(text(ddl))
+
+        rebuild_revenue_summary(connection)
+
+    return True
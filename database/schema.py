@@ -0,0 +1,59 @@
+"""
+Empreinte du schéma de la base (tables, index, recherche plein texte, triggers)
+
+Après une initialisation complète, l'empreinte du schéma attendu par le code
+est enregistrée dans PRAGMA user_version (lu sans accès aux tables). Aux
+démarrages suivants, si elle correspond, les vérifications du schéma
+(create_all, index, FTS, triggers) sont sautées. Toute modification d'un
+modèle ou d'un DDL change l'empreinte et relance les vérifications une fois.
+
+Une base vierge a un user_version à 0 : c'est le marqueur du premier lancement.
+"""
+import hashlib
+from functools import lru_cache
+from sqlalchemy import text, UniqueConstraint, CheckConstraint
+from models import Base
+from database.search_index import CREATE_CLIENTS_FTS, CLIENTS_FTS_TRIGGERS
+from database.revenue_summary import REVENUE_SUMMARY_TRIGGERS
+
+
+@lru_cache(maxsize=1)
+def schema_fingerprint() -> int:
+    """
+    Calcule l'empreinte du schéma attendu (modèles, index, FTS et triggers).
+    Les modèles sont décrits à partir des métadonnées, sans compiler leur DDL
+    (la compilation coûterait plus cher que les vérifications qu'elle évite).
+
+    Returns:
+        int: Empreinte sur 31 bits, jamais nulle (PRAGMA user_version est un entier signé 32 bits)
+    """
+    parts = []
+    for table in Base.metadata.sorted_tables:
+        parts.append(f"table {table.name}")
+        for column in table.columns:
+            foreign_keys = sorted(fk.target_fullname for fk in column.foreign_keys)
+            parts.append(
+                f"{column.name} {column.type!r} pk={column.primary_key} null={column.nullable} "
+                f"unique={column.unique} fk={foreign_keys} default={column.server_default!r}"
+            )
+        for constraint in sorted(table.constraints, key=lambda constraint: str(constraint.name)):
+            if isinstance(constraint, (UniqueConstraint, CheckConstraint)):
+                parts.append(f"{type(constraint).__name__} {constraint.name} "
+                             f"{getattr(constraint, 'sqltext', '')} {sorted(constraint.columns.keys())}")
+        for index in sorted(table.indexes, key=lambda index: index.name):
+            parts.append(f"index {index.name} unique={index.unique} {[str(expr) for expr in index.expressions]}")
+
+    parts += [CREATE_CLIENTS_FTS, *CLIENTS_FTS_TRIGGERS, *REVENUE_SUMMARY_TRIGGERS.values()]
+
+    digest = hashlib.sha256('\n'.join(parts).encode('utf-8')).digest()
+    return int.from_bytes(digest[:4], 'big') & 0x7FFFFFFF or 1
+
+
+def read_schema_version(connection) -> int:
+    """Retourne l'empreinte enregistrée dans la base (0 pour une base vierge)"""
+    return connection.execute(text("PRAGMA user_version")).scalar() or 0
+
+
+def write_schema_version(connection, version: int):
+    """Enregistre l'empreinte du schéma dans la base"""
+    connection.execute(text(f"PRAGMA user_version = {int(version)}"))
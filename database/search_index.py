@@ -0,0 +1,133 @@
+"""
+Index de recherche plein texte (SQLite FTS5) sur les clients
+"""
+import re
+from sqlalchemy import text, select, table, column
+from sqlalchemy.exc import OperationalError
+
+
+# Colonnes de la table clients indexées (dans l'ordre de la table FTS)
+CLIENTS_FTS_COLUMNS = ('nom', 'prenom', 'raison_sociale', 'email', 'siret')
+
+# Poids BM25 par colonne : le nom et la raison sociale comptent le plus
+CLIENTS_FTS_WEIGHTS = (10.0, 5.0, 10.0, 2.0, 1.0)
+
+# Table FTS5 "external content" : le texte reste dans clients, seul l'index est stocké.
+# remove_diacritics 2 : "Hélène" est indexé comme "helene" (recherche sans accents).
+CREATE_CLIENTS_FTS = f"""
+CREATE VIRTUAL TABLE clients_fts USING fts5(
+    {', '.join(CLIENTS_FTS_COLUMNS)},
+    content='clients',
+    content_rowid='id',
+    tokenize='unicode61 remove_diacritics 2',
+    prefix='2 3'
+)
+"""
+
+_new_values = ', '.join(f"new.{name}" for name in CLIENTS_FTS_COLUMNS)
+_old_values = ', '.join(f"old.{name}" for name in CLIENTS_FTS_COLUMNS)
+_columns = ', '.join(CLIENTS_FTS_COLUMNS)
+
+# Triggers maintenant l'index synchronisé avec la table clients
+CLIENTS_FTS_TRIGGERS = [
+    f"""
+    CREATE TRIGGER IF NOT EXISTS clients_fts_ai AFTER INSERT ON clients BEGIN
+        INSERT INTO clients_fts(rowid, {_columns}) VALUES (new.id, {_new_values});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS clients_fts_ad AFTER DELETE ON clients BEGIN
+        INSERT INTO clients_fts(clients_fts, rowid, {_columns}) VALUES ('delete', old.id, {_old_values});
+    END
+    """,
+    f"""
+    CREATE TRIGGER IF NOT EXISTS clients_fts_au AFTER UPDATE OF {_columns} ON clients BEGIN
+        INSERT INTO clients_fts(clients_fts, rowid, {_columns}) VALUES ('delete', old.id, {_old_values});
+        INSERT INTO clients_fts(rowid, {_columns}) VALUES (new.id, {_new_values});
+    END
+    """,
+]
+
+# Construction légère de la table FTS pour les requêtes (hors metadata des modèles)
+clients_fts = table('clients_fts', column('rowid'), column('rank'))
+
+# Disponibilité de FTS5 (déterminée par ensure_client_search_index)
+fts_available = False
+
+
+def ensure_client_search_index(engine) -> bool:
+    """
+    Crée l'index FTS5 des clients et ses triggers s'ils n'existent pas,
+    puis le remplit à partir des clients existants.
+
+    Args:
+        engine: Engine SQLAlchemy
+
+    Returns:
+        bool: True si l'index est disponible (False si SQLite est compilé sans FTS5)
+    """
+    global fts_available
+
+    try:
+        with engine.begin() as connection:
+            exists = connection.execute(text(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'clients_fts'"
+            )).first()
+
+            if not exists:
+                connection.execute(text(CREATE_CLIENTS_FTS))
+                weights = ', '.join(str(weight) for weight in CLIENTS_FTS_WEIGHTS)
+                connection.execute(text(
+                    f"INSERT INTO clients_fts(clients_fts, rank) VALUES ('rank', 'bm25({weights})')"
+                ))
+                connection.execute(text("INSERT INTO clients_fts(clients_fts) VALUES ('rebuild')"))
+
+            for trigger in CLIENTS_FTS_TRIGGERS:
+                connection.execute(text(trigger))
+
+        fts_available = True
+
+    except OperationalError as e:
+        print(f"[INFO] Recherche plein texte indisponible (FTS5) : {e}")
+        fts_available = False
+
+    return fts_available
+
+
+def build_fts_query(search: str) -> str | None:
+    """
+    Convertit une saisie utilisateur en requête FTS5 par préfixes.
+    Exemple: "hél dup" -> '"hél"* "dup"*' (tous les termes doivent correspondre)
+
+    Args:
+        search: Texte saisi
+
+    Returns:
+        str | None: Requête MATCH, ou None si la saisie ne contient aucun terme
+    """
+    # Un SIRET saisi avec espaces ou tirets est recherché comme un seul terme
+    compact = re.sub(r'[\s-]', '', search)
+    if compact.isdigit():
+        return f'"{compact}"*'
+
+    terms = re.findall(r'\w+', search)
+    if not terms:
+        return None
+
+    return ' '.join(f'"{term}"*' for term in terms)
+
+
+def client_search_subquery(fts_query: str):
+    """
+    Retourne une sous-requête (id, rank) des clients correspondant à la requête FTS5.
+    Un rank plus petit correspond à un meilleur résultat.
+
+    Args:
+        fts_query: Requête MATCH (voir build_fts_query)
+    """
+    return select(
+        clients_fts.c.rowid.label('id'),
+        clients_fts.c.rank.label('rank')
+    ).where(
+        text("clients_fts MATCH :fts_query").bindparams(fts_query=fts_query)
+    ).subquery('clients_fts_match')
@@ -1,7 +1,7 @@
 """
 Script pour initialiser la base de données avec des données de test
 """
-from database.init_db import get_session
+from database.init_db import get_session, is_first_run, PREMIER_LANCEMENT_CLE
 from models import Client, Prestation
 
 
@@ -44,7 +44,7 @@ def seed_clients():
         {
             'type': 'entreprise',
             'raison_sociale': 'FitnessPro Lyon',
-            'siret': '12345678901234',
+            'siret': '12345678901237',
             'adresse': '45 Boulevard Jean Jaurès',
             'code_postal': '69003',
             'ville': 'Lyon',
@@ -68,7 +68,7 @@ def seed_clients():
         {
             'type': 'entreprise',
             'raison_sociale': 'Wellness Center Paris',
-            'siret': '98765432109876',
+            'siret': '98765432109875',
             'adresse': '78 Rue de Rivoli',
             'code_postal': '75004',
             'ville': 'Paris',
@@ -247,5 +247,25 @@ def seed_all():
     print("\n=== Donnees de test inserees avec succes ===\n")
 
 
+def seed_first_run() -> bool:
+    """
+    Insère les données de test au premier lancement (voir is_first_run), puis
+    l'enregistre dans les paramètres. Si l'insertion échoue ou n'a pas lieu
+    (application fermée avant), elle est refaite au lancement suivant.
+
+    Returns:
+        bool: True si les données de test ont été insérées
+    """
+    if not is_first_run():
+        return False
+
+    from utils.settings import settings
+    seed_all()
+    success, message = settings.set(PREMIER_LANCEMENT_CLE, True)
+    if not success:
+        print(f"[ERREUR] seed_first_run: {message}")
+    return True
+
+
 if __name__ == "__main__":
     seed_all()
\ No newline at end of file
@@ -1,49 +1,16 @@
 """
-Point d'entrée de l'application Facturation Coach Pro
-"""
-import sys
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import Qt
-from config import init_directories
-from database import init_database
-from views import MainWindow
-
-
-def main():
-    """Fonction principale de l'application"""
-    # Initialiser les répertoires nécessaires
-    init_directories()
-    print("[OK] Repertoires initialises")
-
-    # Initialiser la base de données
-    if not init_database():
-        print("[ERREUR] Echec de l'initialisation de la base de donnees")
-        sys.exit(1)
-
-    # Charger les données de test au premier lancement
-    from database.seed_data import seed_all
-    try:
-        seed_all()
-    except Exception as e:
-        print(f"[INFO] Donnees de test: {e}")
+Point d'entrée de l'application Facturation Coach Pro (voir application.py)
 
-    # Créer l'application Qt
-    app = QApplication(sys.argv)
+Les processus de génération PDF par lot (utils/pdf_batch.py, démarrage "spawn")
+réimportent ce module sous le nom __mp_main__ : il n'importe rien en dehors du
+bloc principal, ni Qt ni la séquence de démarrage.
 
-    # Configurer l'application
-    app.setApplicationName("Facturation Coach Pro")
-    app.setOrganizationName("Coach Pro")
-
-    # Créer et afficher la fenêtre principale
-    window = MainWindow()
-    window.show()
-
-    print("\n[OK] Application lancee avec succes!")
-    print("[INFO] Interface prête a l'utilisation\n")
-
-    # Lancer la boucle d'événements
-    sys.exit(app.exec())
+Options :
+    --mesure-demarrage : quitte dès le premier affichage de la fenêtre
+                         (mesure du temps de démarrage, voir benchmarks/bench_startup.py)
+"""
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    from application import main
+    main()
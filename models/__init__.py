@@ -9,6 +9,8 @@ from .facture import Facture, FactureLigne
 from .paiement import Paiement
 from .avoir import Avoir, AvoirLigne
 from .parametre import Parametre
+from .resume import ResumeFactures, ResumeCategories, ResumeEncaissements
+from .sequence import SequenceDocument
 
 __all__ = [
     'Base',
@@ -21,5 +23,9 @@ __all__ = [
     'Paiement',
     'Avoir',
     'AvoirLigne',
-    'Parametre'
+    'Parametre',
+    'ResumeFactures',
+    'ResumeCategories',
+    'ResumeEncaissements',
+    'SequenceDocument'
 ]
\ No newline at end of file
@@ -18,11 +18,11 @@ class Avoir(Base):
     numero = Column(String(50), unique=True, nullable=False)
 
     # Relation avec la facture d'origine
-    facture_id = Column(Integer, ForeignKey('factures.id'), nullable=False)
+    facture_id = Column(Integer, ForeignKey('factures.id'), nullable=False, index=True)
     facture = relationship('Facture', back_populates='avoirs')
 
     # Date d'émission
-    date_emission = Column(Date, nullable=False)
+    date_emission = Column(Date, nullable=False, index=True)
 
     # Montant total (négatif)
     montant_total = Column(Numeric(10, 2), nullable=False)
@@ -49,11 +49,11 @@ class AvoirLigne(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
 
     # Relation avec l'avoir
-    avoir_id = Column(Integer, ForeignKey('avoirs.id'), nullable=False)
+    avoir_id = Column(Integer, ForeignKey('avoirs.id'), nullable=False, index=True)
     avoir = relationship('Avoir', back_populates='lignes')
 
     # Référence optionnelle à une prestation
-    prestation_id = Column(Integer, ForeignKey('prestations.id'), nullable=True)
+    prestation_id = Column(Integer, ForeignKey('prestations.id'), nullable=True, index=True)
 
     # Informations de la ligne
     libelle = Column(String(200), nullable=False)
@@ -2,7 +2,8 @@
 Modèle Client
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, Index, case, func, literal_column
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from .base import Base
 
@@ -61,6 +62,32 @@ class Client(Base):
         else:
             return f"{self.prenom or ''} {self.nom}".strip()
 
+    @hybrid_property
+    def nom_tri(self):
+        """Clé de tri principale : nom (particulier) ou raison sociale (entreprise), jamais NULL"""
+        if self.type == 'entreprise':
+            return self.raison_sociale or ''
+        return self.nom or ''
+
+    @nom_tri.inplace.expression
+    @classmethod
+    def _nom_tri_expression(cls):
+        # Littéraux inline (pas de paramètres liés) pour correspondre à l'index ix_clients_tri
+        return case(
+            (cls.type == literal_column("'entreprise'"), func.coalesce(cls.raison_sociale, literal_column("''"))),
+            else_=func.coalesce(cls.nom, literal_column("''"))
+        )
+
+    @hybrid_property
+    def prenom_tri(self):
+        """Clé de tri secondaire (prénom), jamais NULL"""
+        return self.prenom or ''
+
+    @prenom_tri.inplace.expression
+    @classmethod
+    def _prenom_tri_expression(cls):
+        return func.coalesce(cls.prenom, literal_column("''"))
+
     @property
     def adresse_complete(self):
         """Retourne l'adresse complète formatée"""
@@ -69,4 +96,7 @@ class Client(Base):
             parties.append(self.adresse)
         if self.code_postal and self.ville:
             parties.append(f"{self.code_postal} {self.ville}")
-        return '\n'.join(parties)
\ No newline at end of file
+        return '\n'.join(parties)
+
+# Index de la clé de tri des listes paginées (pagination par clé, voir ClientController.get_clients_page)
+Index('ix_clients_tri', Client.nom_tri, Client.prenom_tri, Client.id)
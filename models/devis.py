@@ -18,7 +18,7 @@ class Devis(Base):
     numero = Column(String(50), unique=True, nullable=False)
 
     # Relation avec le client
-    client_id = Column(Integer, ForeignKey('clients.id'), nullable=False)
+    client_id = Column(Integer, ForeignKey('clients.id'), nullable=False, index=True)
     client = relationship('Client', back_populates='devis')
 
     # Dates
@@ -56,11 +56,11 @@ class DevisLigne(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
 
     # Relation avec le devis
-    devis_id = Column(Integer, ForeignKey('devis.id'), nullable=False)
+    devis_id = Column(Integer, ForeignKey('devis.id'), nullable=False, index=True)
     devis = relationship('Devis', back_populates='lignes')
 
     # Référence optionnelle à une prestation du catalogue
-    prestation_id = Column(Integer, ForeignKey('prestations.id'), nullable=True)
+    prestation_id = Column(Integer, ForeignKey('prestations.id'), nullable=True, index=True)
 
     # Informations de la ligne
     libelle = Column(String(200), nullable=False)
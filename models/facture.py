@@ -2,14 +2,25 @@
 Modèles Facture et FactureLigne
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Numeric, DateTime, Text, ForeignKey, Date
+from decimal import Decimal
+from sqlalchemy import Column, Integer, String, Numeric, DateTime, Text, ForeignKey, Date, Index, select, func
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.orm import relationship
 from .base import Base
+from .paiement import Paiement
 
 
 class Facture(Base):
     """Modèle représentant une facture"""
     __tablename__ = 'factures'
+    __table_args__ = (
+        # Statistiques et listes par client (filtrées par statut)
+        Index('ix_factures_client_statut', 'client_id', 'statut'),
+        # Factures en attente / en retard par échéance
+        Index('ix_factures_statut_echeance', 'statut', 'date_echeance'),
+        # Tableau de bord et exports par période
+        Index('ix_factures_date_emission', 'date_emission'),
+    )
 
     # Clé primaire
     id = Column(Integer, primary_key=True, autoincrement=True)
@@ -22,7 +33,7 @@ class Facture(Base):
     client = relationship('Client', back_populates='factures')
 
     # Référence optionnelle au devis d'origine
-    devis_id = Column(Integer, ForeignKey('devis.id'), nullable=True)
+    devis_id = Column(Integer, ForeignKey('devis.id'), nullable=True, index=True)
     devis = relationship('Devis', back_populates='factures')
 
     # Dates
@@ -58,15 +69,47 @@ class Facture(Base):
         """Représentation textuelle de la facture"""
         return f"<Facture(id={self.id}, numero='{self.numero}', montant={self.montant_total_ht}€)>"
 
-    @property
-    def montant_paye(self):
-        """Calcule le montant total payé pour cette facture"""
-        return sum(p.montant for p in self.paiements)
-
-    @property
-    def montant_restant(self):
-        """Calcule le montant restant à payer"""
-        return float(self.montant_total_ht) - float(self.montant_paye)
+    @hybrid_property
+    def montant_paye(self) -> Decimal:
+        """
+        Calcule le montant total payé pour cette facture (Decimal).
+
+        Utilisable aussi en SQL (sous-requête corrélée), pour lister sans
+        charger les paiements facture par facture :
+            session.query(Facture, Facture.montant_paye)
+        """
+        return sum((p.montant for p in self.paiements), Decimal('0.00'))
+
+    @montant_paye.inplace.expression
+    @classmethod
+    def _montant_paye_expression(cls):
+        # SQLite calcule en flottant : arrondi au centime pour des comparaisons exactes
+        return (
+            select(func.round(
+                func.coalesce(func.sum(Paiement.montant), 0), 2, type_=Numeric(10, 2)
+            ))
+            .where(Paiement.facture_id == cls.id)
+            .correlate_except(Paiement)
+            .scalar_subquery()
+            .label('montant_paye')
+        )
+
+    @hybrid_property
+    def montant_restant(self) -> Decimal:
+        """
+        Calcule le montant restant à payer (Decimal).
+
+        Utilisable aussi en SQL, par exemple pour filtrer les impayés :
+            session.query(Facture).filter(Facture.montant_restant > 100)
+        """
+        return (self.montant_total_ht or Decimal('0.00')) - self.montant_paye
+
+    @montant_restant.inplace.expression
+    @classmethod
+    def _montant_restant_expression(cls):
+        return func.round(
+            cls.montant_total_ht - cls.montant_paye, 2, type_=Numeric(10, 2)
+        ).label('montant_restant')
 
 
 class FactureLigne(Base):
@@ -77,11 +120,11 @@ class FactureLigne(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
 
     # Relation avec la facture
-    facture_id = Column(Integer, ForeignKey('factures.id'), nullable=False)
+    facture_id = Column(Integer, ForeignKey('factures.id'), nullable=False, index=True)
     facture = relationship('Facture', back_populates='lignes')
 
     # Référence optionnelle à une prestation du catalogue
-    prestation_id = Column(Integer, ForeignKey('prestations.id'), nullable=True)
+    prestation_id = Column(Integer, ForeignKey('prestations.id'), nullable=True, index=True)
 
     # Informations de la ligne
     libelle = Column(String(200), nullable=False)
@@ -15,11 +15,11 @@ class Paiement(Base):
     id = Column(Integer, primary_key=True, autoincrement=True)
 
     # Relation avec la facture
-    facture_id = Column(Integer, ForeignKey('factures.id'), nullable=False)
+    facture_id = Column(Integer, ForeignKey('factures.id'), nullable=False, index=True)
     facture = relationship('Facture', back_populates='paiements')
 
     # Informations du paiement
-    date_paiement = Column(Date, nullable=False)
+    date_paiement = Column(Date, nullable=False, index=True)
     montant = Column(Numeric(10, 2), nullable=False)
     moyen_paiement = Column(String(50), nullable=False)  # 'especes', 'cheque', 'virement', etc.
     reference = Column(String(100))  # Numéro de chèque, référence virement, etc.
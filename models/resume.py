@@ -0,0 +1,59 @@
+"""
+Modèles des tables de synthèse du chiffre d'affaires (tableau de bord)
+
+Ces tables sont maintenues par des triggers SQLite (voir database/revenue_summary.py) :
+elles ne doivent pas être modifiées par l'application.
+Les montants sont stockés en centimes (entiers) pour que les mises à jour
+incrémentales restent exactes.
+"""
+from sqlalchemy import Column, Integer, String
+from .base import Base
+
+
+class ResumeFactures(Base):
+    """Factures par mois d'émission et par statut"""
+    __tablename__ = 'resume_factures'
+
+    annee = Column(Integer, primary_key=True)
+    mois = Column(Integer, primary_key=True)
+    statut = Column(String(30), primary_key=True)
+
+    nb_factures = Column(Integer, nullable=False, default=0)
+    montant_ht_centimes = Column(Integer, nullable=False, default=0)
+    montant_paye_centimes = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        """Représentation textuelle de la ligne de synthèse"""
+        return f"<ResumeFactures({self.annee}-{self.mois:02d}, statut='{self.statut}', nb={self.nb_factures})>"
+
+
+class ResumeCategories(Base):
+    """Lignes de factures par mois d'émission, statut de la facture et catégorie de prestation"""
+    __tablename__ = 'resume_categories'
+
+    annee = Column(Integer, primary_key=True)
+    mois = Column(Integer, primary_key=True)
+    statut = Column(String(30), primary_key=True)
+    categorie = Column(String(100), primary_key=True)  # '' si la ligne n'est pas liée au catalogue
+
+    nb_lignes = Column(Integer, nullable=False, default=0)
+    montant_ht_centimes = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        """Représentation textuelle de la ligne de synthèse"""
+        return f"<ResumeCategories({self.annee}-{self.mois:02d}, categorie='{self.categorie}')>"
+
+
+class ResumeEncaissements(Base):
+    """Paiements reçus par mois d'encaissement"""
+    __tablename__ = 'resume_encaissements'
+
+    annee = Column(Integer, primary_key=True)
+    mois = Column(Integer, primary_key=True)
+
+    nb_paiements = Column(Integer, nullable=False, default=0)
+    montant_centimes = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        """Représentation textuelle de la ligne de synthèse"""
+        return f"<ResumeEncaissements({self.annee}-{self.mois:02d}, montant={self.montant_centimes / 100}€)>"
@@ -0,0 +1,24 @@
+"""
+Modèle SequenceDocument (compteurs de numérotation des documents)
+"""
+from sqlalchemy import Column, Integer, String
+from .base import Base
+
+
+class SequenceDocument(Base):
+    """
+    Compteur de numérotation par type de document et par année.
+    Modifié uniquement par database/numbering.py, dans la transaction du document numéroté.
+    """
+    __tablename__ = 'sequences_documents'
+
+    # Clé primaire composite : un compteur par (type de document, année)
+    type_document = Column(String(20), primary_key=True)  # 'facture', 'devis', 'avoir'
+    annee = Column(Integer, primary_key=True)
+
+    # Dernier numéro attribué (0 si aucun)
+    dernier_numero = Column(Integer, nullable=False, default=0)
+
+    def __repr__(self):
+        """Représentation textuelle du compteur"""
+        return f"<SequenceDocument(type='{self.type_document}', annee={self.annee}, dernier={self.dernier_numero})>"
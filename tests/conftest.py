@@ -0,0 +1,41 @@
+"""
+Fixtures communes des tests : base SQLite en mémoire avec le schéma complet
+(tables, index, recherche plein texte, triggers des tables de synthèse)
+"""
+import pytest
+from sqlalchemy import create_engine, event
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from database import init_db
+
+
+@pytest.fixture
+def db(monkeypatch):
+    """
+    Engine d'une base en mémoire, installé comme base de l'application
+    (init_db.engine, session_scope et get_session l'utilisent pendant le test).
+
+    Yields:
+        Engine: Engine SQLAlchemy
+    """
+    # Une seule connexion partagée : chaque connexion à ":memory:" ouvrirait une base vide
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+
+    @event.listens_for(engine, "connect")
+    def enable_foreign_keys(dbapi_connection, connection_record):
+        dbapi_connection.execute("PRAGMA foreign_keys = ON")
+
+    init_db.update_schema(engine)
+    monkeypatch.setattr(init_db, 'engine', engine)
+    monkeypatch.setattr(init_db, 'SessionLocal', sessionmaker(autocommit=False, autoflush=False, bind=engine))
+
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def session(db):
+    """Session sur la base de test, fermée à la fin du test"""
+    session = init_db.SessionLocal()
+    yield session
+    session.close()
@@ -0,0 +1,144 @@
+"""
+Tests de la sauvegarde incrémentale et de la restauration (utils/backup.py)
+"""
+import hashlib
+import os
+import sqlite3
+import pytest
+from utils.backup import BackupManager
+
+
+@pytest.fixture
+def manager(tmp_path):
+    """Gestionnaire sur une base et un dossier de documents temporaires"""
+    database_path = tmp_path / "facturation.db"
+    connection = sqlite3.connect(database_path)
+    connection.execute("CREATE TABLE clients (id INTEGER PRIMARY KEY, nom TEXT)")
+    connection.execute("INSERT INTO clients (nom) VALUES ('Martin')")
+    connection.commit()
+    connection.close()
+
+    documents_dir = tmp_path / "documents"
+    (documents_dir / "factures").mkdir(parents=True)
+    (documents_dir / "factures" / "FACT-2025-001.pdf").write_bytes(b"%PDF facture 1")
+    (documents_dir / "factures" / "FACT-2025-002.pdf").write_bytes(b"%PDF facture 2")
+
+    return BackupManager(tmp_path / "backups", database_path, documents_dir)
+
+
+def test_backup_and_restore(manager, tmp_path):
+    """Une sauvegarde restaurée redonne la base et les documents à l'identique"""
+    manifest = manager.create_backup()
+    assert manifest['stats']['documents'] == 2
+    assert manager.verify(manifest['name']) == []
+
+    restore_dir = tmp_path / "restauration"
+    errors = manager.restore(manifest['name'], restore_dir / "facturation.db", restore_dir / "documents")
+
+    assert errors == []
+    assert (restore_dir / "documents" / "factures" / "FACT-2025-001.pdf").read_bytes() == b"%PDF facture 1"
+    connection = sqlite3.connect(restore_dir / "facturation.db")
+    assert connection.execute("SELECT nom FROM clients").fetchall() == [('Martin',)]
+    connection.close()
+
+
+def test_unchanged_documents_are_not_copied(manager):
+    """Les documents inchangés ne sont ni relus ni recopiés à la sauvegarde suivante"""
+    manager.create_backup()
+    manifest = manager.create_backup()
+
+    assert manifest['stats']['relus'] == 0
+    assert manifest['stats']['copies'] == 0
+
+
+def test_missing_object_is_stored_with_current_content(manager, tmp_path):
+    """
+    Contenu absent du stockage et fichier modifié sans changer de taille ni de date :
+    le manifeste doit pointer vers le contenu réellement sauvegardé.
+    """
+    first = manager.create_backup()
+    path = manager.documents_dir / "factures" / "FACT-2025-001.pdf"
+    stat = path.stat()
+
+    old_sha256 = next(entry['sha256'] for entry in first['documents'] if entry['path'].endswith("001.pdf"))
+    manager._object_path(old_sha256).unlink()
+    path.write_bytes(b"%PDF facture X")
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+
+    second = manager.create_backup()
+    entry = next(entry for entry in second['documents'] if entry['path'].endswith("001.pdf"))
+
+    assert entry['sha256'] == hashlib.sha256(b"%PDF facture X").hexdigest()
+    assert manager.verify(second['name']) == []
+
+    restore_dir = tmp_path / "restauration"
+    assert manager.restore(second['name'], restore_dir / "facturation.db", restore_dir / "documents") == []
+    assert (restore_dir / "documents" / "factures" / "FACT-2025-001.pdf").read_bytes() == b"%PDF facture X"
+
+
+def test_backups_in_same_second_have_distinct_manifests(manager):
+    """Deux sauvegardes du même type rapprochées ne s'écrasent pas"""
+    names = [manager.create_backup('daily')['name'] for _ in range(3)]
+
+    assert len(set(names)) == 3
+    assert [snapshot['name'] for snapshot in manager.list_snapshots()] == names
+
+
+def test_prune_keeps_manual_backups(manager):
+    """La rétention supprime les sauvegardes quotidiennes en trop, pas les manuelles"""
+    manual = manager.create_backup('manual')['name']
+    for _ in range(3):
+        manager.create_backup('daily')
+
+    manager.prune(keep_daily=1, keep_weekly=1)
+
+    kinds = [snapshot['kind'] for snapshot in manager.list_snapshots()]
+    assert kinds == ['manual', 'daily']
+    assert manager.list_snapshots()[0]['name'] == manual
+
+
+def test_verify_detects_corruption(manager):
+    """Un contenu altéré dans le stockage est signalé"""
+    manifest = manager.create_backup()
+    sha256 = manifest['documents'][0]['sha256']
+    manager._object_path(sha256).write_bytes(b"corrompu")
+
+    errors = manager.verify(manifest['name'])
+
+    assert len(errors) == 1
+    assert "empreinte incorrecte" in errors[0]
+
+
+def test_changed_document_is_stored_with_its_hash(manager, tmp_path, monkeypatch):
+    """Un document modifié entre deux sauvegardes est lu une seule fois : l'empreinte est celle du contenu stocké"""
+    manager.create_backup()
+    path = manager.documents_dir / "factures" / "FACT-2025-002.pdf"
+    path.write_bytes(b"%PDF facture 2 corrigee")
+    monkeypatch.setattr('utils.backup._hash_file', lambda path: pytest.fail("fichier relu pour l'empreinte"))
+
+    manifest = manager.create_backup()
+    entry = next(entry for entry in manifest['documents'] if entry['path'].endswith("002.pdf"))
+
+    assert entry['sha256'] == hashlib.sha256(b"%PDF facture 2 corrigee").hexdigest()
+    assert manifest['stats']['relus'] == 1
+    assert manifest['stats']['copies'] == 1
+    monkeypatch.undo()
+    assert manager.verify(manifest['name']) == []
+
+    restore_dir = tmp_path / "restauration"
+    assert manager.restore(manifest['name'], restore_dir / "facturation.db", restore_dir / "documents") == []
+    assert (restore_dir / "documents" / "factures" / "FACT-2025-002.pdf").read_bytes() == b"%PDF facture 2 corrigee"
+
+
+def test_document_changed_back_is_not_copied_again(manager):
+    """Un contenu déjà présent dans le stockage n'est pas recopié"""
+    path = manager.documents_dir / "factures" / "FACT-2025-001.pdf"
+    manager.create_backup()
+    path.write_bytes(b"%PDF facture 1 v2")
+    manager.create_backup()
+    path.write_bytes(b"%PDF facture 1")
+
+    manifest = manager.create_backup()
+
+    assert manifest['stats']['relus'] == 1
+    assert manifest['stats']['copies'] == 0
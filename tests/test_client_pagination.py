@@ -0,0 +1,86 @@
+"""
+Tests de la pagination par clé des clients (ClientController.get_clients_page)
+"""
+import pytest
+from controllers.client_controller import ClientController
+from models import Client
+
+
+@pytest.fixture
+def clients(session):
+    """
+    23 clients avec de nombreux ex aequo sur la clé de tri (nom_tri, prenom_tri) :
+    homonymes, prénoms absents (NULL), entreprise triée sur sa raison sociale.
+    """
+    session.add_all(
+        Client(type='particulier', nom=nom, prenom=prenom, email=f"{nom.lower()}@example.fr", actif=i % 3 != 0)
+        for i, (nom, prenom) in enumerate(
+            [("Martin", "Paul")] * 5 + [("Martin", None)] * 3 + [("Durand", "Julie")] * 4
+            + [("Bernard", "Léa"), ("Bernard", "Anne"), ("Zola", None)]
+        )
+    )
+    session.add_all(
+        Client(type='entreprise', raison_sociale="Martin Sport", nom="Aaaa", siret="73282932000074")
+        for _ in range(8)
+    )
+    session.commit()
+    return [client.id for client in session.query(Client)]
+
+
+def all_pages(controller: ClientController, page_size: int, **filters) -> list[list[Client]]:
+    """Parcourt toutes les pages en repassant le curseur"""
+    pages, cursor = [], None
+    while True:
+        page = controller.get_clients_page(cursor=cursor, page_size=page_size, with_total=False, **filters)
+        pages.append(page['clients'])
+        cursor = page['cursor']
+        if cursor is None:
+            return pages
+
+
+@pytest.mark.parametrize('page_size', [1, 3, 4, 23, 50])
+def test_pages_cover_table_without_duplicates_or_gaps(clients, page_size):
+    controller = ClientController()
+    pages = all_pages(controller, page_size)
+
+    ids = [client.id for page in pages for client in page]
+    assert sorted(ids) == sorted(clients)
+    assert all(len(page) == page_size for page in pages[:-1])
+    assert 0 < len(pages[-1]) <= page_size
+
+    # Même ordre que la liste complète triée (nom/raison sociale, prénom, id)
+    expected = sorted(controller.get_all_clients(), key=lambda c: (c.nom_tri, c.prenom_tri, c.id))
+    assert ids == [client.id for client in expected]
+
+
+def test_search_pages_follow_rank(clients):
+    controller = ClientController()
+    first = controller.get_clients_page("martin", page_size=5)
+    pages = all_pages(controller, 5, query="martin")
+
+    ids = [client.id for page in pages for client in page]
+    assert [client.id for client in pages[0]] == [client.id for client in first['clients']]
+    assert len(ids) == len(set(ids)) == first['total'] == 16
+    # Même ordre que la recherche sur une seule page (pertinence puis id)
+    assert ids == [client.id for client in controller.get_clients_page("martin", page_size=100)['clients']]
+
+
+def test_search_cursor_carries_rank_and_id(clients):
+    page = ClientController().get_clients_page("martin", page_size=5)
+
+    rank, last_id = page['cursor']
+    assert isinstance(rank, float)
+    assert last_id == page['clients'][-1].id
+
+
+def test_with_total_false_skips_counts(clients):
+    controller = ClientController()
+    page = controller.get_clients_page(actif=True, page_size=4, with_total=False)
+    assert page['total'] is None and page['actifs'] is None
+    assert len(page['clients']) == 4
+
+    counted = controller.get_clients_page(actif=True, page_size=4)
+    assert [client.id for client in counted['clients']] == [client.id for client in page['clients']]
+    assert counted['cursor'] == page['cursor']
+    assert counted['total'] == counted['actifs'] == 18
+    assert controller.get_clients_page(page_size=4)['total'] == 23
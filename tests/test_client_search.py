@@ -0,0 +1,93 @@
+"""
+Tests de la recherche plein texte des clients (database/search_index.py,
+ClientController._filtered_clients_query)
+"""
+import pytest
+from controllers.client_controller import ClientController
+from database import search_index
+from database.search_index import build_fts_query
+from models import Client
+
+
+@pytest.fixture
+def clients(session):
+    """Quelques clients indexés par les triggers FTS à l'insertion"""
+    session.add_all([
+        Client(type='particulier', nom="Dupont", prenom="Hélène", email="helene@example.fr"),
+        Client(type='particulier', nom="Martin", prenom="Paul", email="paul@example.fr"),
+        Client(type='particulier', nom="Durand", prenom="Julie", email="martin.durand@example.fr"),
+        Client(type='entreprise', raison_sociale="Club Forme", siret="73282932000074"),
+    ])
+    session.commit()
+
+
+def noms(query: str) -> list[str]:
+    return [client.nom_complet for client in ClientController().search_clients(query)]
+
+
+def client_data(**values) -> dict:
+    """Données valides d'un client particulier"""
+    return {
+        'nom': "Bernard", 'prenom': "Léa", 'adresse': "1 rue Neuve",
+        'code_postal': "69001", 'ville': "Lyon", 'email': "lea@example.fr", **values
+    }
+
+
+def test_build_fts_query():
+    assert build_fts_query("hél dup") == '"hél"* "dup"*'
+    assert build_fts_query("732 829-320") == '"732829320"*'
+    # Les caractères de syntaxe FTS5 sont ignorés, les termes restent entre guillemets
+    assert build_fts_query('dup" OR (mar*') == '"dup"* "OR"* "mar"*'
+    assert build_fts_query('"*()') is None
+
+
+def test_search_is_accent_insensitive(clients):
+    assert search_index.fts_available
+    assert noms("helene") == ["Hélène Dupont"]
+    assert noms("HÉLÈNE") == ["Hélène Dupont"]
+
+
+def test_search_by_prefix(clients):
+    assert noms("dup") == ["Hélène Dupont"]
+    assert noms("hel dup") == ["Hélène Dupont"]
+    assert noms("club for") == ["Club Forme"]
+    assert noms("732 829") == ["Club Forme"]
+    assert noms("dupx") == []
+
+
+def test_search_ranks_name_before_email(clients):
+    # "martin" : nom de Paul Martin (poids 10) avant l'e-mail de Julie Durand (poids 2),
+    # bien que Durand soit avant Martin dans l'ordre alphabétique
+    assert noms("martin") == ["Paul Martin", "Julie Durand"]
+
+
+def test_search_with_fts_syntax_characters(clients):
+    assert noms('dup*') == ["Hélène Dupont"]
+    assert noms('"dupont"') == ["Hélène Dupont"]
+    assert noms('dup (') == ["Hélène Dupont"]
+    # Aucun terme : recherche LIKE sur la saisie telle quelle
+    assert noms('@') == ["Hélène Dupont", "Julie Durand", "Paul Martin"]
+    assert noms('"*') == []
+
+
+def test_search_falls_back_to_like_without_fts(clients, monkeypatch):
+    monkeypatch.setattr(search_index, 'fts_available', False)
+    assert noms("dupon") == ["Hélène Dupont"]
+    assert noms("example") == ["Hélène Dupont", "Julie Durand", "Paul Martin"]
+
+
+def test_index_follows_insert_update_delete(db):
+    controller = ClientController()
+
+    success, _, client = controller.create_client(client_data())
+    assert success
+    assert noms("bern") == ["Léa Bernard"]
+
+    success, _, _ = controller.update_client(client.id, client_data(nom="Moreau"))
+    assert success
+    assert noms("bern") == []
+    assert noms("more") == ["Léa Moreau"]
+
+    success, _ = controller.delete_client(client.id)
+    assert success
+    assert noms("more") == []
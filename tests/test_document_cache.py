@@ -0,0 +1,97 @@
+"""
+Tests du cache des documents PDF (utils/document_cache.py)
+"""
+import json
+from datetime import date
+from decimal import Decimal
+import pytest
+from PIL import Image
+from benchmarks.bench_pdf import make_parametres
+from models import Client, Facture
+from utils.document_cache import DocumentCache
+from utils.pdf_generator import PDFGenerator
+
+
+@pytest.fixture
+def facture(session):
+    """Facture émise avec son client"""
+    facture = Facture(
+        numero='FACT-2025-001', client=Client(type='particulier', nom='Martin', prenom='Julie'),
+        date_emission=date(2025, 1, 15), date_echeance=date(2025, 2, 15), statut='emise',
+        montant_total_ht=Decimal('100.00')
+    )
+    session.add(facture)
+    session.commit()
+    return facture
+
+
+@pytest.fixture
+def parametres(tmp_path):
+    """Paramètres de l'émetteur tels que lus par load_parametres (avec logo)"""
+    dossier = tmp_path / "parametres"
+    dossier.mkdir()
+    return make_parametres(dossier)
+
+
+@pytest.fixture
+def cache(parametres, tmp_path):
+    return DocumentCache(PDFGenerator(parametres), index_path=tmp_path / "index.json")
+
+
+def test_unchanged_document_is_not_regenerated(cache, facture, tmp_path):
+    first = cache.save(facture, tmp_path)
+    second = cache.save(facture, tmp_path)
+
+    assert first == second
+    assert cache.stats()['hits'] == 1
+    assert cache.stats()['misses'] == 1
+
+
+def test_modified_file_is_regenerated(cache, facture, tmp_path):
+    """Un fichier tronqué depuis son écriture n'est pas réutilisé"""
+    path = cache.save(facture, tmp_path)
+    taille = path.stat().st_size
+    path.write_bytes(path.read_bytes()[:100])
+
+    cache.save(facture, tmp_path)
+
+    assert cache.stats()['misses'] == 2
+    assert path.stat().st_size == taille
+
+
+def test_renamed_client_removes_old_file(cache, facture, session, tmp_path):
+    ancien = cache.save(facture, tmp_path)
+
+    facture.client.nom = 'Durand'
+    session.commit()
+    nouveau = cache.save(facture, tmp_path)
+
+    assert nouveau != ancien
+    assert nouveau.is_file()
+    assert not ancien.exists()
+    assert cache.stats()['orphelins'] == 1
+    cache.flush()
+    assert list(json.loads(cache.index_path.read_text(encoding='utf-8'))) == [str(nouveau.resolve())]
+
+
+def test_index_is_written_on_close(facture, parametres, tmp_path):
+    index_path = tmp_path / "index.json"
+
+    with DocumentCache(PDFGenerator(parametres), index_path=index_path) as cache:
+        path = cache.save(facture, tmp_path)
+        assert not index_path.exists()
+
+    assert index_path.is_file()
+    assert DocumentCache(PDFGenerator(parametres), index_path=index_path).is_up_to_date(facture, path)
+
+
+def test_replaced_logo_regenerates_document(cache, facture, parametres, tmp_path):
+    """Un logo remplacé sous le même nom change l'empreinte des documents"""
+    path = cache.save(facture, tmp_path)
+    assert cache.is_up_to_date(facture, path)
+
+    Image.new('RGB', (800, 400), (200, 30, 30)).save(parametres['logo_path'])
+
+    assert not cache.is_up_to_date(facture, path)
+    cache.save(facture, tmp_path)
+    assert cache.stats()['misses'] == 2
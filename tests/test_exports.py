@@ -0,0 +1,119 @@
+"""
+Tests des exports comptables en CSV (utils/exports.py)
+"""
+import csv
+from datetime import date, timedelta
+from decimal import Decimal
+import pytest
+from sqlalchemy import insert
+from config import EXPORT_BATCH_SIZE
+from models import Client, Facture, Paiement
+from utils.exports import export_factures, export_livre_recettes
+
+
+@pytest.fixture
+def factures(session):
+    """Deux factures de janvier et février 2025 ; paiements du 31/01 au 01/03"""
+    particulier = Client(type='particulier', nom='Martin', prenom='Julie')
+    entreprise = Client(type='entreprise', raison_sociale='Club Forme', siret='73282932000074')
+    janvier = Facture(
+        numero='FACT-2025-001', client=particulier, date_emission=date(2025, 1, 31),
+        date_echeance=date(2025, 2, 28), statut='payee', montant_total_ht=Decimal('1234.50'),
+        paiements=[
+            Paiement(date_paiement=date(2025, 1, 31), montant=Decimal('1000.00'), moyen_paiement='virement',
+                     reference='VIR-1'),
+            Paiement(date_paiement=date(2025, 2, 15), montant=Decimal('234.5'), moyen_paiement='cheque'),
+        ]
+    )
+    fevrier = Facture(
+        numero='FACT-2025-002', client=entreprise, date_emission=date(2025, 2, 1),
+        date_echeance=date(2025, 3, 1), statut='emise', montant_total_ht=Decimal('80.00'),
+        paiements=[
+            Paiement(date_paiement=date(2025, 3, 1), montant=Decimal('30.10'), moyen_paiement='especes'),
+        ]
+    )
+    session.add_all([janvier, fevrier])
+    session.commit()
+    return janvier.id
+
+
+def read_csv(path) -> list[list[str]]:
+    with open(path, encoding='utf-8-sig', newline='') as file:
+        return list(csv.reader(file, delimiter=';'))
+
+
+def test_export_livre_recettes(session, factures, tmp_path):
+    path = tmp_path / "recettes.csv"
+
+    assert export_livre_recettes(session, path) == 3
+
+    assert read_csv(path) == [
+        ["Date d'encaissement", "Référence de la facture", "Client", "Montant", "Mode de règlement",
+         "Référence du règlement"],
+        ["31/01/2025", "FACT-2025-001", "Julie Martin", "1000,00", "virement", "VIR-1"],
+        ["15/02/2025", "FACT-2025-001", "Julie Martin", "234,50", "cheque", ""],
+        ["01/03/2025", "FACT-2025-002", "Club Forme", "30,10", "especes", ""],
+    ]
+    assert path.read_bytes().startswith(b'\xef\xbb\xbf')
+    assert list(tmp_path.iterdir()) == [path]
+
+
+def test_export_livre_recettes_includes_period_bounds(session, factures, tmp_path):
+    path = tmp_path / "recettes.csv"
+
+    assert export_livre_recettes(session, path, date(2025, 1, 31), date(2025, 2, 15)) == 2
+    assert [row[0] for row in read_csv(path)[1:]] == ["31/01/2025", "15/02/2025"]
+
+    assert export_livre_recettes(session, path, date(2025, 2, 16), date(2025, 2, 28)) == 0
+    assert len(read_csv(path)) == 1
+
+
+def test_export_factures(session, factures, tmp_path):
+    path = tmp_path / "factures.csv"
+
+    assert export_factures(session, path, date(2025, 1, 1), date(2025, 1, 31)) == 1
+    assert export_factures(session, path, date_debut=date(2025, 1, 31)) == 2
+
+    assert read_csv(path)[1:] == [
+        ["FACT-2025-001", "31/01/2025", "28/02/2025", "Julie Martin", "", "payee", "1234,50", "1234,50", "0,00"],
+        ["FACT-2025-002", "01/02/2025", "01/03/2025", "Club Forme", "73282932000074", "emise",
+         "80,00", "30,10", "49,90"],
+    ]
+
+
+def test_export_streams_more_rows_than_a_batch(session, factures, tmp_path, monkeypatch):
+    """Au-delà d'un lot (yield_per), les lignes sont lues et écrites lot par lot"""
+    nb = EXPORT_BATCH_SIZE * 2 + 5
+    session.execute(insert(Paiement), [
+        {'facture_id': factures, 'date_paiement': date(2024, 1, 1) + timedelta(days=i % 365),
+         'montant': Decimal('1.25'), 'moyen_paiement': 'virement'}
+        for i in range(nb)
+    ])
+    session.commit()
+
+    # Taille des lots effectivement lus
+    lots = []
+    execute = session.execute
+
+    def execute_spy(statement, *args, **kwargs):
+        result = execute(statement, *args, **kwargs)
+        partitions = result.partitions
+
+        def recorded_partitions(*partition_args):
+            for rows in partitions(*partition_args):
+                lots.append(len(rows))
+                yield rows
+
+        result.partitions = recorded_partitions
+        return result
+
+    monkeypatch.setattr(session, 'execute', execute_spy)
+    path = tmp_path / "recettes_2024.csv"
+
+    assert export_livre_recettes(session, path, date(2024, 1, 1), date(2024, 12, 31)) == nb
+
+    assert lots == [EXPORT_BATCH_SIZE, EXPORT_BATCH_SIZE, 5]
+    rows = read_csv(path)[1:]
+    assert len(rows) == nb
+    assert rows[0][0] == "01/01/2024" and rows[-1][0] == "30/12/2024"
+    assert {row[3] for row in rows} == {"1,25"}
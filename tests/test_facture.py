@@ -0,0 +1,66 @@
+"""
+Tests des montants payés et restants des factures (models/facture.py),
+calculés en Python sur une instance et en SQL dans une requête
+"""
+from datetime import date
+from decimal import Decimal
+import pytest
+from models import Client, Facture, Paiement
+
+
+# Numéro de facture : (total HT, paiements)
+FACTURES = {
+    'SANS-PAIEMENT': (Decimal('120.00'), []),
+    'PARTIEL': (Decimal('120.00'), [Decimal('50.00'), Decimal('19.99')]),
+    'SOLDEE': (Decimal('0.30'), [Decimal('0.10'), Decimal('0.20')]),
+    'TROP-PERCU': (Decimal('80.00'), [Decimal('50.00'), Decimal('45.50')]),
+}
+
+
+@pytest.fixture
+def factures(session):
+    """Factures sans paiement, payée en partie, soldée et payée en trop"""
+    client = Client(type='particulier', nom='Martin', prenom='Julie')
+    for numero, (total, montants) in FACTURES.items():
+        session.add(Facture(
+            numero=numero, client=client, date_emission=date(2025, 1, 15), date_echeance=date(2025, 2, 15),
+            statut='emise', montant_total_ht=total,
+            paiements=[
+                Paiement(date_paiement=date(2025, 2, 1), montant=montant, moyen_paiement='virement')
+                for montant in montants
+            ]
+        ))
+    session.commit()
+    session.expire_all()
+
+
+def test_instance_amounts(session, factures):
+    restants = {facture.numero: (facture.montant_paye, facture.montant_restant) for facture in session.query(Facture)}
+
+    assert restants == {
+        'SANS-PAIEMENT': (Decimal('0.00'), Decimal('120.00')),
+        'PARTIEL': (Decimal('69.99'), Decimal('50.01')),
+        'SOLDEE': (Decimal('0.30'), Decimal('0.00')),
+        'TROP-PERCU': (Decimal('95.50'), Decimal('-15.50')),
+    }
+
+
+def test_sql_amounts_match_instance_amounts(session, factures):
+    rows = session.query(Facture, Facture.montant_paye, Facture.montant_restant).all()
+
+    assert len(rows) == len(FACTURES)
+    for facture, montant_paye, montant_restant in rows:
+        assert (montant_paye, montant_restant) == (facture.montant_paye, facture.montant_restant)
+
+
+@pytest.mark.parametrize('condition, attendus', [
+    (lambda restant: restant > 0, {'SANS-PAIEMENT', 'PARTIEL'}),
+    (lambda restant: restant == 0, {'SOLDEE'}),
+    (lambda restant: restant < 0, {'TROP-PERCU'}),
+])
+def test_sql_filter_matches_instance_values(session, factures, condition, attendus):
+    """Le filtre SQL sélectionne les mêmes factures que le calcul sur les instances"""
+    filtrees = {facture.numero for facture in session.query(Facture).filter(condition(Facture.montant_restant))}
+    calculees = {facture.numero for facture in session.query(Facture) if condition(facture.montant_restant)}
+
+    assert filtrees == calculees == attendus
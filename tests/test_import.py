@@ -0,0 +1,101 @@
+"""
+Tests de l'import CSV des clients et des prestations (controllers/import_controller.py)
+"""
+from decimal import Decimal
+from controllers.import_controller import ImportController, normalize_header, parse_montant
+from database import session_scope
+from models import Client, Prestation
+from utils.prestation_catalog import catalogue
+
+
+CLIENTS_CSV = (
+    "Type;Nom;Prénom;Raison sociale;Adresse;Code postal;Ville;E-mail;Téléphone;SIRET;Colonne inconnue\n"
+    ";Martin;Julie;;\"12 rue des Lilas\nBâtiment B\";75011;Paris;julie@example.fr;06 12 34 56 78;;x\n"
+    "entreprise;;;Club Forme;1 rue du Stade;69003;Lyon;contact@club.fr;;732 829 320 00074;\n"
+    ";Durand;Paul;;3 place Bellecour;690;Lyon;paul@example.fr;;;\n"
+    "\n"
+    "pro;;;Sans Siret;5 quai Saint-Antoine;69002;Lyon;sans@siret.fr;;;\n"
+    "inconnu;Petit;Marc;;8 rue Neuve;69001;Lyon;marc@example.fr;;;\n"
+    ";Leroy;Anne;;2 rue Haute;33000;Bordeaux;anne@example.fr;;;\n"
+)
+
+
+def test_normalize_header_and_parse_montant():
+    assert normalize_header("Code Postal") == "code_postal"
+    assert normalize_header(" Téléphone ") == "telephone"
+    assert parse_montant("1 234,50 €") == Decimal('1234.50')
+    assert parse_montant("abc") is None
+
+
+def test_import_clients_reports_invalid_lines(db, tmp_path):
+    path = tmp_path / "clients.csv"
+    path.write_text(CLIENTS_CSV, encoding='utf-8-sig')
+
+    rapport = ImportController(batch_size=2).import_clients(path)
+
+    # Numéros de ligne du fichier (la ligne 2 s'étend sur deux lignes, la ligne vide est ignorée)
+    assert rapport['lignes'] == 6
+    assert rapport['importees'] == 3
+    assert [numero for numero, _ in rapport['erreurs']] == [5, 7, 8]
+    assert rapport['erreurs'][0][1] == "Le code postal doit contenir 5 chiffres"
+    assert rapport['erreurs'][1][1] == "Le SIRET est obligatoire pour les entreprises"
+    assert rapport['erreurs'][2][1] == "Type de client inconnu: inconnu"
+
+    with session_scope() as session:
+        clients = {client.nom_complet: client for client in session.query(Client)}
+    assert set(clients) == {"Julie Martin", "Club Forme", "Anne Leroy"}
+    assert clients["Club Forme"].siret == "73282932000074"
+    assert clients["Julie Martin"].adresse == "12 rue des Lilas\nBâtiment B"
+
+
+def test_errors_report_first_line_of_multiline_records(db, tmp_path):
+    """Un enregistrement sur plusieurs lignes est signalé à sa première ligne"""
+    path = tmp_path / "clients.csv"
+    path.write_text(
+        "Nom;Prénom;Adresse;Code postal;Ville;E-mail\n"
+        "Martin;Julie;\"12 rue des Lilas\nBâtiment B\nEscalier 3\";750;Paris;julie@example.fr\n"
+        "\n"
+        "Durand;Paul;\"3 place Bellecour\n2e étage\";69002;Lyon;paul@\n"
+        "Leroy;Anne;2 rue Haute;33000;Bordeaux;anne@example.fr\n",
+        encoding='utf-8'
+    )
+
+    rapport = ImportController().import_clients(path)
+
+    assert rapport['importees'] == 1
+    assert rapport['erreurs'] == [
+        (2, "Le code postal doit contenir 5 chiffres"),
+        (6, "L'adresse email n'est pas valide"),
+    ]
+
+
+def test_import_prestations_invalidates_catalogue(db, tmp_path):
+    path = tmp_path / "prestations.csv"
+    path.write_text(
+        "Désignation,Prix HT,Unité,Catégorie,Actif\n"
+        "Séance de coaching,\"45,00 €\",séance,coaching,oui\n"
+        "Bilan forme,abc,forfait,bilan,oui\n"
+        "Cours collectif,15,séance,cours,non\n",
+        encoding='utf-8'
+    )
+    assert catalogue.complete("seance") == []
+
+    rapport = ImportController().import_prestations(path)
+
+    assert rapport['importees'] == 2
+    assert rapport['erreurs'] == [(3, "Le prix unitaire n'est pas valide")]
+    with session_scope() as session:
+        prix = {p.libelle: p.prix_unitaire_ht for p in session.query(Prestation)}
+    assert prix == {"Séance de coaching": Decimal('45.00'), "Cours collectif": Decimal('15.00')}
+    # Catalogue relu après l'import ; la prestation inactive n'est pas proposée
+    assert [entry.libelle for entry in catalogue.complete("seance")] == ["Séance de coaching"]
+    assert catalogue.complete("cours") == []
+
+
+def test_import_without_known_columns(db, tmp_path):
+    path = tmp_path / "vide.csv"
+    path.write_text("a;b\n1;2\n", encoding='utf-8')
+
+    rapport = ImportController().import_clients(path)
+
+    assert rapport == {'lignes': 0, 'importees': 0, 'erreurs': [(1, "Aucune colonne reconnue dans l'en-tête")]}
@@ -0,0 +1,60 @@
+"""
+Tests des index secondaires : les requêtes fréquentes des contrôleurs
+utilisent les index attendus (EXPLAIN QUERY PLAN)
+"""
+from datetime import date
+import pytest
+from sqlalchemy import text
+from controllers.client_controller import ClientController
+from database.indexes import capture_statements, ensure_indexes, query_plan
+from models import Facture, Paiement
+
+
+def plans(engine, statements) -> list[str]:
+    """Étapes des plans de toutes les requêtes capturées"""
+    with engine.connect() as connection:
+        return [step for sql, params in statements for step in query_plan(connection, sql, params)]
+
+
+def assert_uses_index(engine, statements, index: str):
+    steps = plans(engine, statements)
+    assert any(index in step for step in steps), f"{index} absent des plans : {steps}"
+
+
+def test_clients_statistics_use_indexes(db):
+    with capture_statements(db) as statements:
+        ClientController().get_clients_statistics([1, 2, 3])
+
+    assert_uses_index(db, statements, "ix_factures_client_statut")
+    assert_uses_index(db, statements, "ix_devis_client_id")
+
+
+def test_clients_page_uses_sort_index(db):
+    with capture_statements(db) as statements:
+        ClientController().get_clients_page()
+
+    assert_uses_index(db, statements, "ix_clients_tri")
+
+
+@pytest.mark.parametrize("build_query, index", [
+    (lambda session: session.query(Facture).filter(Facture.statut == 'emise', Facture.date_echeance < date.today()),
+     "ix_factures_statut_echeance"),
+    (lambda session: session.query(Facture).filter(Facture.date_emission.between(date(2025, 1, 1), date(2025, 12, 31))),
+     "ix_factures_date_emission"),
+    (lambda session: session.query(Paiement).filter(Paiement.facture_id == 1),
+     "ix_paiements_facture_id"),
+], ids=["factures_en_retard", "factures_par_periode", "paiements_facture"])
+def test_facture_queries_use_indexes(db, session, build_query, index):
+    with capture_statements(db) as statements:
+        build_query(session).all()
+
+    assert_uses_index(db, statements, index)
+
+
+def test_ensure_indexes_recreates_missing_index(db):
+    """Une base créée avant l'ajout d'un index le reçoit au démarrage"""
+    with db.begin() as connection:
+        connection.execute(text("DROP INDEX ix_factures_date_emission"))
+
+    assert ensure_indexes(db) == ["ix_factures_date_emission"]
+    assert ensure_indexes(db) == []
@@ -0,0 +1,87 @@
+"""
+Tests de l'instrumentation des requêtes SQL (database/instrumentation.py)
+"""
+import time
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+from database.instrumentation import SQLInstrumentation, statement_shape
+
+
+@pytest.fixture
+def instrumentation(db):
+    """Instrumentation silencieuse installée sur la base de test"""
+    instrumentation = SQLInstrumentation(slow_log_file=None, verbose=False)
+    instrumentation.install(db)
+    yield instrumentation
+    instrumentation.uninstall(db)
+
+
+def test_statement_shape_groups_parameter_lists():
+    assert statement_shape("SELECT *\n  FROM clients WHERE id IN (?, ?, ?)") == \
+        statement_shape("SELECT * FROM clients WHERE id IN (?, ?)")
+
+
+def test_failed_statement_leaves_no_state(db, instrumentation):
+    """Une requête en erreur ne fausse pas la mesure des requêtes suivantes"""
+    with db.connect() as connection:
+        with instrumentation.action("apres_erreur") as stats:
+            with pytest.raises(OperationalError):
+                connection.execute(text("SELECT * FROM table_absente"))
+            # La requête en erreur n'est pas comptée
+            assert (stats.nb_requetes, stats.duree_ms) == (0, 0.0)
+
+            # Un début resté d'une requête en erreur compterait cette attente dans la suivante
+            time.sleep(0.2)
+            start = time.perf_counter()
+            connection.execute(text("SELECT 1"))
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+    assert stats.nb_requetes == 1
+    assert 0 <= stats.duree_ms <= elapsed_ms
+
+
+def test_slow_queries_are_recorded(db):
+    instrumentation = SQLInstrumentation(slow_query_ms=0, slow_log_file=None, verbose=False)
+    instrumentation.install(db)
+    try:
+        with instrumentation.action("lente") as stats:
+            with db.connect() as connection:
+                connection.execute(text("SELECT :valeur"), {'valeur': 42})
+    finally:
+        instrumentation.uninstall(db)
+
+    assert len(stats.lentes) == 1
+    assert "42" in stats.lentes[0][2]
+
+
+def test_n_plus_one_detected_for_per_client_statistics(session, instrumentation):
+    """Statistiques chargées client par client : N+1 ; requête groupée : pas de N+1"""
+    from controllers.client_controller import ClientController
+    from models import Client
+
+    session.add_all(Client(type='particulier', nom=f"Client {i}", prenom="Test") for i in range(3))
+    session.commit()
+    controller = ClientController()
+    ids = [client.id for client in controller.get_all_clients()] * 5
+
+    with instrumentation.action("statistiques par client") as stats:
+        for client_id in ids:
+            controller.get_client_statistics(client_id)
+    assert stats.n_plus_one(instrumentation.n_plus_one_seuil)
+
+    with instrumentation.action("statistiques groupees") as stats:
+        controller.get_clients_statistics(ids)
+    assert not stats.n_plus_one(instrumentation.n_plus_one_seuil)
+
+    assert set(instrumentation.totaux) == {"statistiques par client", "statistiques groupees"}
+
+
+def test_nested_actions_are_counted_once(db, instrumentation):
+    with instrumentation.action("externe") as externe:
+        with instrumentation.action("interne") as interne:
+            with db.connect() as connection:
+                connection.execute(text("SELECT 1"))
+
+    assert interne is externe
+    assert list(instrumentation.totaux) == ["externe"]
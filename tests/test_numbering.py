@@ -0,0 +1,198 @@
+"""
+Tests de la numérotation des documents sans trou ni doublon (database/numbering.py)
+"""
+import random
+import threading
+from datetime import date
+import pytest
+from sqlalchemy import event, select
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import sessionmaker
+from database.init_db import create_database_engine
+from database.numbering import allocate_number, reserve_numbers, format_numero
+from models import Base, Client, Facture, SequenceDocument
+
+
+ANNEE = 2025
+
+
+def make_facture(numero: str, client_id: int) -> Facture:
+    """Retourne une facture de test portant le numéro donné"""
+    return Facture(
+        numero=numero, client_id=client_id, date_emission=date(ANNEE, 6, 1),
+        date_echeance=date(ANNEE, 7, 1), statut='brouillon', montant_total_ht=0
+    )
+
+
+@pytest.fixture
+def client_id(session):
+    client = Client(type='particulier', nom="Test", prenom="Numerotation")
+    session.add(client)
+    session.commit()
+    return client.id
+
+
+def test_format_numero():
+    assert format_numero('facture', 2025, 1) == "FACT-2025-001"
+    assert format_numero('devis', 2025, 1234) == "DEV-2025-1234"
+
+
+def test_allocate_is_sequential_per_type_and_year(session):
+    assert allocate_number(session, 'facture', ANNEE) == "FACT-2025-001"
+    assert allocate_number(session, 'facture', ANNEE) == "FACT-2025-002"
+    assert allocate_number(session, 'devis', ANNEE) == "DEV-2025-001"
+    assert allocate_number(session, 'facture', ANNEE + 1) == "FACT-2026-001"
+
+
+def test_rollback_releases_numbers(session):
+    allocate_number(session, 'facture', ANNEE)
+    session.commit()
+
+    reserve_numbers(session, 'facture', 5, ANNEE)
+    session.rollback()
+
+    assert allocate_number(session, 'facture', ANNEE) == "FACT-2025-002"
+
+
+def test_counter_resumes_after_existing_numbers(session, client_id):
+    """Base antérieure au compteur : la séquence reprend après le plus grand numéro existant"""
+    session.add_all(make_facture(format_numero('facture', ANNEE, i), client_id) for i in (1, 2, 7))
+    session.add(make_facture("FACT-2025-BROUILLON", client_id))
+    session.commit()
+
+    assert reserve_numbers(session, 'facture', 2, ANNEE) == ["FACT-2025-008", "FACT-2025-009"]
+
+
+def test_invalid_arguments(session):
+    with pytest.raises(ValueError):
+        allocate_number(session, 'bon_de_commande', ANNEE)
+    with pytest.raises(ValueError):
+        reserve_numbers(session, 'facture', 0, ANNEE)
+
+
+@pytest.fixture
+def file_engine(tmp_path):
+    """Base fichier en WAL (profil de l'application) avec un client"""
+    engine = create_database_engine(f"sqlite:///{tmp_path / 'numerotation.db'}")
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as session:
+        session.add(Client(type='particulier', nom="Test", prenom="Verrou"))
+        session.commit()
+    yield engine
+    engine.dispose()
+
+
+def test_write_lock_is_taken_before_reading(file_engine):
+    """La transaction commence par BEGIN IMMEDIATE, même si la session a déjà lu"""
+    statements = []
+
+    @event.listens_for(file_engine, 'before_cursor_execute')
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    with sessionmaker(bind=file_engine)() as session:
+        session.execute(select(Client.id)).all()
+        del statements[:]
+
+        reserve_numbers(session, 'facture', 2, ANNEE)
+
+        assert statements[0] == "BEGIN IMMEDIATE"
+        assert statements[1].startswith("UPDATE sequences_documents")
+        # Un autre écrivain attend la fin de la transaction
+        with file_engine.connect() as other:
+            other.exec_driver_sql("PRAGMA busy_timeout = 0")
+            with pytest.raises(OperationalError, match="locked"):
+                other.exec_driver_sql("BEGIN IMMEDIATE")
+        session.commit()
+
+
+def test_concurrent_first_allocations_of_a_year(file_engine):
+    """Des sessions ayant déjà lu créent en même temps le compteur d'une nouvelle année"""
+    session_factory = sessionmaker(bind=file_engine, autoflush=False)
+    barrier = threading.Barrier(6)
+    numeros, errors = [], []
+
+    def worker():
+        with session_factory() as session:
+            try:
+                client_id = session.execute(select(Client.id)).scalar_one()
+                barrier.wait()
+                numero = allocate_number(session, 'facture', ANNEE)
+                session.add(make_facture(numero, client_id))
+                session.commit()
+                numeros.append(numero)
+            except Exception as e:
+                session.rollback()
+                errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(6)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert sorted(numeros) == [format_numero('facture', ANNEE, i) for i in range(1, 7)]
+
+
+def test_concurrent_allocations_have_no_gap_or_duplicate(tmp_path):
+    """
+    Plusieurs threads créent des factures en parallèle sur une base fichier
+    (verrous SQLite réels) : attributions unitaires, blocs et transactions annulées.
+    """
+    engine = create_database_engine(f"sqlite:///{tmp_path / 'numerotation.db'}")
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(bind=engine, autoflush=False)
+
+    with session_factory() as session:
+        client = Client(type='particulier', nom="Test", prenom="Concurrence")
+        session.add(client)
+        # Numéros existants avant la création du compteur
+        session.add_all(make_facture(format_numero('facture', ANNEE, i), 1) for i in (1, 2, 3))
+        session.commit()
+        client_id = client.id
+
+    errors = []
+
+    def worker(seed: int):
+        """Crée des factures : 70 % unitaires, 20 % par blocs, 10 % annulées"""
+        rng = random.Random(seed)
+        for _ in range(25):
+            session = session_factory()
+            try:
+                tirage = rng.random()
+                if tirage < 0.2:
+                    numeros = reserve_numbers(session, 'facture', rng.randint(2, 10), ANNEE)
+                else:
+                    numeros = [allocate_number(session, 'facture', ANNEE)]
+                session.add_all(make_facture(numero, client_id) for numero in numeros)
+                session.flush()
+                if tirage > 0.9:
+                    session.rollback()
+                else:
+                    session.commit()
+            except Exception as e:
+                session.rollback()
+                errors.append(e)
+            finally:
+                session.close()
+
+    threads = [threading.Thread(target=worker, args=(seed,)) for seed in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    with session_factory() as session:
+        numeros = session.execute(select(Facture.numero)).scalars().all()
+        compteur = session.execute(
+            select(SequenceDocument.dernier_numero).where(
+                SequenceDocument.type_document == 'facture', SequenceDocument.annee == ANNEE
+            )
+        ).scalar_one()
+    engine.dispose()
+
+    assert errors == []
+    assert len(numeros) == len(set(numeros))
+    assert set(numeros) == {format_numero('facture', ANNEE, i) for i in range(1, len(numeros) + 1)}
+    assert compteur == len(numeros)
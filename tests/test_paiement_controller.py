@@ -0,0 +1,88 @@
+"""
+Tests des paiements et des alertes de seuils du plafond auto-entrepreneur
+"""
+from datetime import date
+from decimal import Decimal
+import pytest
+from config import PLAFOND_AUTO_ENTREPRENEUR
+from controllers.dashboard_controller import DashboardController, seuils_franchis
+from controllers.paiement_controller import PaiementController
+from models import Client, Facture
+
+
+def montant_pour(pourcentage: int) -> Decimal:
+    """Montant correspondant à un pourcentage du plafond"""
+    return Decimal(PLAFOND_AUTO_ENTREPRENEUR * pourcentage) / 100
+
+
+@pytest.fixture
+def facture_id(session):
+    """Facture émise à laquelle rattacher les paiements"""
+    client = Client(type='particulier', nom='Martin', prenom='Julie')
+    facture = Facture(
+        numero='FACT-2025-001', client=client, date_emission=date(2025, 1, 15),
+        date_echeance=date(2025, 2, 15), statut='emise', montant_total_ht=montant_pour(100)
+    )
+    session.add(facture)
+    session.commit()
+    return facture.id
+
+
+def paiement(facture_id: int, montant: Decimal, jour: date = date(2025, 3, 1)) -> dict:
+    return {'facture_id': facture_id, 'date_paiement': jour, 'montant': montant, 'moyen_paiement': 'virement'}
+
+
+def test_seuils_franchis():
+    assert seuils_franchis(Decimal(75), Decimal(92)) == [80, 90]
+    assert seuils_franchis(Decimal(80), Decimal(85)) == []
+
+
+def test_add_paiement_returns_crossed_thresholds(facture_id):
+    controller = PaiementController()
+
+    success, message, _, seuils = controller.add_paiement(paiement(facture_id, montant_pour(45)))
+    assert success
+    assert seuils == []
+
+    success, message, _, seuils = controller.add_paiement(paiement(facture_id, montant_pour(40)))
+    assert success
+    assert seuils == [50, 80]
+    assert "80 %" in message
+
+    suivi = DashboardController().get_suivi_plafond(annee=2025, today=date(2025, 6, 1))
+    assert suivi['pourcentage'] == Decimal('85.0')
+
+
+def test_update_paiement_crossing_threshold(facture_id):
+    controller = PaiementController()
+    _, _, cree, _ = controller.add_paiement(paiement(facture_id, montant_pour(70)))
+
+    success, _, _, seuils = controller.update_paiement(cree.id, paiement(facture_id, montant_pour(95)))
+
+    assert success
+    assert seuils == [80, 90]
+
+
+def test_paiement_in_another_year_does_not_cross(facture_id):
+    controller = PaiementController()
+    controller.add_paiement(paiement(facture_id, montant_pour(60)))
+
+    _, _, _, seuils = controller.add_paiement(paiement(facture_id, montant_pour(30), date(2026, 1, 5)))
+
+    assert seuils == []
+
+
+def test_invalid_paiement_is_rejected(facture_id):
+    success, message, created, seuils = PaiementController().add_paiement(paiement(facture_id, Decimal('-5')))
+
+    assert not success
+    assert created is None
+    assert "positif" in message
+
+
+def test_delete_paiement(facture_id):
+    controller = PaiementController()
+    _, _, cree, _ = controller.add_paiement(paiement(facture_id, montant_pour(10)))
+
+    assert controller.delete_paiement(cree.id) == (True, "Paiement supprimé avec succès")
+    assert DashboardController().get_suivi_plafond(annee=2025)['ca_encaisse'] == Decimal('0.00')
@@ -0,0 +1,84 @@
+"""
+Tests de la génération des PDF par lot (utils/pdf_batch.py, utils/pdf_worker.py)
+"""
+import multiprocessing
+import subprocess
+import sys
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+import pytest
+from sqlalchemy.orm import sessionmaker
+from database.init_db import create_database_engine
+from models import Base, Client, Facture
+from utils import pdf_worker
+from utils.document_cache import DocumentCache
+from utils.pdf_batch import BatchPDFGenerator, select_factures
+from utils.pdf_generator import PDFGenerator
+
+
+PROJECT_DIR = Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture
+def database(tmp_path):
+    """Base fichier (lue par les processus du pool) contenant 3 factures"""
+    url = f"sqlite:///{tmp_path / 'lot.db'}"
+    engine = create_database_engine(url)
+    Base.metadata.create_all(bind=engine)
+    with sessionmaker(bind=engine)() as session:
+        session.add_all(
+            Facture(
+                numero=f"FACT-2025-{i:03d}", client=Client(type='particulier', nom=f"Client{i}", prenom='Test'),
+                date_emission=date(2025, 1, i), date_echeance=date(2025, 2, i), statut='emise',
+                montant_total_ht=Decimal('50.00')
+            )
+            for i in range(1, 4)
+        )
+        session.commit()
+        facture_ids = select_factures(session)
+    engine.dispose()
+    return url, facture_ids
+
+
+def test_up_to_date_invoices_are_not_resubmitted(database, tmp_path):
+    url, facture_ids = database
+    cache = DocumentCache(PDFGenerator(), index_path=tmp_path / "index.json")
+
+    with BatchPDFGenerator(max_workers=1, database_url=url, cache=cache) as batch:
+        first = batch.generate(facture_ids, directory=tmp_path / "pdf")
+        second = batch.generate(facture_ids, directory=tmp_path / "pdf")
+
+    assert first['erreurs'] == [] and first['a_jour'] == 0
+    assert len(first['fichiers']) == 3
+    assert second['a_jour'] == 3
+    assert sorted(second['fichiers']) == sorted(first['fichiers'])
+    assert (tmp_path / "index.json").is_file()
+
+
+def test_render_chunk_stops_when_cancelled(database, tmp_path, monkeypatch):
+    """Un paquet en cours s'arrête avant la facture suivante quand le lot est annulé"""
+    url, facture_ids = database
+    for name in ('_worker_session_factory', '_worker_generator', '_worker_cancel'):
+        monkeypatch.setattr(pdf_worker, name, None)
+    cancel = multiprocessing.get_context('spawn').Event()
+    pdf_worker.init_worker(url, {}, cancel)
+
+    assert len(pdf_worker.render_chunk(facture_ids[:1], str(tmp_path))) == 1
+
+    cancel.set()
+    assert pdf_worker.render_chunk(facture_ids[1:], str(tmp_path)) == []
+    assert len(list(tmp_path.glob("*.pdf"))) == 1
+
+
+def test_main_module_imports_nothing_in_pool_processes():
+    """Réimporté sous le nom __mp_main__ (démarrage "spawn"), main.py n'importe ni Qt ni l'application"""
+    code = (
+        "import runpy, sys\n"
+        "runpy.run_path('main.py', run_name='__mp_main__')\n"
+        "print(sorted(name for name in ('PyQt6', 'application', 'database') if name in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], cwd=PROJECT_DIR, capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
@@ -0,0 +1,44 @@
+"""
+Tests du générateur de PDF (utils/pdf_generator.py)
+"""
+from reportlab.lib.units import mm
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from models import Client
+from utils.pdf_generator import CLIENT_BLOC_LARGEUR, PDFGenerator
+
+
+class RecordingCanvas:
+    """Canvas minimal qui enregistre les textes dessinés avec leur police"""
+
+    def __init__(self):
+        self.font = None
+        self.textes = []
+
+    def setFont(self, font, size):
+        self.font = (font, size)
+
+    def drawString(self, x, y, texte):
+        self.textes.append((texte, *self.font))
+
+    def setFillColor(self, color):
+        pass
+
+    def roundRect(self, *args, **kwargs):
+        pass
+
+
+def test_client_bloc_truncates_with_drawn_font_size():
+    """Les textes tronqués tiennent dans le bloc à la taille de police réellement utilisée"""
+    client = Client(
+        type='entreprise', raison_sociale="Association sportive des coureurs du dimanche matin de Villeurbanne",
+        adresse="12 rue des Lilas", code_postal="69100", ville="Villeurbanne", email="contact@example.fr"
+    )
+    canvas = RecordingCanvas()
+
+    PDFGenerator()._client_bloc(canvas, client, 'facture')
+
+    nom, font, size = canvas.textes[1]
+    assert size == 10
+    assert client.nom_complet.startswith(nom) and nom != client.nom_complet
+    for texte, font, size in canvas.textes[1:]:
+        assert stringWidth(texte, font, size) <= CLIENT_BLOC_LARGEUR - 8 * mm
@@ -0,0 +1,87 @@
+"""
+Tests du catalogue des prestations (utils/prestation_catalog.py) et de son
+invalidation par PrestationController
+"""
+from decimal import Decimal
+import pytest
+from controllers.prestation_controller import PrestationController
+from models import Prestation
+from utils.prestation_catalog import catalogue, fold_text
+
+
+@pytest.fixture
+def prestations(session):
+    """Petit catalogue (une prestation inactive)"""
+    session.add_all([
+        Prestation(libelle="Séance de coaching individuel", categorie="coaching individuel",
+                   description="Renforcement musculaire à domicile", prix_unitaire_ht=Decimal('50'), unite='séance'),
+        Prestation(libelle="Cours collectif Pilates", categorie="cours collectif",
+                   description="Pilates en salle", prix_unitaire_ht=Decimal('15'), unite='séance'),
+        Prestation(libelle="Bilan forme", categorie="bilan",
+                   description="Bilan complet et programme de coaching", prix_unitaire_ht=Decimal('80'), unite='forfait'),
+        Prestation(libelle="Yoga en visio", categorie="bien-être",
+                   prix_unitaire_ht=Decimal('20'), unite='séance', actif=False),
+    ])
+    session.commit()
+    catalogue.invalidate()
+
+
+def libelles(query: str, limit: int = 10) -> list[str]:
+    return [entry.libelle for entry in catalogue.complete(query, limit)]
+
+
+def test_fold_text():
+    assert fold_text("Séance d'Éveil") == "seance d eveil"
+    assert fold_text(None) == ""
+
+
+def test_complete_ranks_label_prefix_first(prestations):
+    # Libellé commençant par la saisie, puis mot commençant par la saisie (description)
+    assert libelles("seance") == ["Séance de coaching individuel"]
+    assert libelles("coach") == ["Séance de coaching individuel", "Bilan forme"]
+
+
+def test_complete_several_words_and_substrings(prestations):
+    assert libelles("pilates sal") == ["Cours collectif Pilates"]
+    assert libelles("COACHING domi") == ["Séance de coaching individuel"]
+    # Sous-chaîne d'un mot quand aucun mot ne commence par la saisie
+    assert libelles("lates") == ["Cours collectif Pilates"]
+    assert libelles("xyz") == []
+
+
+def test_complete_ignores_inactive_and_respects_limit(prestations):
+    assert libelles("yoga") == []
+    assert len(catalogue.complete("e", 2)) == 2
+
+
+def test_controller_writes_invalidate_catalogue(prestations):
+    controller = PrestationController()
+    assert libelles("marche") == []
+
+    success, _, prestation = controller.create_prestation(
+        {'libelle': "Marche nordique", 'prix_unitaire_ht': '25', 'unite': 'séance'}
+    )
+    assert success
+    assert libelles("marche") == ["Marche nordique"]
+
+    success, _, _ = controller.update_prestation(
+        prestation.id, {'libelle': "Marche active", 'prix_unitaire_ht': '25', 'unite': 'séance'}
+    )
+    assert success
+    assert libelles("marche") == ["Marche active"]
+
+    success, _, actif = controller.toggle_active(prestation.id)
+    assert success and not actif
+    assert libelles("marche") == []
+
+    success, _ = controller.delete_prestation(prestation.id)
+    assert success
+    assert catalogue.get(prestation.id) is None
+
+
+def test_create_prestation_validation(db):
+    success, message, _ = PrestationController().create_prestation(
+        {'libelle': "Bilan", 'prix_unitaire_ht': '-5', 'unite': 'forfait'}
+    )
+    assert not success
+    assert message == "Le prix unitaire ne peut pas être négatif"
@@ -0,0 +1,107 @@
+"""
+Tests des tables de synthèse du chiffre d'affaires tenues à jour par triggers
+(database/revenue_summary.py)
+"""
+from datetime import date
+from decimal import Decimal
+from sqlalchemy import text
+from database.revenue_summary import (
+    REVENUE_SUMMARY_TRIGGERS, _facture_lignes_delta, ensure_revenue_summary, rebuild_revenue_summary
+)
+from models import Client, Facture, FactureLigne, Paiement, Prestation
+
+
+def summary(connection) -> dict:
+    """Contenu des tables de synthèse (lignes à zéro laissées par les deltas ignorées)"""
+    return {
+        'factures': connection.execute(text(
+            "SELECT annee, mois, statut, nb_factures, montant_ht_centimes, montant_paye_centimes "
+            "FROM resume_factures WHERE nb_factures OR montant_ht_centimes OR montant_paye_centimes "
+            "ORDER BY 1, 2, 3"
+        )).all(),
+        'categories': connection.execute(text(
+            "SELECT annee, mois, statut, categorie, nb_lignes, montant_ht_centimes "
+            "FROM resume_categories WHERE nb_lignes ORDER BY 1, 2, 3, 4"
+        )).all(),
+        'encaissements': connection.execute(text(
+            "SELECT annee, mois, nb_paiements, montant_centimes "
+            "FROM resume_encaissements WHERE nb_paiements ORDER BY 1, 2"
+        )).all(),
+    }
+
+
+def make_facture(session, numero: str, emission: date, statut: str, lignes: list) -> Facture:
+    """Facture avec ses lignes [(prestation, montant)]"""
+    facture = Facture(
+        numero=numero, client=session.query(Client).first(), date_emission=emission,
+        date_echeance=emission, statut=statut, montant_total_ht=sum(montant for _, montant in lignes)
+    )
+    for ordre, (prestation, montant) in enumerate(lignes):
+        facture.lignes.append(FactureLigne(
+            prestation_id=prestation.id if prestation else None, libelle="Séance", quantite=1,
+            prix_unitaire_ht=montant, montant_total_ligne_ht=montant, ordre=ordre
+        ))
+    session.add(facture)
+    session.flush()
+    return facture
+
+
+def test_triggers_match_full_rebuild(session):
+    """Après une série d'écritures, les synthèses incrémentales égalent un recalcul complet"""
+    session.add(Client(type='particulier', nom='Martin', prenom='Julie'))
+    coaching = Prestation(libelle="Coaching", prix_unitaire_ht=50, unite="séance", categorie="coaching")
+    collectif = Prestation(libelle="Cours", prix_unitaire_ht=15, unite="séance", categorie="collectif")
+    session.add_all([coaching, collectif])
+    session.flush()
+
+    f1 = make_facture(session, "FACT-2025-001", date(2025, 1, 10), 'emise',
+                      [(coaching, Decimal('50.00')), (collectif, Decimal('15.00')), (None, Decimal('9.99'))])
+    f2 = make_facture(session, "FACT-2025-002", date(2025, 2, 3), 'brouillon', [(coaching, Decimal('100.00'))])
+    session.add_all([
+        Paiement(facture_id=f1.id, date_paiement=date(2025, 1, 20), montant=Decimal('30.00'), moyen_paiement='cheque'),
+        Paiement(facture_id=f1.id, date_paiement=date(2025, 2, 1), montant=Decimal('44.99'), moyen_paiement='virement'),
+    ])
+    session.flush()
+
+    # Changements de statut et de date (déplacement des lignes), de catégorie, de paiement
+    f1.statut = 'payee'
+    f2.statut = 'emise'
+    f2.date_emission = date(2025, 3, 1)
+    session.flush()
+    collectif.categorie = "cours collectif"
+    f1.paiements[0].montant = Decimal('35.00')
+    session.flush()
+    session.delete(f1.lignes[2])
+    session.flush()
+    session.delete(f2)
+    session.commit()
+
+    connection = session.connection()
+    incremental = summary(connection)
+    rebuild_revenue_summary(connection)
+    assert summary(connection) == incremental
+    assert incremental['categories']  # Les lignes de f1 sont bien comptées
+
+
+def test_facture_lines_delta_reads_given_row():
+    """Le retrait (old) et l'ajout (new) portent chacun sur les lignes de leur ligne de facture"""
+    assert "l.facture_id = old.id" in _facture_lignes_delta('old', '-')
+    assert "l.facture_id = new.id" in _facture_lignes_delta('new', '+')
+
+
+def test_outdated_trigger_is_reinstalled(db):
+    """Un trigger dont la définition a changé est réinstallé au démarrage"""
+    assert not ensure_revenue_summary(db)
+
+    with db.begin() as connection:
+        connection.execute(text("DROP TRIGGER resume_paiements_ai"))
+        connection.execute(text(
+            "CREATE TRIGGER resume_paiements_ai AFTER INSERT ON paiements BEGIN SELECT 1; END"
+        ))
+
+    assert ensure_revenue_summary(db)
+    with db.connect() as connection:
+        sql = connection.execute(text(
+            "SELECT sql FROM sqlite_master WHERE name = 'resume_paiements_ai'"
+        )).scalar()
+    assert ' '.join(sql.split()) == ' '.join(REVENUE_SUMMARY_TRIGGERS['resume_paiements_ai'].split())
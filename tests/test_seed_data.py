@@ -0,0 +1,40 @@
+"""
+Tests du premier lancement (database/init_db.is_first_run, database/seed_data.seed_first_run)
+"""
+import pytest
+from database import is_first_run
+from database import seed_data
+from models import Client, Prestation
+
+
+def test_seed_first_run_marks_first_run_done(session):
+    assert is_first_run()
+
+    assert seed_data.seed_first_run()
+
+    assert session.query(Client).count() > 0
+    assert session.query(Prestation).count() > 0
+    assert not is_first_run()
+    assert not seed_data.seed_first_run()
+
+
+def test_failed_seed_is_retried(db, monkeypatch):
+    """Une insertion interrompue laisse le premier lancement à refaire"""
+    def seed_all():
+        raise RuntimeError("interrompu")
+
+    monkeypatch.setattr(seed_data, 'seed_all', seed_all)
+    with pytest.raises(RuntimeError):
+        seed_data.seed_first_run()
+
+    assert is_first_run()
+
+
+def test_database_in_use_is_not_a_first_run(session):
+    """Base remplie avant l'enregistrement du premier lancement : pas de données de test"""
+    session.add(Client(type='particulier', nom='Martin', prenom='Julie'))
+    session.commit()
+
+    assert not is_first_run()
+    assert not seed_data.seed_first_run()
+    assert session.query(Client).count() == 1
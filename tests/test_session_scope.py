@@ -0,0 +1,85 @@
+"""
+Tests de l'unité de travail (database/init_db.session_scope)
+"""
+import pytest
+from database import session_scope
+from database.init_db import NestedSession, _current_session
+from controllers.client_controller import ClientController
+from models import Client
+
+
+def count_clients() -> int:
+    with session_scope() as session:
+        return session.query(Client).count()
+
+
+def test_nested_scope_reuses_outer_session(db):
+    with session_scope() as outer:
+        client = Client(type='particulier', nom='Martin', prenom='Julie')
+        outer.add(client)
+        outer.flush()
+        with session_scope() as inner:
+            assert isinstance(inner, NestedSession)
+            assert inner.get(Client, client.id) is client
+
+
+def test_nested_commit_does_not_commit_outer_unit(db):
+    with session_scope() as outer:
+        outer.add(Client(type='particulier', nom='Martin', prenom='Julie'))
+        with session_scope() as inner:
+            inner.add(Client(type='particulier', nom='Durand', prenom='Paul'))
+            inner.commit()
+        outer.rollback()
+
+    assert count_clients() == 0
+
+
+def test_nested_rollback_prevents_outer_commit(db):
+    with session_scope() as outer:
+        outer.add(Client(type='particulier', nom='Martin', prenom='Julie'))
+        with session_scope() as inner:
+            inner.rollback()
+        # Les modifications restent en attente : seul le bloc extérieur décide
+        assert outer.new
+        with pytest.raises(RuntimeError):
+            outer.commit()
+        outer.rollback()
+
+        # Après annulation par le bloc extérieur, une nouvelle validation est possible
+        outer.add(Client(type='particulier', nom='Durand', prenom='Paul'))
+        outer.commit()
+
+    assert count_clients() == 1
+
+
+def test_exception_rolls_back_and_resets_context(db):
+    with pytest.raises(ValueError):
+        with session_scope() as session:
+            session.add(Client(type='particulier', nom='Martin', prenom='Julie'))
+            session.flush()
+            raise ValueError("erreur")
+
+    assert _current_session.get() is None
+    assert count_clients() == 0
+
+    with session_scope() as first:
+        pass
+    with session_scope() as second:
+        assert second is not first
+
+
+def test_controller_calling_controller_commits_once(db):
+    """update_client appelle get_client_by_id (bloc imbriqué) puis valide sa propre unité de travail"""
+    controller = ClientController()
+    _, _, client = controller.create_client({
+        'type': 'particulier', 'nom': 'Martin', 'prenom': 'Julie', 'adresse': '1 rue Haute',
+        'code_postal': '69003', 'ville': 'Lyon', 'email': 'julie@example.fr'
+    })
+
+    success, _, client = controller.update_client(client.id, {
+        'nom': 'Durand', 'prenom': 'Julie', 'adresse': '1 rue Haute',
+        'code_postal': '69003', 'ville': 'Lyon', 'email': 'julie@example.fr'
+    })
+
+    assert success
+    assert controller.get_client_by_id(client.id).nom == 'Durand'
@@ -0,0 +1,106 @@
+"""
+Tests du service des paramètres (utils/settings.py) et des caches qui en
+dépendent (paramètres des PDF, cache des documents)
+"""
+from datetime import date
+from decimal import Decimal
+import pytest
+from sqlalchemy import event
+from models import Client, Facture, Parametre
+from utils.document_cache import DocumentCache
+from utils.pdf_generator import PDFGenerator, load_parametres
+from utils.settings import settings
+
+
+@pytest.fixture
+def parametres(session):
+    """Paramètres de l'émetteur enregistrés dans la table"""
+    session.add_all([
+        Parametre(cle='emetteur_nom', valeur="Julie Martin", type='string'),
+        Parametre(cle='emetteur_ville', valeur="Lyon", type='string'),
+        Parametre(cle='delai_paiement', valeur="30", type='integer'),
+    ])
+    session.commit()
+    settings.invalidate()
+
+
+@pytest.fixture
+def requetes(db):
+    """Requêtes SQL exécutées sur la base de test"""
+    executees = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        executees.append(statement)
+
+    event.listen(db, 'before_cursor_execute', before_cursor_execute)
+    yield executees
+    event.remove(db, 'before_cursor_execute', before_cursor_execute)
+
+
+def test_unchanged_settings_are_served_from_memory(parametres, requetes):
+    assert settings.get('delai_paiement') == 30
+    version = settings.version
+    pdf_parametres = load_parametres()
+    nb_requetes = len(requetes)
+    assert nb_requetes == 1
+
+    assert settings.get('emetteur_nom') == "Julie Martin"
+    assert settings.get('absent', 'defaut') == 'defaut'
+    assert settings.get_many(['emetteur_ville', 'absent']) == {'emetteur_ville': "Lyon"}
+    assert load_parametres() is pdf_parametres
+
+    assert len(requetes) == nb_requetes
+    assert settings.version == version
+
+
+def test_set_bumps_version_and_reloads_values(parametres, requetes):
+    assert settings.get('delai_paiement') == 30
+    pdf_parametres = load_parametres()
+    version = settings.version
+
+    success, _ = settings.set('delai_paiement', 45)
+    assert success
+    assert settings.version == version + 1
+
+    assert settings.get('delai_paiement') == 45
+    # Paramètres des PDF recalculés à la nouvelle version
+    assert load_parametres() is not pdf_parametres
+    assert load_parametres() == {'emetteur_nom': "Julie Martin", 'emetteur_ville': "Lyon"}
+
+    settings.set('emetteur_ville', "Villeurbanne")
+    assert load_parametres()['emetteur_ville'] == "Villeurbanne"
+
+
+def test_invalidate_rereads_table(parametres, session):
+    assert settings.get('emetteur_nom') == "Julie Martin"
+    session.query(Parametre).filter_by(cle='emetteur_nom').update({'valeur': "Paul Durand"})
+    session.commit()
+    assert settings.get('emetteur_nom') == "Julie Martin"
+
+    version = settings.version
+    settings.invalidate()
+
+    assert settings.version == version + 1
+    assert settings.get('emetteur_nom') == "Paul Durand"
+
+
+def test_changed_setting_invalidates_documents(parametres, session, tmp_path):
+    facture = Facture(
+        numero='FACT-2025-001', client=Client(type='particulier', nom='Leroy', prenom='Anne'),
+        date_emission=date(2025, 1, 15), date_echeance=date(2025, 2, 15), statut='emise',
+        montant_total_ht=Decimal('100.00')
+    )
+    session.add(facture)
+    session.commit()
+    index_path = tmp_path / "index.json"
+
+    with DocumentCache(PDFGenerator(load_parametres()), index_path=index_path) as cache:
+        path = cache.save(facture, tmp_path)
+    assert DocumentCache(PDFGenerator(load_parametres()), index_path=index_path).is_up_to_date(facture, path)
+
+    # Paramètre sans effet sur les PDF : documents toujours à jour
+    settings.set('delai_paiement', 45)
+    assert DocumentCache(PDFGenerator(load_parametres()), index_path=index_path).is_up_to_date(facture, path)
+
+    settings.set('emetteur_ville', "Villeurbanne")
+    assert not DocumentCache(PDFGenerator(load_parametres()), index_path=index_path).is_up_to_date(facture, path)
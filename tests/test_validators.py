@@ -0,0 +1,39 @@
+"""
+Tests des validateurs (utils/validators.py)
+"""
+from utils.validators import check_siret, validate_clients_batch, validate_siret
+
+
+SIRETS = [
+    "73282932000074",       # Clé de Luhn correcte
+    "732 829 320 00074",    # Avec espaces
+    "732-829-320-00074",    # Avec tirets
+    "73282932000075",       # Clé incorrecte
+    "35600000010000",       # La Poste : somme des chiffres multiple de 5
+    "35600000010001",       # La Poste, somme incorrecte
+    "7328293200007",        # 13 chiffres
+    "7328293200007A",
+    "",
+    None,
+]
+
+
+def test_check_siret_matches_validate_siret():
+    """Le contrôle par colonne donne le même résultat que le validateur unitaire"""
+    assert check_siret(SIRETS) == [validate_siret(siret)[0] for siret in SIRETS]
+    assert check_siret(SIRETS)[:5] == [True, True, True, False, True]
+
+
+def test_validate_clients_batch_reports_invalid_siret():
+    entreprise = {
+        'type': 'entreprise', 'raison_sociale': "Club Forme", 'adresse': "1 rue du Stade",
+        'code_postal': "69003", 'ville': "Lyon", 'email': "contact@example.fr",
+    }
+
+    errors = validate_clients_batch([
+        {**entreprise, 'siret': "73282932000074"},
+        {**entreprise, 'siret': "73282932000075"},
+        {**entreprise, 'siret': "35600000010000"},
+    ])
+
+    assert errors == {1: ('siret', "Le SIRET n'est pas valide (clé de contrôle incorrecte)")}
@@ -0,0 +1,413 @@
+"""
+Sauvegarde incrémentale et restauration de la base et des documents PDF
+
+Organisation de BACKUP_DIR :
+    objects/ab/abcd...      contenus stockés une seule fois, nommés par leur SHA-256
+    snapshots/<nom>.json    manifeste d'une sauvegarde (base + liste des documents)
+
+- La base est copiée avec l'API de sauvegarde en ligne de SQLite : en mode WAL
+  la copie se fait dans une transaction de lecture, sans bloquer les écritures
+  de l'application.
+- Les documents sont stockés par contenu : un PDF inchangé n'est jamais recopié.
+  Un fichier dont la taille et la date de modification n'ont pas changé depuis
+  la sauvegarde précédente n'est même pas relu.
+- La restauration copie les fichiers en parallèle et vérifie chaque fichier
+  restauré contre l'empreinte enregistrée.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from pathlib import Path
+from config import (
+    BACKUP_DIR, DATABASE_PATH, DOCUMENTS_DIR,
+    BACKUP_KEEP_DAILY, BACKUP_KEEP_WEEKLY, BACKUP_RESTORE_WORKERS
+)
+
+
+CHUNK_SIZE = 1024 * 1024
+
+# Date dans le nom des sauvegardes (ex: 20250314-093012-123456-daily)
+SNAPSHOT_DATE_FORMAT = '%Y%m%d-%H%M%S-%f'
+
+# Pages copiées par étape quand la base n'est pas en mode WAL (verrou relâché entre deux étapes)
+PAGES_PAR_ETAPE = 1024
+
+
+def _copy_hashed(source: Path, destination: Path) -> str:
+    """Copie un fichier en calculant son SHA-256 au passage (une seule lecture)"""
+    digest = hashlib.sha256()
+    with open(source, 'rb') as src, open(destination, 'wb') as dst:
+        while chunk := src.read(CHUNK_SIZE):
+            digest.update(chunk)
+            dst.write(chunk)
+    return digest.hexdigest()
+
+
+def _hash_file(path: Path) -> str:
+    """Retourne le SHA-256 d'un fichier"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        while chunk := file.read(CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+class BackupManager:
+    """Sauvegardes de la base et des documents dans un stockage par contenu"""
+
+    def __init__(self, backup_dir: Path | None = None, database_path: Path | None = None, documents_dir: Path | None = None):
+        """
+        Initialise le gestionnaire.
+
+        Args:
+            backup_dir: Dossier des sauvegardes (BACKUP_DIR par défaut)
+            database_path: Base sauvegardée (DATABASE_PATH par défaut)
+            documents_dir: Dossier des documents sauvegardés (DOCUMENTS_DIR par défaut)
+        """
+        self.backup_dir = Path(backup_dir or BACKUP_DIR)
+        self.database_path = Path(database_path or DATABASE_PATH)
+        self.documents_dir = Path(documents_dir or DOCUMENTS_DIR)
+        self.objects_dir = self.backup_dir / "objects"
+        self.snapshots_dir = self.backup_dir / "snapshots"
+        self._lock = threading.Lock()
+
+    # --- Stockage par contenu ---
+
+    def _object_path(self, sha256: str) -> Path:
+        return self.objects_dir / sha256[:2] / sha256
+
+    def _store_object(self, source: Path) -> tuple[str, bool]:
+        """
+        Ajoute un fichier au stockage en une seule lecture (copie et empreinte).
+
+        Returns:
+            tuple: (empreinte du contenu lu, True s'il a été copié, False s'il y était déjà)
+        """
+        self.objects_dir.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.objects_dir, suffix=".tmp")
+        os.close(fd)
+        tmp_path = Path(tmp_path)
+
+        try:
+            sha256 = _copy_hashed(source, tmp_path)
+            target = self._object_path(sha256)
+            if target.exists():
+                tmp_path.unlink()
+                return sha256, False
+            target.parent.mkdir(exist_ok=True)
+            os.replace(tmp_path, target)
+            return sha256, True
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+    # --- Sauvegarde ---
+
+    def _snapshot_database(self, destination: Path):
+        """Copie cohérente de la base avec l'API de sauvegarde en ligne SQLite"""
+        source = sqlite3.connect(self.database_path)
+        target = sqlite3.connect(destination)
+        try:
+            journal_mode = source.execute("PRAGMA journal_mode").fetchone()[0]
+            if journal_mode.lower() == 'wal':
+                # Lecture d'un instantané : les écritures de l'application continuent
+                source.backup(target)
+            else:
+                source.backup(target, pages=PAGES_PAR_ETAPE, sleep=0.005)
+        finally:
+            target.close()
+            source.close()
+
+    def _previous_documents(self) -> dict:
+        """Documents de la dernière sauvegarde : {chemin: entrée}"""
+        snapshots = self.list_snapshots()
+        if not snapshots:
+            return {}
+        manifest = self.load_manifest(snapshots[-1]['name'])
+        return {entry['path']: entry for entry in manifest['documents']}
+
+    def _iter_documents(self):
+        """Fichiers du dossier documents (hors fichiers cachés et temporaires)"""
+        if not self.documents_dir.is_dir():
+            return
+        for path in sorted(self.documents_dir.rglob('*')):
+            relative = path.relative_to(self.documents_dir)
+            if path.is_file() and not any(part.startswith('.') for part in relative.parts):
+                yield path, relative.as_posix()
+
+    def create_backup(self, kind: str = 'manual') -> dict:
+        """
+        Crée une sauvegarde de la base et des documents.
+
+        Args:
+            kind: 'daily', 'weekly' ou 'manual'
+
+        Returns:
+            dict: Manifeste (name, kind, created, database, documents, stats)
+        """
+        with self._lock:
+            now = datetime.now()
+            # Nom unique même pour deux sauvegardes dans la même seconde (microsecondes)
+            while (self.snapshots_dir / f"{now:{SNAPSHOT_DATE_FORMAT}}-{kind}.json").exists():
+                now += timedelta(microseconds=1)
+            name = f"{now:{SNAPSHOT_DATE_FORMAT}}-{kind}"
+            previous = self._previous_documents()
+            stats = {'documents': 0, 'copies': 0, 'relus': 0, 'octets_copies': 0}
+
+            # Base : instantané dans un fichier temporaire puis stockage
+            self.backup_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.TemporaryDirectory(dir=self.backup_dir) as tmp:
+                snapshot_path = Path(tmp) / "facturation.db"
+                self._snapshot_database(snapshot_path)
+                database = {
+                    'sha256': self._store_object(snapshot_path)[0],
+                    'size': snapshot_path.stat().st_size
+                }
+
+            documents = []
+            for path, relative in self._iter_documents():
+                stat = path.stat()
+                entry = previous.get(relative)
+
+                if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+                    # Inchangé depuis la dernière sauvegarde : ni relu ni copié
+                    sha256 = entry['sha256']
+                    copied = False
+                    if not self._object_path(sha256).exists():
+                        # Contenu absent du stockage : le fichier est relu, son empreinte
+                        # réelle (contenu éventuellement modifié) remplace l'ancienne
+                        sha256, copied = self._store_object(path)
+                else:
+                    # Empreinte du contenu effectivement stocké (une seule lecture du fichier)
+                    stats['relus'] += 1
+                    sha256, copied = self._store_object(path)
+
+                if copied:
+                    stats['copies'] += 1
+                    stats['octets_copies'] += stat.st_size
+
+                documents.append({
+                    'path': relative, 'sha256': sha256, 'size': stat.st_size, 'mtime_ns': stat.st_mtime_ns
+                })
+
+            stats['documents'] = len(documents)
+            manifest = {
+                'name': name,
+                'kind': kind,
+                'created': now.isoformat(timespec='seconds'),
+                'database': database,
+                'documents': documents,
+                'stats': stats
+            }
+
+            self.snapshots_dir.mkdir(parents=True, exist_ok=True)
+            tmp_manifest = self.snapshots_dir / f".{name}.json.tmp"
+            tmp_manifest.write_text(json.dumps(manifest, indent=1), encoding='utf-8')
+            os.replace(tmp_manifest, self.snapshots_dir / f"{name}.json")
+
+            return manifest
+
+    # --- Liste, rétention ---
+
+    def list_snapshots(self) -> list[dict]:
+        """
+        Liste les sauvegardes, de la plus ancienne à la plus récente.
+
+        Returns:
+            list[dict]: {'name', 'kind', 'created'}
+        """
+        if not self.snapshots_dir.is_dir():
+            return []
+
+        snapshots = []
+        for path in self.snapshots_dir.glob('*.json'):
+            name = path.stem
+            date_part, _, kind = name.rpartition('-')
+            # Sauvegardes antérieures : nom à la seconde, sans microsecondes
+            date_format = SNAPSHOT_DATE_FORMAT if date_part.count('-') == 2 else '%Y%m%d-%H%M%S'
+            snapshots.append({
+                'name': name,
+                'kind': kind,
+                'created': datetime.strptime(date_part, date_format)
+            })
+        snapshots.sort(key=lambda snapshot: snapshot['created'])
+        return snapshots
+
+    def load_manifest(self, name: str) -> dict:
+        """Lit le manifeste d'une sauvegarde"""
+        return json.loads((self.snapshots_dir / f"{name}.json").read_text(encoding='utf-8'))
+
+    def prune(self, keep_daily: int = BACKUP_KEEP_DAILY, keep_weekly: int = BACKUP_KEEP_WEEKLY) -> int:
+        """
+        Supprime les sauvegardes quotidiennes et hebdomadaires au-delà de la rétention
+        (les sauvegardes manuelles sont conservées), puis les contenus qui ne sont plus référencés.
+
+        Returns:
+            int: Nombre de contenus supprimés
+        """
+        with self._lock:
+            snapshots = self.list_snapshots()
+            for kind, keep in (('daily', keep_daily), ('weekly', keep_weekly)):
+                of_kind = [snapshot for snapshot in snapshots if snapshot['kind'] == kind]
+                for snapshot in of_kind[:max(len(of_kind) - keep, 0)]:
+                    (self.snapshots_dir / f"{snapshot['name']}.json").unlink()
+
+            referenced = set()
+            for snapshot in self.list_snapshots():
+                manifest = self.load_manifest(snapshot['name'])
+                referenced.add(manifest['database']['sha256'])
+                referenced.update(entry['sha256'] for entry in manifest['documents'])
+
+            removed = 0
+            if self.objects_dir.is_dir():
+                for path in self.objects_dir.glob('*/*'):
+                    if path.name not in referenced:
+                        path.unlink()
+                        removed += 1
+            return removed
+
+    def run_scheduled_backup(self, now: datetime | None = None) -> dict | None:
+        """
+        Sauvegarde planifiée (à appeler au démarrage) : une sauvegarde par jour,
+        hebdomadaire si la dernière hebdomadaire a plus de 7 jours.
+
+        Returns:
+            dict | None: Manifeste créé, ou None si une sauvegarde du jour existe déjà
+        """
+        now = now or datetime.now()
+        scheduled = [snapshot for snapshot in self.list_snapshots() if snapshot['kind'] in ('daily', 'weekly')]
+
+        if any(snapshot['created'].date() == now.date() for snapshot in scheduled):
+            return None
+
+        weekly = [snapshot for snapshot in scheduled if snapshot['kind'] == 'weekly']
+        kind = 'weekly' if not weekly or now - weekly[-1]['created'] >= timedelta(days=7) else 'daily'
+
+        manifest = self.create_backup(kind)
+        self.prune()
+        return manifest
+
+    # --- Vérification, restauration ---
+
+    def _restore_file(self, sha256: str, destination: Path, before_replace=None) -> str | None:
+        """
+        Restaure un contenu vers un fichier en vérifiant son empreinte avant de remplacer
+        le fichier existant. Retourne l'erreur éventuelle.
+        """
+        source = self._object_path(sha256)
+        if not source.exists():
+            return f"{destination.name} : contenu absent de la sauvegarde"
+
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=destination.parent, prefix=f".{destination.name}.", suffix=".tmp")
+        os.close(fd)
+
+        try:
+            if _copy_hashed(source, Path(tmp_path)) != sha256:
+                Path(tmp_path).unlink()
+                return f"{destination.name} : empreinte incorrecte (sauvegarde corrompue)"
+            if before_replace:
+                before_replace()
+            os.replace(tmp_path, destination)
+            return None
+        except OSError as e:
+            Path(tmp_path).unlink(missing_ok=True)
+            return f"{destination.name} : {e}"
+
+    def verify(self, name: str, workers: int = BACKUP_RESTORE_WORKERS) -> list[str]:
+        """
+        Vérifie en parallèle que tous les contenus d'une sauvegarde sont présents et intacts.
+
+        Returns:
+            list[str]: Erreurs (liste vide si la sauvegarde est intacte)
+        """
+        manifest = self.load_manifest(name)
+        expected = {manifest['database']['sha256']} | {entry['sha256'] for entry in manifest['documents']}
+
+        def check(sha256):
+            path = self._object_path(sha256)
+            if not path.exists():
+                return f"{sha256[:12]} : contenu absent"
+            if _hash_file(path) != sha256:
+                return f"{sha256[:12]} : empreinte incorrecte"
+            return None
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            return [error for error in executor.map(check, sorted(expected)) if error]
+
+    def restore(
+        self,
+        name: str,
+        database_path: Path | None = None,
+        documents_dir: Path | None = None,
+        workers: int = BACKUP_RESTORE_WORKERS
+    ) -> list[str]:
+        """
+        Restaure une sauvegarde : fichiers copiés en parallèle et vérifiés un à un.
+        L'application ne doit pas utiliser la base pendant la restauration
+        (engine fermé, voir database.init_db.get_engine().dispose()).
+
+        Args:
+            name: Nom de la sauvegarde (voir list_snapshots)
+            database_path: Base restaurée (celle du gestionnaire par défaut)
+            documents_dir: Dossier des documents restaurés (celui du gestionnaire par défaut)
+            workers: Nombre de fichiers restaurés en parallèle
+
+        Returns:
+            list[str]: Erreurs (liste vide si la restauration est complète)
+        """
+        manifest = self.load_manifest(name)
+        database_path = Path(database_path or self.database_path)
+        documents_dir = Path(documents_dir or self.documents_dir)
+
+        def remove_wal():
+            # Journal WAL de l'ancienne base : il ne doit pas être rejoué sur la base restaurée
+            for suffix in ('-wal', '-shm'):
+                Path(f"{database_path}{suffix}").unlink(missing_ok=True)
+
+        def restore_document(entry):
+            destination = documents_dir / entry['path']
+            # Document déjà identique : rien à copier
+            if destination.is_file() and destination.stat().st_size == entry['size'] \
+                    and _hash_file(destination) == entry['sha256']:
+                return None
+            return self._restore_file(entry['sha256'], destination)
+
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            database_error = executor.submit(
+                self._restore_file, manifest['database']['sha256'], database_path, remove_wal
+            )
+            errors = [error for error in executor.map(restore_document, manifest['documents']) if error]
+
+        if database_error.result():
+            errors.insert(0, database_error.result())
+
+        return errors
+
+
+def start_scheduled_backup(manager: BackupManager | None = None) -> threading.Thread:
+    """
+    Lance la sauvegarde planifiée dans un thread d'arrière-plan (démarrage de l'application).
+
+    Returns:
+        threading.Thread: Thread de sauvegarde
+    """
+    manager = manager or BackupManager()
+
+    def run():
+        try:
+            manifest = manager.run_scheduled_backup()
+            if manifest:
+                stats = manifest['stats']
+                print(f"[OK] Sauvegarde {manifest['name']} : {stats['documents']} documents, {stats['copies']} copies")
+        except Exception as e:
+            print(f"[ERREUR] Sauvegarde automatique : {e}")
+
+    thread = threading.Thread(target=run, name="sauvegarde", daemon=True)
+    thread.start()
+    return thread
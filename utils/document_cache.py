@@ -0,0 +1,265 @@
+"""
+Cache des documents PDF générés, par empreinte du contenu
+
+Un PDF n'est régénéré que si son empreinte (utils.pdf_generator.document_fingerprint :
+document, lignes, client, paramètres de l'émetteur, version du rendu) a changé :
+- fichiers enregistrés : l'index DOCUMENT_CACHE_INDEX associe chaque fichier sous
+  DOCUMENTS_DIR à l'empreinte de son contenu, au document dont il est issu et à
+  la taille et la date de modification du fichier écrit (un fichier tronqué ou
+  remplacé depuis n'est pas réutilisé). Quand le nom d'un document change (client
+  renommé), l'ancien fichier est supprimé. L'index est écrit par flush() ou à la
+  fermeture du cache, pas à chaque enregistrement ;
+- prévisualisations : les PDF rendus en mémoire sont gardés dans une limite de
+  taille (DOCUMENT_CACHE_PREVIEW_MAX_MO), les moins récemment utilisés sont évincés.
+
+Usage :
+    with DocumentCache(PDFGenerator(parametres)) as cache:
+        pdf_bytes = cache.render(facture)   # prévisualisation
+        chemin = cache.save(facture)        # export (réutilise le fichier s'il est à jour)
+"""
+import json
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from config import DOCUMENTS_DIR, DOCUMENT_CACHE_INDEX, DOCUMENT_CACHE_PREVIEW_MAX_MO
+from utils.pdf_generator import PDFGenerator, document_fingerprint, document_path, write_atomic
+
+
+class DocumentCache:
+    """Cache des PDF (fichiers enregistrés et prévisualisations en mémoire)"""
+
+    def __init__(
+        self,
+        generator: PDFGenerator,
+        index_path: Path | None = None,
+        max_preview_bytes: int | None = None
+    ):
+        """
+        Initialise le cache.
+
+        Args:
+            generator: Générateur utilisé en cas d'absence dans le cache
+            index_path: Index des fichiers enregistrés (DOCUMENT_CACHE_INDEX par défaut)
+            max_preview_bytes: Taille maximale des prévisualisations en mémoire
+        """
+        self.generator = generator
+        self.index_path = Path(index_path or DOCUMENT_CACHE_INDEX)
+        self.max_preview_bytes = max_preview_bytes or DOCUMENT_CACHE_PREVIEW_MAX_MO * 1024 * 1024
+
+        self._lock = threading.Lock()
+        self._index = self._load_index()
+        self._index_modifie = False
+        # Document ("Facture:12") -> fichier de l'index, pour retrouver l'ancien nom d'un document
+        self._fichiers = {entry['document']: key for key, entry in self._index.items()}
+        self._previews: OrderedDict[str, bytes] = OrderedDict()
+        self._preview_bytes = 0
+
+        self.counters = {
+            'hits': 0, 'misses': 0, 'preview_hits': 0, 'preview_misses': 0, 'evictions': 0, 'orphelins': 0
+        }
+
+    def _load_index(self) -> dict:
+        """
+        Lit l'index {chemin relatif: {empreinte, document, taille, mtime_ns}}
+        (vide s'il est absent ou illisible ; les entrées d'un ancien format sont ignorées).
+        """
+        try:
+            index = json.loads(self.index_path.read_text(encoding='utf-8'))
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            print(f"[INFO] Index du cache des documents ignore ({e})")
+            return {}
+        return {key: entry for key, entry in index.items() if isinstance(entry, dict) and 'document' in entry}
+
+    def flush(self):
+        """Écrit l'index des fichiers s'il a changé (fin d'un lot, fermeture)"""
+        with self._lock:
+            if not self._index_modifie:
+                return
+            data = json.dumps(self._index, indent=0, sort_keys=True).encode('utf-8')
+            self._index_modifie = False
+
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.index_path, data)
+
+    def close(self):
+        """Ferme le cache : écrit l'index et libère les prévisualisations"""
+        self.flush()
+        self.clear_previews()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, traceback):
+        self.close()
+
+    @staticmethod
+    def _document_key(document) -> str:
+        """Identifiant stable d'un document (ex: "Facture:12"), indépendant du nom du fichier"""
+        return f"{type(document).__name__}:{document.id}"
+
+    @staticmethod
+    def _is_intact(path: Path, entry: dict) -> bool:
+        """Vrai si le fichier est celui écrit par le cache (même taille et date de modification)"""
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        return stat.st_size == entry['taille'] and stat.st_mtime_ns == entry['mtime_ns']
+
+    def is_up_to_date(self, document, path: Path | None = None) -> bool:
+        """
+        Indique si le fichier enregistré d'un document est à jour (sans le régénérer).
+
+        Args:
+            document: Facture, Devis ou Avoir
+            path: Chemin du fichier (par défaut documents/<type>/AAAA/)
+
+        Returns:
+            bool: True si le fichier existe, est intact et correspond au contenu actuel
+        """
+        path = path or document_path(document)
+        empreinte = document_fingerprint(document, self.generator.parametres)
+        with self._lock:
+            entry = self._index.get(self._index_key(path))
+        return entry is not None and entry['empreinte'] == empreinte and self._is_intact(path, entry)
+
+    def record(self, document, path: Path, empreinte: str | None = None):
+        """
+        Enregistre dans l'index un fichier écrit pour un document ; supprime
+        l'ancien fichier du document s'il portait un autre nom (client renommé).
+
+        Args:
+            document: Facture, Devis ou Avoir
+            path: Fichier écrit
+            empreinte: Empreinte du contenu (calculée si None)
+        """
+        if empreinte is None:
+            empreinte = document_fingerprint(document, self.generator.parametres)
+        stat = path.stat()
+        key, document_key = self._index_key(path), self._document_key(document)
+
+        with self._lock:
+            ancienne_cle = self._fichiers.get(document_key)
+            if ancienne_cle is not None and ancienne_cle != key:
+                ancienne = self._index.pop(ancienne_cle)
+                ancien_chemin = self._key_path(ancienne_cle)
+                # Fichier supprimé seulement s'il n'a pas été modifié depuis son écriture
+                if self._is_intact(ancien_chemin, ancienne):
+                    ancien_chemin.unlink(missing_ok=True)
+                self.counters['orphelins'] += 1
+
+            self._index[key] = {
+                'empreinte': empreinte, 'document': document_key,
+                'taille': stat.st_size, 'mtime_ns': stat.st_mtime_ns
+            }
+            self._fichiers[document_key] = key
+            self._index_modifie = True
+
+    @staticmethod
+    def _index_key(path: Path) -> str:
+        """Chemin relatif à DOCUMENTS_DIR (absolu si le fichier est ailleurs)"""
+        path = path.resolve()
+        try:
+            return path.relative_to(DOCUMENTS_DIR.resolve()).as_posix()
+        except ValueError:
+            return str(path)
+
+    @staticmethod
+    def _key_path(key: str) -> Path:
+        """Chemin d'un fichier à partir de sa clé dans l'index"""
+        path = Path(key)
+        return path if path.is_absolute() else DOCUMENTS_DIR / path
+
+    def render(self, document) -> bytes:
+        """
+        Retourne le PDF d'un document en mémoire (prévisualisation), rendu seulement si nécessaire.
+
+        Args:
+            document: Facture, Devis ou Avoir
+
+        Returns:
+            bytes: Contenu du PDF
+        """
+        empreinte = document_fingerprint(document, self.generator.parametres)
+
+        with self._lock:
+            pdf = self._previews.get(empreinte)
+            if pdf is not None:
+                self._previews.move_to_end(empreinte)
+                self.counters['preview_hits'] += 1
+                return pdf
+            self.counters['preview_misses'] += 1
+
+        pdf = self.generator.render(document)
+        self._store_preview(empreinte, pdf)
+        return pdf
+
+    def _store_preview(self, empreinte: str, pdf: bytes):
+        """Garde une prévisualisation en évinçant les moins récemment utilisées"""
+        if len(pdf) > self.max_preview_bytes:
+            return
+
+        with self._lock:
+            if empreinte in self._previews:
+                return
+            self._previews[empreinte] = pdf
+            self._preview_bytes += len(pdf)
+
+            while self._preview_bytes > self.max_preview_bytes:
+                _, evicted = self._previews.popitem(last=False)
+                self._preview_bytes -= len(evicted)
+                self.counters['evictions'] += 1
+
+    def save(self, document, directory: Path | None = None) -> Path:
+        """
+        Enregistre le PDF d'un document, sauf si le fichier existant est déjà à jour.
+
+        Args:
+            document: Facture, Devis ou Avoir
+            directory: Dossier de destination (par défaut documents/<type>/AAAA/)
+
+        Returns:
+            Path: Chemin du fichier
+        """
+        empreinte = document_fingerprint(document, self.generator.parametres)
+
+        path = document_path(document, directory)
+        key = self._index_key(path)
+
+        with self._lock:
+            entry = self._index.get(key)
+            if entry is not None and entry['empreinte'] == empreinte and self._is_intact(path, entry):
+                self.counters['hits'] += 1
+                return path
+            self.counters['misses'] += 1
+            # Réutiliser la prévisualisation si le document vient d'être affiché
+            pdf = self._previews.get(empreinte)
+
+        if pdf is not None:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(path, pdf)
+        else:
+            path = self.generator.save(document, directory)
+
+        self.record(document, path, empreinte)
+        return path
+
+    def stats(self) -> dict:
+        """
+        Retourne les compteurs du cache.
+
+        Returns:
+            dict: hits/misses (fichiers), preview_hits/preview_misses, evictions,
+                  orphelins (anciens fichiers supprimés), previews (nombre),
+                  preview_bytes (taille en mémoire)
+        """
+        with self._lock:
+            return {**self.counters, 'previews': len(self._previews), 'preview_bytes': self._preview_bytes}
+
+    def clear_previews(self):
+        """Vide les prévisualisations en mémoire"""
+        with self._lock:
+            self._previews.clear()
+            self._preview_bytes = 0
@@ -0,0 +1,209 @@
+"""
+Exports comptables en CSV : livre des recettes, factures, paiements, avoirs
+
+Les lignes sont lues par lots (yield_per : le curseur n'est jamais chargé en
+entier) et écrites au fur et à mesure. Seules les colonnes exportées sont
+sélectionnées, sans construire d'objets ORM : la mémoire utilisée ne dépend
+pas du nombre de lignes, quelle que soit la période exportée.
+
+Format : UTF-8 avec BOM, séparateur ';', montants à virgule décimale,
+dates JJ/MM/AAAA (ouverture directe dans un tableur en français).
+
+Usage :
+    with get_session() as session:
+        nb = export_livre_recettes(session, "recettes_2025.csv", date(2025, 1, 1), date(2025, 12, 31))
+"""
+import csv
+import os
+import tempfile
+from datetime import date
+from decimal import Decimal
+from pathlib import Path
+from sqlalchemy import select, case, func, literal
+from sqlalchemy.orm import Session
+from config import EXPORT_BATCH_SIZE, EXPORT_CSV_DELIMITER
+from models import Client, Facture, Paiement, Avoir
+
+
+# Nom du client calculé en SQL (même règle que Client.nom_complet)
+CLIENT_NOM = case(
+    (Client.type == 'entreprise', func.coalesce(Client.raison_sociale, '')),
+    else_=func.trim(func.coalesce(Client.prenom, '') + literal(' ') + func.coalesce(Client.nom, ''))
+)
+
+
+def _format_value(value) -> str:
+    """Formate une valeur pour le CSV (montants à virgule, dates JJ/MM/AAAA)"""
+    if value is None:
+        return ''
+    if isinstance(value, (Decimal, float)):
+        return f"{value:.2f}".replace('.', ',')
+    if isinstance(value, date):
+        return value.strftime('%d/%m/%Y')
+    return str(value)
+
+
+def _between(column, date_debut: date | None, date_fin: date | None) -> list:
+    """Conditions de période (bornes incluses, optionnelles)"""
+    conditions = []
+    if date_debut:
+        conditions.append(column >= date_debut)
+    if date_fin:
+        conditions.append(column <= date_fin)
+    return conditions
+
+
+def stream_csv(session: Session, statement, headers: list[str], destination, batch_size: int = EXPORT_BATCH_SIZE) -> int:
+    """
+    Exécute une requête et écrit ses lignes dans un CSV, lot par lot.
+    Le fichier est écrit dans un fichier temporaire puis renommé : un export
+    interrompu ne laisse pas de CSV incomplet.
+
+    Args:
+        session: Session SQLAlchemy
+        statement: Requête select() des colonnes exportées (dans l'ordre des en-têtes)
+        headers: En-têtes des colonnes
+        destination: Chemin du fichier CSV
+        batch_size: Nombre de lignes lues et écrites par lot
+
+    Returns:
+        int: Nombre de lignes exportées
+    """
+    destination = Path(destination)
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=destination.parent, prefix=f".{destination.name}.", suffix=".tmp")
+
+    count = 0
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8-sig', newline='') as file:
+            writer = csv.writer(file, delimiter=EXPORT_CSV_DELIMITER)
+            writer.writerow(headers)
+
+            result = session.execute(statement.execution_options(yield_per=batch_size))
+            for rows in result.partitions():
+                writer.writerows([_format_value(value) for value in row] for row in rows)
+                count += len(rows)
+
+        os.replace(tmp_path, destination)
+        return count
+
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def export_livre_recettes(session: Session, destination, date_debut: date | None = None, date_fin: date | None = None) -> int:
+    """
+    Exporte le livre des recettes : encaissements par ordre chronologique.
+
+    Args:
+        session: Session SQLAlchemy
+        destination: Chemin du fichier CSV
+        date_debut: Date d'encaissement minimale (incluse)
+        date_fin: Date d'encaissement maximale (incluse)
+
+    Returns:
+        int: Nombre d'encaissements exportés
+    """
+    statement = select(
+        Paiement.date_paiement,
+        Facture.numero,
+        CLIENT_NOM,
+        Paiement.montant,
+        Paiement.moyen_paiement,
+        Paiement.reference
+    ).join(Paiement.facture).join(Facture.client).where(
+        *_between(Paiement.date_paiement, date_debut, date_fin)
+    ).order_by(Paiement.date_paiement, Paiement.id)
+
+    headers = ["Date d'encaissement", "Référence de la facture", "Client", "Montant", "Mode de règlement", "Référence du règlement"]
+    return stream_csv(session, statement, headers, destination)
+
+
+def export_factures(session: Session, destination, date_debut: date | None = None, date_fin: date | None = None) -> int:
+    """
+    Exporte les factures émises sur une période (montants payés et restants calculés en SQL).
+
+    Args:
+        session: Session SQLAlchemy
+        destination: Chemin du fichier CSV
+        date_debut: Date d'émission minimale (incluse)
+        date_fin: Date d'émission maximale (incluse)
+
+    Returns:
+        int: Nombre de factures exportées
+    """
+    statement = select(
+        Facture.numero,
+        Facture.date_emission,
+        Facture.date_echeance,
+        CLIENT_NOM,
+        Client.siret,
+        Facture.statut,
+        Facture.montant_total_ht,
+        Facture.montant_paye,
+        Facture.montant_restant
+    ).join(Facture.client).where(
+        *_between(Facture.date_emission, date_debut, date_fin)
+    ).order_by(Facture.date_emission, Facture.id)
+
+    headers = ["Numéro", "Date d'émission", "Date d'échéance", "Client", "SIRET client", "Statut",
+               "Montant HT", "Montant payé", "Reste à payer"]
+    return stream_csv(session, statement, headers, destination)
+
+
+def export_paiements(session: Session, destination, date_debut: date | None = None, date_fin: date | None = None) -> int:
+    """
+    Exporte les paiements reçus sur une période.
+
+    Args:
+        session: Session SQLAlchemy
+        destination: Chemin du fichier CSV
+        date_debut: Date de paiement minimale (incluse)
+        date_fin: Date de paiement maximale (incluse)
+
+    Returns:
+        int: Nombre de paiements exportés
+    """
+    statement = select(
+        Paiement.date_paiement,
+        Facture.numero,
+        CLIENT_NOM,
+        Paiement.montant,
+        Paiement.moyen_paiement,
+        Paiement.reference,
+        Paiement.notes
+    ).join(Paiement.facture).join(Facture.client).where(
+        *_between(Paiement.date_paiement, date_debut, date_fin)
+    ).order_by(Paiement.date_paiement, Paiement.id)
+
+    headers = ["Date", "Facture", "Client", "Montant", "Moyen de paiement", "Référence", "Notes"]
+    return stream_csv(session, statement, headers, destination)
+
+
+def export_avoirs(session: Session, destination, date_debut: date | None = None, date_fin: date | None = None) -> int:
+    """
+    Exporte les avoirs émis sur une période.
+
+    Args:
+        session: Session SQLAlchemy
+        destination: Chemin du fichier CSV
+        date_debut: Date d'émission minimale (incluse)
+        date_fin: Date d'émission maximale (incluse)
+
+    Returns:
+        int: Nombre d'avoirs exportés
+    """
+    statement = select(
+        Avoir.numero,
+        Avoir.date_emission,
+        Facture.numero,
+        CLIENT_NOM,
+        Avoir.montant_total,
+        Avoir.motif
+    ).join(Avoir.facture).join(Facture.client).where(
+        *_between(Avoir.date_emission, date_debut, date_fin)
+    ).order_by(Avoir.date_emission, Avoir.id)
+
+    headers = ["Numéro", "Date d'émission", "Facture d'origine", "Client", "Montant", "Motif"]
+    return stream_csv(session, statement, headers, destination)
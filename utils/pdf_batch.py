@@ -0,0 +1,226 @@
+"""
+Génération des PDF de factures par lot, répartie sur plusieurs processus
+
+ReportLab n'utilise qu'un cœur : les factures sont réparties par paquets
+(PDF_BATCH_CHUNK_SIZE) sur un ProcessPoolExecutor. Chaque processus est
+initialisé une seule fois (imports, connexion à la base, modèles PDF compilés)
+et le pool est conservé entre deux lots tant que le générateur est ouvert.
+
+Les processus relisent les factures dans la base (seuls les identifiants
+transitent entre processus) et écrivent les fichiers de façon atomique
+dans FACTURES_DIR/<année>/. Ils exécutent utils.pdf_worker, sans Qt : en
+"spawn", un processus réimporte aussi le module principal de l'application,
+main.py, qui n'importe rien hors de son bloc principal.
+
+Les factures dont le fichier est à jour dans le cache des documents
+(utils.document_cache) ne sont pas envoyées aux processus ; l'index du cache
+est écrit à la fin du lot. Un lot annulé s'arrête entre deux factures.
+
+Usage :
+    with BatchPDFGenerator(parametres) as batch:
+        ids = select_factures(session, date_debut=date(2025, 1, 1), date_fin=date(2025, 1, 31))
+        result = batch.generate(ids, progress=lambda done, total: print(done, total))
+"""
+import multiprocessing
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from datetime import date
+from pathlib import Path
+from sqlalchemy.orm import Session, sessionmaker, selectinload, joinedload
+from config import DATABASE_URL, PDF_BATCH_WORKERS, PDF_BATCH_CHUNK_SIZE
+from database.init_db import create_database_engine
+from models import Facture
+from utils import pdf_worker
+from utils.document_cache import DocumentCache
+from utils.pdf_generator import PDFGenerator, document_path
+
+
+# Intervalle de vérification de l'annulation pendant un lot (secondes)
+CANCEL_POLL_INTERVAL = 0.1
+
+
+def select_factures(
+    session: Session,
+    date_debut: date | None = None,
+    date_fin: date | None = None,
+    client_id: int | None = None,
+    statuts: list[str] | None = None
+) -> list[int]:
+    """
+    Sélectionne les factures d'un lot.
+
+    Args:
+        session: Session SQLAlchemy
+        date_debut: Date d'émission minimale (incluse)
+        date_fin: Date d'émission maximale (incluse)
+        client_id: Client des factures
+        statuts: Statuts des factures (ex: ['emise', 'en_retard'])
+
+    Returns:
+        list[int]: Identifiants des factures, par numéro
+    """
+    query = session.query(Facture.id)
+
+    if date_debut:
+        query = query.filter(Facture.date_emission >= date_debut)
+    if date_fin:
+        query = query.filter(Facture.date_emission <= date_fin)
+    if client_id:
+        query = query.filter(Facture.client_id == client_id)
+    if statuts:
+        query = query.filter(Facture.statut.in_(statuts))
+
+    return [facture_id for (facture_id,) in query.order_by(Facture.numero)]
+
+
+class BatchPDFGenerator:
+    """Générateur de PDF par lot sur un pool de processus conservé entre les lots"""
+
+    def __init__(
+        self,
+        parametres: dict | None = None,
+        max_workers: int | None = None,
+        database_url: str | None = None,
+        cache: DocumentCache | None = None
+    ):
+        """
+        Initialise le générateur (le pool est démarré au premier lot).
+
+        Args:
+            parametres: Paramètres de l'émetteur (voir utils.pdf_generator.load_parametres)
+            max_workers: Nombre de processus (PDF_BATCH_WORKERS, ou nombre de cœurs)
+            database_url: Base lue par les processus (DATABASE_URL par défaut)
+            cache: Cache des documents (index DOCUMENT_CACHE_INDEX par défaut)
+        """
+        self.parametres = parametres or {}
+        self.max_workers = max_workers or PDF_BATCH_WORKERS or os.cpu_count() or 1
+        self.database_url = database_url or DATABASE_URL
+        self.cache = cache or DocumentCache(PDFGenerator(self.parametres))
+        self._executor = None
+        self._engine = None
+        self._cancel = None
+
+    def start(self):
+        """Démarre et initialise les processus du pool (s'il ne l'est pas déjà)"""
+        if self._executor is not None:
+            return
+
+        # "spawn" : pas de fork d'un processus Qt multi-thread
+        context = multiprocessing.get_context('spawn')
+        self._cancel = context.Event()
+        self._engine = create_database_engine(self.database_url)
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.max_workers,
+            mp_context=context,
+            initializer=pdf_worker.init_worker,
+            initargs=(self.database_url, self.parametres, self._cancel)
+        )
+
+        # Forcer le démarrage de tous les processus maintenant plutôt qu'au premier paquet
+        for future in [self._executor.submit(os.getpid) for _ in range(self.max_workers)]:
+            future.result()
+
+    def _load_factures(self, facture_ids: list[int]) -> dict[int, Facture]:
+        """Factures du lot avec leur client et leurs lignes (pour l'empreinte du cache)"""
+        with sessionmaker(bind=self._engine, expire_on_commit=False)() as session:
+            factures = session.query(Facture).options(
+                joinedload(Facture.client),
+                selectinload(Facture.lignes)
+            ).filter(Facture.id.in_(facture_ids)).all()
+            return {facture.id: facture for facture in factures}
+
+    def generate(
+        self,
+        facture_ids: list[int],
+        directory: Path | None = None,
+        progress=None,
+        cancel: threading.Event | None = None
+    ) -> dict:
+        """
+        Génère les PDF d'un lot de factures.
+
+        Args:
+            facture_ids: Identifiants des factures (voir select_factures)
+            directory: Dossier de destination (par défaut FACTURES_DIR/<année>/)
+            progress: Fonction appelée avec (faites, total) après chaque paquet
+            cancel: Événement permettant d'interrompre le lot
+
+        Returns:
+            dict: {'fichiers': [(facture_id, chemin)], 'erreurs': [(facture_id, message)],
+                   'a_jour': nombre de fichiers déjà à jour (non régénérés), 'annule': bool}
+        """
+        self.start()
+        self._cancel.clear()
+
+        total = len(facture_ids)
+        factures = self._load_factures(facture_ids)
+        fichiers, erreurs = [], []
+
+        # Fichiers déjà à jour : pas envoyés aux processus
+        a_generer = []
+        for facture_id in facture_ids:
+            facture = factures.get(facture_id)
+            if facture is not None and self.cache.is_up_to_date(facture, document_path(facture, directory)):
+                fichiers.append((facture_id, str(document_path(facture, directory))))
+            else:
+                a_generer.append(facture_id)
+        a_jour = len(fichiers)
+
+        chunks = [a_generer[i:i + PDF_BATCH_CHUNK_SIZE] for i in range(0, len(a_generer), PDF_BATCH_CHUNK_SIZE)]
+        pending = {
+            self._executor.submit(pdf_worker.render_chunk, chunk, str(directory) if directory else None)
+            for chunk in chunks
+        }
+
+        if progress and a_jour:
+            progress(a_jour, total)
+
+        annule = False
+        try:
+            while pending:
+                if cancel is not None and cancel.is_set():
+                    # Les paquets en cours s'arrêtent avant leur facture suivante
+                    annule = True
+                    self._cancel.set()
+                    for future in pending:
+                        future.cancel()
+                    break
+
+                done, pending = wait(pending, timeout=CANCEL_POLL_INTERVAL, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        for facture_id, path, empreinte, error in future.result():
+                            if error:
+                                erreurs.append((facture_id, error))
+                                continue
+                            fichiers.append((facture_id, path))
+                            if facture_id in factures:
+                                self.cache.record(factures[facture_id], Path(path), empreinte)
+                    except Exception as e:
+                        print(f"[ERREUR] Generation PDF par lot: {e}")
+                        erreurs.append((None, str(e)))
+
+                if done and progress:
+                    progress(min(len(fichiers) + len(erreurs), total), total)
+        finally:
+            self.cache.flush()
+
+        return {'fichiers': fichiers, 'erreurs': erreurs, 'a_jour': a_jour, 'annule': annule}
+
+    def shutdown(self):
+        """Arrête les processus du pool"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._executor = None
+        if self._engine is not None:
+            self._engine.dispose()
+            self._engine = None
+        self.cache.flush()
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.shutdown()
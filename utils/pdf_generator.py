@@ -0,0 +1,664 @@
+"""
+Génération des PDF de factures, devis et avoirs (ReportLab)
+
+Les parties fixes d'un document (en-tête avec logo et identité du coach,
+mentions légales, pied de page) ne dépendent que des paramètres : elles sont
+compilées une fois par type de document et par version des paramètres
+(TemplateStatique), puis rejouées pour chaque document. Le logo est décodé et
+redimensionné une seule fois ; dans un PDF, la partie fixe est un objet
+"form XObject" partagé par toutes les pages.
+
+Usage :
+    generator = PDFGenerator(load_parametres())
+    pdf_bytes = generator.render(facture)      # prévisualisation en mémoire
+    chemin = generator.save(facture)           # documents/factures/AAAA/FACT-2025-001_NomClient.pdf
+"""
+import hashlib
+import io
+import json
+import os
+import re
+import tempfile
+from xml.sax.saxutils import escape
+from decimal import Decimal
+from pathlib import Path
+from PIL import Image as PILImage
+from reportlab.lib import colors
+from reportlab.lib.enums import TA_RIGHT
+from reportlab.lib.pagesizes import A4
+from reportlab.lib.styles import ParagraphStyle
+from reportlab.lib.units import mm
+from reportlab.lib.utils import ImageReader, simpleSplit
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.platypus import BaseDocTemplate, Frame, PageTemplate, Paragraph, Spacer, Table, TableStyle
+from config import (
+    APP_NAME, FACTURES_DIR, DEVIS_DIR, AVOIRS_DIR, MENTION_TVA, TAUX_PENALITES,
+    INDEMNITE_RECOUVREMENT, PDF_MARGE_MM, PDF_LOGO_MAX_HAUTEUR_PX
+)
+from models import Facture, Devis, Avoir
+from utils.settings import settings
+
+
+PAGE_WIDTH, PAGE_HEIGHT = A4
+MARGE = PDF_MARGE_MM * mm
+LARGEUR_UTILE = PAGE_WIDTH - 2 * MARGE
+
+# Palette sobre (bleu/gris)
+COULEUR_PRINCIPALE = colors.HexColor('#1F4E79')
+COULEUR_TEXTE = colors.HexColor('#333333')
+COULEUR_SECONDAIRE = colors.HexColor('#7F7F7F')
+COULEUR_FOND_ENTETE = colors.HexColor('#E8EEF4')
+
+POLICE = 'Helvetica'
+POLICE_GRAS = 'Helvetica-Bold'
+
+LOGO_HAUTEUR_AFFICHEE = 20 * mm
+CLIENT_BLOC_LARGEUR = 75 * mm
+CLIENT_BLOC_HAUTEUR = 32 * mm
+
+# Dossier de sauvegarde par type de document
+DOSSIERS_DOCUMENTS = {
+    'facture': FACTURES_DIR,
+    'devis': DEVIS_DIR,
+    'avoir': AVOIRS_DIR,
+}
+
+TITRES_DOCUMENTS = {
+    'facture': "FACTURE",
+    'devis': "DEVIS",
+    'avoir': "AVOIR",
+}
+
+# Version de la mise en page : à incrémenter à chaque modification du rendu
+# (invalide les PDF mis en cache, voir utils/document_cache.py)
+RENDU_VERSION = 2
+
+# Clés de la table parametres utilisées par les PDF
+PARAMETRES_PDF = (
+    'emetteur_nom', 'emetteur_forme_juridique', 'emetteur_adresse', 'emetteur_code_postal',
+    'emetteur_ville', 'emetteur_siret', 'emetteur_telephone', 'emetteur_email',
+    'emetteur_site_web', 'logo_path', 'iban', 'bic', 'mentions_legales', 'pied_de_page'
+)
+
+# Styles des parties variables (créés une fois)
+STYLE_TITRE = ParagraphStyle('titre', fontName=POLICE_GRAS, fontSize=16, leading=20,
+                             textColor=COULEUR_PRINCIPALE, spaceAfter=4 * mm)
+STYLE_TEXTE = ParagraphStyle('texte', fontName=POLICE, fontSize=10, leading=13, textColor=COULEUR_TEXTE)
+STYLE_CELLULE = ParagraphStyle('cellule', parent=STYLE_TEXTE, fontSize=9.5, leading=12)
+STYLE_CELLULE_DROITE = ParagraphStyle('cellule_droite', parent=STYLE_CELLULE, alignment=TA_RIGHT)
+STYLE_NOTE = ParagraphStyle('note', parent=STYLE_TEXTE, fontSize=9, leading=12, textColor=COULEUR_SECONDAIRE)
+
+
+# Paramètres PDF issus du service de paramètres : (settings.version, paramètres, empreinte)
+_parametres_settings: tuple[int | None, dict, str | None] = (None, {}, None)
+
+
+def load_parametres() -> dict:
+    """
+    Retourne les paramètres utilisés par les PDF (service utils.settings).
+    Le dictionnaire et son empreinte ne sont recalculés que lorsque
+    settings.version change (enregistrement d'un paramètre).
+
+    Returns:
+        dict: {cle: valeur} pour les clés de PARAMETRES_PDF renseignées
+    """
+    global _parametres_settings
+
+    # Lecture en mémoire (rechargée par le service si nécessaire, ce qui peut changer la version)
+    valeurs = settings.get_many(PARAMETRES_PDF)
+
+    if _parametres_settings[0] != settings.version:
+        parametres = {cle: str(valeur) for cle, valeur in valeurs.items() if valeur != ''}
+        _parametres_settings = (settings.version, parametres, _empreinte_parametres(parametres))
+
+    return _parametres_settings[1]
+
+
+def parametres_version(parametres: dict) -> str:
+    """
+    Retourne la version des paramètres : toute modification (y compris du fichier logo)
+    invalide les modèles compilés. Pour les paramètres issus de load_parametres,
+    l'empreinte calculée au chargement est réutilisée tant que settings.version
+    ne change pas (logo remplacé sans changer logo_path : settings.invalidate()).
+    """
+    version, parametres_settings, empreinte = _parametres_settings
+    if parametres is parametres_settings and version == settings.version:
+        return empreinte
+    return _empreinte_parametres(parametres)
+
+
+def _empreinte_parametres(parametres: dict) -> str:
+    """Empreinte des paramètres et du fichier logo (date de modification et taille)"""
+    empreinte = hashlib.sha1(repr(sorted(parametres.items())).encode('utf-8'))
+
+    logo_path = parametres.get('logo_path')
+    if logo_path and Path(logo_path).is_file():
+        stat = Path(logo_path).stat()
+        empreinte.update(f"{stat.st_mtime_ns}:{stat.st_size}".encode('utf-8'))
+
+    return empreinte.hexdigest()
+
+
+def format_montant(montant) -> str:
+    """
+    Formate un montant à la française.
+    Exemple: format_montant(Decimal('1234.5')) -> "1 234,50 €"
+    """
+    montant = Decimal(montant or 0).quantize(Decimal('0.01'))
+    texte = f"{montant:,.2f}".replace(',', ' ').replace('.', ',')
+    return f"{texte} €"
+
+
+def format_quantite(quantite) -> str:
+    """Formate une quantité sans décimales inutiles (ex: 1, 1,5)"""
+    quantite = Decimal(quantite or 0).normalize()
+    return f"{quantite:f}".replace('.', ',')
+
+
+def format_date(valeur) -> str:
+    """Formate une date (ou datetime) en JJ/MM/AAAA"""
+    return valeur.strftime('%d/%m/%Y') if valeur else ''
+
+
+def write_atomic(path: Path, data: bytes):
+    """
+    Écrit un fichier de façon atomique : fichier temporaire dans le même dossier
+    puis renommage. Un PDF interrompu (arrêt, erreur) ne remplace jamais l'existant.
+    """
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.stem}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as tmp_file:
+            tmp_file.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        Path(tmp_path).unlink(missing_ok=True)
+        raise
+
+
+def _load_logo(logo_path: str | None):
+    """
+    Charge le logo et le redimensionne à PDF_LOGO_MAX_HAUTEUR_PX de haut.
+
+    Returns:
+        tuple: (ImageReader, largeur affichée, hauteur affichée) ou None
+    """
+    if not logo_path or not Path(logo_path).is_file():
+        return None
+
+    try:
+        with PILImage.open(logo_path) as image:
+            image = image.convert('RGBA') if image.mode in ('P', 'LA') else image.copy()
+            if image.height > PDF_LOGO_MAX_HAUTEUR_PX:
+                largeur = round(image.width * PDF_LOGO_MAX_HAUTEUR_PX / image.height)
+                image = image.resize((largeur, PDF_LOGO_MAX_HAUTEUR_PX), PILImage.LANCZOS)
+
+            buffer = io.BytesIO()
+            image.save(buffer, format='PNG')
+            buffer.seek(0)
+
+        reader = ImageReader(buffer)
+        largeur_px, hauteur_px = reader.getSize()
+        return reader, LOGO_HAUTEUR_AFFICHEE * largeur_px / hauteur_px, LOGO_HAUTEUR_AFFICHEE
+
+    except Exception as e:
+        print(f"[ERREUR] Chargement du logo {logo_path}: {e}")
+        return None
+
+
+class TemplateStatique:
+    """
+    Parties fixes d'un type de document, compilées pour une version des paramètres :
+    opérations de dessin précalculées (textes déjà découpés et positionnés)
+    et hauteurs réservées à l'en-tête et au bas de page.
+    """
+
+    def __init__(self, type_document: str, parametres: dict):
+        """
+        Compile le modèle.
+
+        Args:
+            type_document: 'facture', 'devis' ou 'avoir'
+            parametres: Paramètres de l'émetteur (voir PARAMETRES_PDF)
+        """
+        self.type_document = type_document
+        self.version = parametres_version(parametres)
+        self.operations = []
+
+        self.haut_cadre = self._compile_entete(parametres)
+        self.bas_cadre = self._compile_bas_de_page(parametres)
+
+    def _text(self, font: str, size: float, color, x: float, y: float, texte: str, align: str = 'left'):
+        self.operations.append(('text', font, size, color, x, y, texte, align))
+
+    def _compile_entete(self, parametres: dict) -> float:
+        """En-tête gauche : logo et identité du coach. Retourne le haut du cadre de contenu."""
+        y = PAGE_HEIGHT - MARGE
+
+        logo = _load_logo(parametres.get('logo_path'))
+        if logo:
+            reader, largeur, hauteur = logo
+            y -= hauteur
+            self.operations.append(('image', reader, MARGE, y, largeur, hauteur))
+            y -= 3 * mm
+
+        y -= 12
+        self._text(POLICE_GRAS, 12, COULEUR_PRINCIPALE, MARGE, y, parametres.get('emetteur_nom', ''))
+
+        lignes = [
+            parametres.get('emetteur_forme_juridique', "Auto-entrepreneur"),
+            parametres.get('emetteur_adresse', ''),
+            f"{parametres.get('emetteur_code_postal', '')} {parametres.get('emetteur_ville', '')}".strip(),
+            f"SIRET : {parametres['emetteur_siret']}" if parametres.get('emetteur_siret') else '',
+            f"Tél : {parametres['emetteur_telephone']}" if parametres.get('emetteur_telephone') else '',
+            parametres.get('emetteur_email', ''),
+            parametres.get('emetteur_site_web', ''),
+        ]
+        for ligne in filter(None, lignes):
+            y -= 12
+            self._text(POLICE, 9, COULEUR_TEXTE, MARGE, y, ligne)
+
+        # Le bloc client (à droite) est dessiné par document, dans une hauteur réservée
+        return min(y, PAGE_HEIGHT - MARGE - CLIENT_BLOC_HAUTEUR) - 8 * mm
+
+    def _mentions(self, parametres: dict) -> list[str]:
+        """Mentions légales du type de document"""
+        mentions = [MENTION_TVA + "."]
+
+        if self.type_document == 'facture':
+            mentions.append(
+                f"En cas de retard de paiement, des pénalités égales à {TAUX_PENALITES} fois "
+                f"le taux d'intérêt légal seront exigibles, ainsi qu'une indemnité forfaitaire "
+                f"pour frais de recouvrement de {INDEMNITE_RECOUVREMENT} €."
+            )
+            mentions.append("Pas d'escompte pour paiement anticipé.")
+        elif self.type_document == 'devis':
+            mentions.append("Devis gratuit.")
+
+        if parametres.get('mentions_legales'):
+            mentions.append(parametres['mentions_legales'])
+
+        return mentions
+
+    def _compile_bas_de_page(self, parametres: dict) -> float:
+        """Mentions légales et pied de page. Retourne le bas du cadre de contenu."""
+        y = MARGE
+
+        pied = []
+        if parametres.get('pied_de_page'):
+            pied.append(parametres['pied_de_page'])
+        if self.type_document == 'facture' and parametres.get('iban'):
+            banque = f"IBAN : {parametres['iban']}"
+            if parametres.get('bic'):
+                banque += f"  -  BIC : {parametres['bic']}"
+            pied.append(banque)
+        contacts = [parametres.get(cle) for cle in ('emetteur_nom', 'emetteur_siret', 'emetteur_telephone', 'emetteur_email')]
+        pied.append("  -  ".join(filter(None, contacts)))
+
+        for ligne in reversed([ligne for texte in pied for ligne in simpleSplit(texte, POLICE, 8, LARGEUR_UTILE)]):
+            self._text(POLICE, 8, COULEUR_SECONDAIRE, PAGE_WIDTH / 2, y, ligne, align='centre')
+            y += 10
+
+        y += 2
+        self.operations.append(('line', COULEUR_SECONDAIRE, MARGE, y, PAGE_WIDTH - MARGE, y))
+        y += 4 * mm
+
+        mentions = [ligne for texte in self._mentions(parametres) for ligne in simpleSplit(texte, POLICE, 7.5, LARGEUR_UTILE)]
+        for ligne in reversed(mentions):
+            self._text(POLICE, 7.5, COULEUR_SECONDAIRE, MARGE, y, ligne)
+            y += 9.5
+
+        return y + 4 * mm
+
+    def draw(self, canvas):
+        """Dessine les parties fixes (form XObject créé une fois par PDF, partagé entre les pages)"""
+        nom_form = f"statique_{self.type_document}"
+
+        if not canvas.hasForm(nom_form):
+            canvas.beginForm(nom_form)
+            for operation in self.operations:
+                kind = operation[0]
+                if kind == 'text':
+                    _, font, size, color, x, y, texte, align = operation
+                    canvas.setFont(font, size)
+                    canvas.setFillColor(color)
+                    if align == 'centre':
+                        canvas.drawCentredString(x, y, texte)
+                    else:
+                        canvas.drawString(x, y, texte)
+                elif kind == 'line':
+                    _, color, x1, y1, x2, y2 = operation
+                    canvas.setStrokeColor(color)
+                    canvas.setLineWidth(0.5)
+                    canvas.line(x1, y1, x2, y2)
+                elif kind == 'image':
+                    _, reader, x, y, largeur, hauteur = operation
+                    canvas.drawImage(reader, x, y, largeur, hauteur, mask='auto')
+            canvas.endForm()
+
+        canvas.doForm(nom_form)
+
+
+# Modèles compilés : {type_document: TemplateStatique} (dernière version des paramètres)
+_templates: dict[str, TemplateStatique] = {}
+
+
+def get_template(type_document: str, parametres: dict) -> TemplateStatique:
+    """
+    Retourne le modèle compilé du type de document, recompilé si les paramètres ont changé.
+    """
+    template = _templates.get(type_document)
+    if template is None or template.version != parametres_version(parametres):
+        template = TemplateStatique(type_document, parametres)
+        _templates[type_document] = template
+    return template
+
+
+def clear_templates():
+    """Vide le cache des modèles compilés"""
+    _templates.clear()
+
+
+def _document_data(document) -> dict:
+    """Extrait les données variables d'une facture, d'un devis ou d'un avoir"""
+    if isinstance(document, Facture):
+        infos = [("Facture N°", document.numero), ("Date d'émission", format_date(document.date_emission))]
+        if document.date_prestation_debut:
+            periode = format_date(document.date_prestation_debut)
+            if document.date_prestation_fin and document.date_prestation_fin != document.date_prestation_debut:
+                periode += f" au {format_date(document.date_prestation_fin)}"
+            infos.append(("Date de prestation", periode))
+        infos.append(("Date d'échéance", format_date(document.date_echeance)))
+
+        conditions = [f"Conditions de paiement : {document.conditions_paiement or 'paiement à réception'}"]
+        if document.mode_paiement:
+            conditions.append(f"Mode de paiement : {document.mode_paiement}")
+        if document.notes:
+            conditions.append(document.notes)
+
+        return {
+            'type': 'facture',
+            'client': document.client,
+            'date': document.date_emission,
+            'infos': infos,
+            'lignes': document.lignes,
+            'totaux': [("Total HT", document.montant_total_ht), ("TVA", None), ("Total TTC", document.montant_total_ht)],
+            'conditions': conditions,
+        }
+
+    if isinstance(document, Devis):
+        return {
+            'type': 'devis',
+            'client': document.client,
+            'date': document.date_emission,
+            'infos': [
+                ("Devis N°", document.numero),
+                ("Date d'émission", format_date(document.date_emission)),
+                ("Valable jusqu'au", format_date(document.date_validite)),
+            ],
+            'lignes': document.lignes,
+            'totaux': [("Total HT", document.montant_total_ht), ("TVA", None), ("Total TTC", document.montant_total_ht)],
+            'conditions': [document.conditions] if document.conditions else [],
+            'signature': True,
+        }
+
+    if isinstance(document, Avoir):
+        return {
+            'type': 'avoir',
+            'client': document.facture.client,
+            'date': document.date_emission,
+            'infos': [
+                ("Avoir N°", document.numero),
+                ("Date d'émission", format_date(document.date_emission)),
+                ("Facture d'origine", document.facture.numero),
+            ],
+            'lignes': document.lignes,
+            'totaux': [("TVA", None), ("Montant de l'avoir", document.montant_total)],
+            'conditions': [f"Motif : {document.motif}"],
+        }
+
+    raise TypeError(f"Document non pris en charge : {type(document).__name__}")
+
+
+def document_filename(document) -> str:
+    """
+    Nom du fichier PDF d'un document.
+    Exemple: "FACT-2025-001_DupontJean.pdf"
+    """
+    data = _document_data(document)
+    client = re.sub(r'[^\w-]', '', data['client'].nom_complet.replace(' ', '')) if data['client'] else ''
+    return f"{document.numero}_{client}.pdf" if client else f"{document.numero}.pdf"
+
+
+def document_path(document, directory: Path | None = None) -> Path:
+    """
+    Chemin du fichier PDF d'un document.
+
+    Args:
+        document: Facture, Devis ou Avoir
+        directory: Dossier de destination (par défaut documents/<type>/AAAA/, année d'émission)
+    """
+    if directory is None:
+        data = _document_data(document)
+        directory = DOSSIERS_DOCUMENTS[data['type']] / str(data['date'].year)
+    return Path(directory) / document_filename(document)
+
+
+def document_fingerprint(document, parametres: dict) -> str:
+    """
+    Empreinte de tout ce qui apparaît dans le PDF d'un document : données du
+    document, lignes, client, paramètres de l'émetteur et version du rendu.
+    Deux documents de même empreinte produisent le même PDF.
+
+    Args:
+        document: Facture, Devis ou Avoir
+        parametres: Paramètres de l'émetteur
+
+    Returns:
+        str: Empreinte SHA-256 (hexadécimale)
+    """
+    data = _document_data(document)
+    client = data['client']
+
+    contenu = {
+        'rendu': RENDU_VERSION,
+        'parametres': parametres_version(parametres),
+        'type': data['type'],
+        'numero': document.numero,
+        'infos': data['infos'],
+        'totaux': [(libelle, str(montant)) for libelle, montant in data['totaux']],
+        'conditions': data['conditions'],
+        'lignes': [
+            (ligne.libelle, ligne.description, str(ligne.quantite), str(ligne.prix_unitaire_ht),
+             str(ligne.montant_total_ligne_ht))
+            for ligne in data['lignes']
+        ],
+        'client': (
+            client.type, client.nom_complet, client.adresse_complete, client.siret, client.email
+        ) if client else None,
+    }
+
+    return hashlib.sha256(json.dumps(contenu, ensure_ascii=False).encode('utf-8')).hexdigest()
+
+
+class PDFGenerator:
+    """Générateur de PDF des documents, à partir des modèles compilés"""
+
+    def __init__(self, parametres: dict | None = None):
+        """
+        Initialise le générateur.
+
+        Args:
+            parametres: Paramètres de l'émetteur (voir load_parametres)
+        """
+        self.parametres = parametres or {}
+
+    def _client_bloc(self, canvas, client, type_document: str):
+        """Bloc client en haut à droite de la première page"""
+        x = PAGE_WIDTH - MARGE - CLIENT_BLOC_LARGEUR
+        top = PAGE_HEIGHT - MARGE
+
+        canvas.setFillColor(COULEUR_FOND_ENTETE)
+        canvas.roundRect(x, top - CLIENT_BLOC_HAUTEUR, CLIENT_BLOC_LARGEUR, CLIENT_BLOC_HAUTEUR, 2 * mm, stroke=0, fill=1)
+
+        if client is None:
+            return
+
+        y = top - 5 * mm
+        canvas.setFillColor(COULEUR_SECONDAIRE)
+        canvas.setFont(POLICE, 8)
+        canvas.drawString(x + 4 * mm, y, "FACTURÉ À" if type_document == 'facture' else "CLIENT")
+
+        lignes = [(POLICE_GRAS, client.nom_complet)]
+        lignes += [(POLICE, ligne) for ligne in client.adresse_complete.split('\n') if ligne]
+        if client.type == 'entreprise' and client.siret:
+            lignes.append((POLICE, f"SIRET : {client.siret}"))
+        if client.email:
+            lignes.append((POLICE, client.email))
+
+        canvas.setFillColor(COULEUR_TEXTE)
+        for font, texte in lignes[:6]:
+            y -= 12
+            taille = 10 if font == POLICE_GRAS else 9
+            canvas.setFont(font, taille)
+            while texte and stringWidth(texte, font, taille) > CLIENT_BLOC_LARGEUR - 8 * mm:
+                texte = texte[:-1]
+            canvas.drawString(x + 4 * mm, y, texte)
+
+    def _flowables(self, data: dict) -> list:
+        """Parties variables : titre, informations, lignes, totaux, conditions"""
+        story = [Paragraph(TITRES_DOCUMENTS[data['type']], STYLE_TITRE)]
+
+        infos = Table(
+            [[libelle, valeur] for libelle, valeur in data['infos']],
+            colWidths=[40 * mm, 60 * mm], hAlign='LEFT'
+        )
+        infos.setStyle(TableStyle([
+            ('FONT', (0, 0), (0, -1), POLICE_GRAS, 9.5),
+            ('FONT', (1, 0), (1, -1), POLICE, 9.5),
+            ('TEXTCOLOR', (0, 0), (-1, -1), COULEUR_TEXTE),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 2),
+            ('TOPPADDING', (0, 0), (-1, -1), 2),
+            ('LEFTPADDING', (0, 0), (-1, -1), 0),
+        ]))
+        story += [infos, Spacer(1, 6 * mm)]
+
+        rows = [["Désignation", "Qté", "Prix unitaire HT", "Total HT"]]
+        for ligne in data['lignes']:
+            designation = escape(ligne.libelle)
+            if ligne.description:
+                designation = f"<b>{designation}</b><br/>{escape(ligne.description)}"
+            rows.append([
+                Paragraph(designation, STYLE_CELLULE),
+                format_quantite(ligne.quantite),
+                format_montant(ligne.prix_unitaire_ht),
+                format_montant(ligne.montant_total_ligne_ht),
+            ])
+
+        table = Table(rows, colWidths=[LARGEUR_UTILE - 85 * mm, 15 * mm, 35 * mm, 35 * mm], repeatRows=1)
+        table.setStyle(TableStyle([
+            ('FONT', (0, 0), (-1, 0), POLICE_GRAS, 9.5),
+            ('FONT', (0, 1), (-1, -1), POLICE, 9.5),
+            ('TEXTCOLOR', (0, 0), (-1, 0), colors.white),
+            ('BACKGROUND', (0, 0), (-1, 0), COULEUR_PRINCIPALE),
+            ('TEXTCOLOR', (0, 1), (-1, -1), COULEUR_TEXTE),
+            ('ALIGN', (1, 0), (-1, -1), 'RIGHT'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('LINEBELOW', (0, 1), (-1, -1), 0.25, COULEUR_SECONDAIRE),
+            ('TOPPADDING', (0, 0), (-1, -1), 4),
+            ('BOTTOMPADDING', (0, 0), (-1, -1), 4),
+        ]))
+        story += [table, Spacer(1, 4 * mm)]
+
+        totaux_rows = []
+        for libelle, montant in data['totaux']:
+            if montant is None:
+                totaux_rows.append([libelle, Paragraph(MENTION_TVA, STYLE_CELLULE_DROITE)])
+            else:
+                totaux_rows.append([libelle, format_montant(montant)])
+
+        totaux = Table(totaux_rows, colWidths=[35 * mm, 65 * mm], hAlign='RIGHT')
+        totaux.setStyle(TableStyle([
+            ('FONT', (0, 0), (-1, -1), POLICE, 9.5),
+            ('FONT', (0, -1), (-1, -1), POLICE_GRAS, 11),
+            ('TEXTCOLOR', (0, 0), (-1, -1), COULEUR_TEXTE),
+            ('TEXTCOLOR', (0, -1), (-1, -1), COULEUR_PRINCIPALE),
+            ('ALIGN', (1, 0), (1, -1), 'RIGHT'),
+            ('VALIGN', (0, 0), (-1, -1), 'MIDDLE'),
+            ('LINEABOVE', (0, -1), (-1, -1), 0.75, COULEUR_PRINCIPALE),
+        ]))
+        story += [totaux, Spacer(1, 6 * mm)]
+
+        for condition in data['conditions']:
+            story.append(Paragraph(escape(condition), STYLE_NOTE))
+
+        if data.get('signature'):
+            signature = Table(
+                [["Bon pour accord (date et signature du client)"], [""]],
+                colWidths=[80 * mm], rowHeights=[14, 25 * mm], hAlign='RIGHT'
+            )
+            signature.setStyle(TableStyle([
+                ('FONT', (0, 0), (-1, -1), POLICE, 9),
+                ('TEXTCOLOR', (0, 0), (-1, -1), COULEUR_TEXTE),
+                ('BOX', (0, 0), (-1, -1), 0.5, COULEUR_SECONDAIRE),
+            ]))
+            story += [Spacer(1, 6 * mm), signature]
+
+        return story
+
+    def render(self, document) -> bytes:
+        """
+        Génère le PDF d'un document en mémoire (prévisualisation).
+
+        Args:
+            document: Facture, Devis ou Avoir (avec client et lignes chargés)
+
+        Returns:
+            bytes: Contenu du PDF
+        """
+        data = _document_data(document)
+        template = get_template(data['type'], self.parametres)
+
+        buffer = io.BytesIO()
+        client = data['client']
+        titre = f"{TITRES_DOCUMENTS[data['type']].capitalize()} {document.numero}"
+
+        doc = BaseDocTemplate(
+            buffer, pagesize=A4,
+            leftMargin=MARGE, rightMargin=MARGE, topMargin=MARGE, bottomMargin=MARGE,
+            title=titre,
+            author=self.parametres.get('emetteur_nom', ''),
+            subject=f"{titre} - {client.nom_complet}" if client else titre,
+            creator=APP_NAME
+        )
+
+        frame = Frame(MARGE, template.bas_cadre, LARGEUR_UTILE, template.haut_cadre - template.bas_cadre,
+                      leftPadding=0, rightPadding=0, topPadding=0, bottomPadding=0)
+
+        def on_page(canvas, doc):
+            template.draw(canvas)
+            if doc.page == 1:
+                self._client_bloc(canvas, client, data['type'])
+            canvas.setFont(POLICE, 8)
+            canvas.setFillColor(COULEUR_SECONDAIRE)
+            canvas.drawRightString(PAGE_WIDTH - MARGE, MARGE / 2, f"{document.numero} - page {doc.page}")
+
+        doc.addPageTemplates([PageTemplate(id='document', frames=[frame], onPage=on_page)])
+        doc.build(self._flowables(data))
+
+        return buffer.getvalue()
+
+    def save(self, document, directory: Path | None = None) -> Path:
+        """
+        Génère le PDF d'un document et l'enregistre dans le dossier de l'année d'émission.
+
+        Args:
+            document: Facture, Devis ou Avoir
+            directory: Dossier de destination (par défaut documents/<type>/AAAA/)
+
+        Returns:
+            Path: Chemin du fichier créé
+        """
+        path = document_path(document, directory)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(path, self.render(document))
+        return path
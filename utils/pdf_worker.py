@@ -0,0 +1,76 @@
+"""
+Processus de génération des PDF par lot (voir utils.pdf_batch)
+
+Fonctions exécutées par les processus du pool. Ce module n'importe ni Qt ni
+les vues ; avec le démarrage "spawn", les processus réimportent aussi le
+module principal (main.py), qui n'importe rien hors de son bloc principal.
+"""
+from pathlib import Path
+from sqlalchemy.orm import sessionmaker, selectinload, joinedload
+from models import Facture
+
+
+# État de chaque processus du pool (initialisé par init_worker)
+_worker_session_factory = None
+_worker_generator = None
+_worker_cancel = None
+
+
+def init_worker(database_url: str, parametres: dict, cancel):
+    """
+    Initialise un processus du pool : connexion à la base et modèle PDF compilé.
+
+    Args:
+        database_url: Base des factures
+        parametres: Paramètres de l'émetteur
+        cancel: multiprocessing.Event partagé, positionné pour interrompre le lot
+    """
+    global _worker_session_factory, _worker_generator, _worker_cancel
+
+    from database.init_db import create_database_engine
+    from utils.pdf_generator import PDFGenerator, get_template
+
+    engine = create_database_engine(database_url)
+    _worker_session_factory = sessionmaker(bind=engine)
+    _worker_generator = PDFGenerator(parametres)
+    _worker_cancel = cancel
+    get_template('facture', parametres)
+
+
+def render_chunk(facture_ids: list[int], directory: str | None) -> list[tuple]:
+    """
+    Génère les PDF d'un paquet de factures. S'arrête avant la facture
+    suivante si le lot est annulé (les factures restantes sont omises).
+
+    Args:
+        facture_ids: Identifiants des factures du paquet
+        directory: Dossier de destination (par défaut FACTURES_DIR/<année>/)
+
+    Returns:
+        list[tuple]: (facture_id, chemin, empreinte, None) ou (facture_id, None, None, message d'erreur)
+    """
+    from utils.pdf_generator import document_fingerprint
+
+    results = []
+    with _worker_session_factory() as session:
+        factures = session.query(Facture).options(
+            joinedload(Facture.client),
+            selectinload(Facture.lignes)
+        ).filter(Facture.id.in_(facture_ids)).all()
+
+        found = {facture.id for facture in factures}
+        results += [
+            (facture_id, None, None, "Facture introuvable") for facture_id in facture_ids if facture_id not in found
+        ]
+
+        for facture in factures:
+            if _worker_cancel is not None and _worker_cancel.is_set():
+                break
+            try:
+                path = _worker_generator.save(facture, Path(directory) if directory else None)
+                empreinte = document_fingerprint(facture, _worker_generator.parametres)
+                results.append((facture.id, str(path), empreinte, None))
+            except Exception as e:
+                results.append((facture.id, None, None, str(e)))
+
+    return results
@@ -0,0 +1,299 @@
+"""
+Catalogue des prestations en mémoire, pour l'autocomplétion des lignes de devis et de factures
+
+Les prestations actives sont chargées une fois et indexées sans accents ni
+casse sur le libellé, la catégorie et la description :
+- libellés triés : préfixe du libellé complet par recherche dichotomique ;
+- mots triés de chaque champ (mot -> entrées) : préfixe de mot par recherche
+  dichotomique, sous-chaîne d'un mot dans les mots concaténés (str.find) ;
+- saisie de plusieurs mots : entrées du mot le plus rare, dont le texte est
+  vérifié pour les autres mots.
+Les recherches s'arrêtent dès que le nombre de suggestions demandé est atteint.
+
+Le catalogue est construit par une tâche différée du démarrage (refresh) et
+relu à la recherche suivante après une écriture de PrestationController ou un
+import en masse (invalidate), ou si la base change.
+
+Usage :
+    from utils.prestation_catalog import catalogue
+    for prestation in catalogue.complete("seance coa"):
+        print(prestation.libelle, prestation.prix_unitaire_ht)
+"""
+import re
+import threading
+import unicodedata
+from bisect import bisect_left
+from heapq import merge
+from config import CATALOGUE_SUGGESTIONS_MAX
+from database import session_scope, init_db
+from models import Prestation
+
+
+NON_ALPHANUMERIQUE_PATTERN = re.compile(r"[^\w]+")
+# Blocs Unicode des diacritiques combinants (accents séparés par la décomposition NFKD)
+DIACRITIQUES_PATTERN = re.compile("[\u0300-\u036f\u1ab0-\u1aff\u1dc0-\u1dff\u20d0-\u20ff\ufe20-\ufe2f]+")
+
+# Séparateur des mots concaténés (absent des textes repliés)
+SEPARATEUR = "\n"
+
+# Plus grand caractère : borne haute d'un intervalle de préfixe
+FIN_PREFIXE = "\U0010ffff"
+
+
+def fold_text(texte: str | None) -> str:
+    """
+    Replie un texte pour la recherche : sans accents, en minuscules,
+    ponctuation remplacée par des espaces.
+    Exemple: "Séance d'Éveil" -> "seance d eveil"
+
+    Args:
+        texte: Texte à replier
+
+    Returns:
+        str: Texte replié
+    """
+    if not texte:
+        return ""
+    if not texte.isascii():
+        texte = DIACRITIQUES_PATTERN.sub('', unicodedata.normalize('NFKD', texte))
+    return NON_ALPHANUMERIQUE_PATTERN.sub(' ', texte.casefold()).strip()
+
+
+class CatalogueEntry:
+    """Prestation du catalogue (valeurs utiles à la saisie d'une ligne)"""
+
+    __slots__ = ('id', 'libelle', 'description', 'categorie', 'prix_unitaire_ht', 'unite')
+
+    def __init__(self, id: int, libelle: str, description: str | None, categorie: str | None,
+                 prix_unitaire_ht, unite: str):
+        self.id = id
+        self.libelle = libelle
+        self.description = description
+        self.categorie = categorie
+        self.prix_unitaire_ht = prix_unitaire_ht
+        self.unite = unite
+
+    def __repr__(self):
+        return f"<CatalogueEntry(id={self.id}, libelle='{self.libelle}')>"
+
+
+class CatalogueIndex:
+    """Index (immuable) d'un état du catalogue"""
+
+    def __init__(self, entries: list[CatalogueEntry]):
+        """
+        Construit les index.
+
+        Args:
+            entries: Prestations du catalogue
+        """
+        # Les catégories et descriptions se répètent : chaque texte n'est replié qu'une fois
+        replis: dict[str | None, str] = {}
+
+        def fold(texte):
+            folded = replis.get(texte)
+            if folded is None:
+                folded = replis[texte] = fold_text(texte)
+            return folded
+
+        # Entrées triées par libellé replié : les préfixes de libellé forment un intervalle
+        folded = sorted(((fold(entry.libelle), entry) for entry in entries), key=lambda item: item[0])
+        self.entries = [entry for _, entry in folded]
+        self.libelles = [libelle for libelle, _ in folded]
+        self.par_id = {entry.id: entry for entry in self.entries}
+
+        # Par champ (libellé, catégorie, description) : mot -> rangs des entrées qui le contiennent
+        champs = [self.libelles, [fold(entry.categorie) for entry in self.entries],
+                  [fold(entry.description) for entry in self.entries]]
+        self.vocabulaires = []
+        for textes in champs:
+            # Découpage en mots une fois par texte distinct
+            par_texte: dict[str, list[int]] = {}
+            for rang, texte in enumerate(textes):
+                par_texte.setdefault(texte, []).append(rang)
+            mots: dict[str, list[int]] = {}
+            for texte, rangs in par_texte.items():
+                for mot in set(texte.split()):
+                    mots.setdefault(mot, []).extend(rangs)
+            for rangs in mots.values():
+                rangs.sort()
+            self.vocabulaires.append(Vocabulaire(mots))
+
+        # Texte complet de chaque entrée (vérification des autres mots de la saisie)
+        self.textes = [" " + " ".join(textes) for textes in zip(*champs)]
+
+    def complete(self, query: str, limit: int) -> list[CatalogueEntry]:
+        """
+        Retourne les prestations correspondant à la saisie, les plus pertinentes d'abord :
+        1. libellé commençant par la saisie ;
+        2. chaque mot de la saisie est le début d'un mot (un seul mot : libellé,
+           puis catégorie, puis description ; plusieurs : ordre des libellés) ;
+        3. chaque mot de la saisie est contenu dans un mot (sous-chaîne).
+
+        Args:
+            query: Saisie (repliée)
+            limit: Nombre maximal de suggestions
+
+        Returns:
+            list[CatalogueEntry]: Suggestions
+        """
+        rangs: dict[int, None] = {}  # Ordonné, sans doublon
+
+        # 1. Préfixe du libellé
+        debut = bisect_left(self.libelles, query)
+        fin = min(bisect_left(self.libelles, query + FIN_PREFIXE), debut + limit)
+        rangs.update(dict.fromkeys(range(debut, fin)))
+
+        # 2. Préfixes de mots, puis 3. sous-chaînes
+        termes = query.split()
+        for prefixe in (True, False):
+            if len(rangs) >= limit:
+                break
+            if len(termes) == 1:
+                for vocabulaire in self.vocabulaires:
+                    self._collect(vocabulaire.listes(termes[0], prefixe), rangs, limit)
+            else:
+                self._collect([self._intersect(termes, prefixe)], rangs, limit)
+
+        return [self.entries[rang] for rang in list(rangs)[:limit]]
+
+    def _intersect(self, termes: list[str], prefixe: bool):
+        """
+        Rangs (croissants, avec doublons) des entrées dont un mot commence par (ou contient) chacun
+        des termes : entrées du terme le plus rare, dont le texte est vérifié pour les autres.
+
+        Args:
+            termes: Termes de la saisie (au moins deux)
+            prefixe: True pour les préfixes de mots, False pour les sous-chaînes
+
+        Returns:
+            Générateur des rangs
+        """
+        rare = min(termes, key=lambda terme: sum(len(liste) for liste in self._lists(terme, prefixe)))
+        # Fusion des listes triées : parcours dans l'ordre des libellés, arrêté à la limite
+        candidats = merge(*self._lists(rare, prefixe))
+
+        motifs = [" " + terme if prefixe else terme for terme in termes if terme != rare]
+        textes = self.textes
+        return (rang for rang in candidats if all(motif in textes[rang] for motif in motifs))
+
+    def _lists(self, terme: str, prefixe: bool):
+        """Listes de rangs des mots correspondant au terme, dans tous les champs"""
+        for vocabulaire in self.vocabulaires:
+            yield from vocabulaire.listes(terme, prefixe)
+
+    def _collect(self, listes, rangs: dict, limit: int):
+        """Ajoute les rangs des listes jusqu'à atteindre la limite"""
+        for liste in listes:
+            for rang in liste:
+                if rang not in rangs:
+                    rangs[rang] = None
+                    if len(rangs) >= limit:
+                        return
+
+
+class Vocabulaire:
+    """Mots d'un champ du catalogue et entrées qui les contiennent"""
+
+    def __init__(self, mots: dict[str, list[int]]):
+        """
+        Args:
+            mots: mot -> rangs des entrées (croissants)
+        """
+        self.mots = sorted(mots)
+        self.rangs = [mots[mot] for mot in self.mots]
+
+        # Mots concaténés pour la recherche de sous-chaînes (str.find) et début de chaque mot
+        self.concatenation = SEPARATEUR.join(self.mots)
+        self.debuts = []
+        position = 0
+        for mot in self.mots:
+            self.debuts.append(position)
+            position += len(mot) + len(SEPARATEUR)
+
+    def positions(self, terme: str, prefixe: bool):
+        """Positions des mots commençant par le terme (prefixe=True) ou le contenant (ordre alphabétique)"""
+        if prefixe:
+            return range(bisect_left(self.mots, terme), bisect_left(self.mots, terme + FIN_PREFIXE))
+        return self._positions_contenant(terme)
+
+    def _positions_contenant(self, terme: str):
+        position = self.concatenation.find(terme)
+        while position >= 0:
+            index = bisect_left(self.debuts, position + 1) - 1
+            yield index
+            suivant = index + 1
+            if suivant >= len(self.debuts):
+                return
+            position = self.concatenation.find(terme, self.debuts[suivant])
+
+    def listes(self, terme: str, prefixe: bool):
+        """Rangs des entrées, pour chaque mot correspondant au terme"""
+        return (self.rangs[position] for position in self.positions(terme, prefixe))
+
+
+class PrestationCatalog:
+    """Catalogue des prestations actives, chargé à la demande et rechargé après modification"""
+
+    def __init__(self):
+        """Initialise le catalogue (chargé à la première recherche)"""
+        self._index: CatalogueIndex | None = None
+        self._engine = None
+        self.version = 0
+        self.lock = threading.Lock()
+
+    def _load(self) -> CatalogueIndex:
+        """Retourne l'index courant, construit au premier accès ou après invalidation"""
+        index = self._index
+        if index is not None and self._engine is init_db.engine:
+            return index
+
+        with self.lock:
+            if self._index is None or self._engine is not init_db.engine:
+                with session_scope() as session:
+                    rows = session.query(
+                        Prestation.id, Prestation.libelle, Prestation.description, Prestation.categorie,
+                        Prestation.prix_unitaire_ht, Prestation.unite
+                    ).filter(Prestation.actif == True).all()
+                self._index = CatalogueIndex([CatalogueEntry(*row) for row in rows])
+                self._engine = init_db.engine
+            return self._index
+
+    def complete(self, query: str, limit: int = CATALOGUE_SUGGESTIONS_MAX) -> list[CatalogueEntry]:
+        """
+        Retourne les prestations actives correspondant à une saisie
+        (sans accents ni casse, sur le libellé, la catégorie et la description).
+
+        Args:
+            query: Texte saisi
+            limit: Nombre maximal de suggestions
+
+        Returns:
+            list[CatalogueEntry]: Suggestions, les plus pertinentes d'abord
+        """
+        query = fold_text(query)
+        if not query or limit <= 0:
+            return []
+        return self._load().complete(query, limit)
+
+    def get(self, prestation_id: int) -> CatalogueEntry | None:
+        """Retourne une prestation active du catalogue par son ID"""
+        return self._load().par_id.get(prestation_id)
+
+    def refresh(self):
+        """Recharge le catalogue immédiatement (ex: depuis un thread, avant la saisie)"""
+        self.invalidate()
+        self._load()
+
+    def invalidate(self):
+        """Oublie le catalogue chargé : il sera relu à la prochaine recherche"""
+        with self.lock:
+            self._index = None
+            self.version += 1
+
+    def __len__(self):
+        return len(self._load().entries)
+
+
+# Catalogue partagé par toute l'application
+catalogue = PrestationCatalog()
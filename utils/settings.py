@@ -0,0 +1,245 @@
+"""
+Service des paramètres de l'application (table parametres)
+
+Les paramètres sont stockés en texte avec un type ('string', 'integer',
+'float', 'boolean', 'json'). Le service les lit tous en une requête au
+premier accès, les convertit dans leur type et sert ensuite les lectures
+depuis la mémoire. Chaque écriture invalide le cache et incrémente
+settings.version : les caches qui dépendent des paramètres (modèles PDF
+compilés, voir utils/pdf_generator.py) comparent cette version plutôt que
+de relire la table.
+
+Usage :
+    from utils.settings import settings
+    delai = settings.get('delai_paiement', DELAI_PAIEMENT_DEFAUT)
+    settings.set('delai_paiement', 30)             # type 'integer' déduit de la valeur
+"""
+import json
+import threading
+from database import session_scope, init_db
+from models import Parametre
+
+
+VALEURS_VRAI = {'1', 'true', 'vrai', 'oui', 'yes', 'o'}
+VALEURS_FAUX = {'0', 'false', 'faux', 'non', 'no', 'n', ''}
+
+TYPES = ('string', 'integer', 'float', 'boolean', 'json')
+
+
+def parse_boolean(valeur: str) -> bool:
+    """Convertit 'true'/'false', '1'/'0', 'oui'/'non'... en booléen"""
+    texte = valeur.strip().lower()
+    if texte in VALEURS_VRAI:
+        return True
+    if texte in VALEURS_FAUX:
+        return False
+    raise ValueError(f"Booléen non reconnu: {valeur}")
+
+
+# Conversion texte -> valeur, par type
+CONVERTISSEURS = {
+    'string': str,
+    'integer': int,
+    'float': float,
+    'boolean': parse_boolean,
+    'json': json.loads,
+}
+
+
+def convert_value(valeur: str | None, type_valeur: str):
+    """
+    Convertit la valeur stockée d'un paramètre dans son type.
+
+    Args:
+        valeur: Valeur stockée (texte, None si vide)
+        type_valeur: Type du paramètre ('string', 'integer', 'float', 'boolean', 'json')
+
+    Returns:
+        Valeur convertie (None si la valeur stockée est vide)
+
+    Raises:
+        ValueError: Si le type est inconnu ou si la valeur ne peut pas être convertie
+    """
+    if valeur is None:
+        return None
+    convertisseur = CONVERTISSEURS.get(type_valeur)
+    if convertisseur is None:
+        raise ValueError(f"Type de paramètre inconnu: {type_valeur}")
+    return convertisseur(valeur)
+
+
+def serialize_value(valeur, type_valeur: str | None = None) -> tuple[str | None, str]:
+    """
+    Convertit une valeur en texte pour la table parametres.
+
+    Args:
+        valeur: Valeur à enregistrer
+        type_valeur: Type du paramètre (déduit de la valeur si None)
+
+    Returns:
+        tuple: (texte stocké, type)
+    """
+    if type_valeur is None:
+        if isinstance(valeur, bool):
+            type_valeur = 'boolean'
+        elif isinstance(valeur, int):
+            type_valeur = 'integer'
+        elif isinstance(valeur, float):
+            type_valeur = 'float'
+        elif isinstance(valeur, (dict, list)):
+            type_valeur = 'json'
+        else:
+            type_valeur = 'string'
+
+    if valeur is None:
+        return None, type_valeur
+    if type_valeur == 'boolean':
+        return ('true' if valeur else 'false'), type_valeur
+    if type_valeur == 'json':
+        return json.dumps(valeur, ensure_ascii=False), type_valeur
+    return str(valeur), type_valeur
+
+
+class SettingsService:
+    """Paramètres typés, lus une fois puis servis depuis la mémoire"""
+
+    def __init__(self):
+        """Initialise le service (les paramètres sont chargés au premier accès)"""
+        self._values: dict | None = None
+        self._engine = None
+        self.version = 0
+        self.lock = threading.Lock()
+
+    def _load(self) -> dict:
+        """Retourne les paramètres, lus dans la base au premier accès ou après invalidation"""
+        values = self._values
+        # Rechargement aussi si la base a été changée (init_database sur une autre URL)
+        if values is not None and self._engine is init_db.engine:
+            return values
+
+        with self.lock:
+            if self._values is None or self._engine is not init_db.engine:
+                if self._values is not None:
+                    # Autre base : les dépendants doivent aussi se recalculer
+                    self.version += 1
+                values = {}
+                with session_scope() as session:
+                    for cle, valeur, type_valeur in session.query(Parametre.cle, Parametre.valeur, Parametre.type):
+                        try:
+                            values[cle] = convert_value(valeur, type_valeur)
+                        except ValueError as e:
+                            # Valeur laissée en texte plutôt que d'empêcher le démarrage
+                            print(f"[ERREUR] Parametre '{cle}' ({type_valeur}) illisible: {e}")
+                            values[cle] = valeur
+                self._values = values
+                self._engine = init_db.engine
+            return self._values
+
+    def get(self, cle: str, default=None):
+        """
+        Retourne la valeur typée d'un paramètre.
+
+        Args:
+            cle: Clé du paramètre
+            default: Valeur retournée si le paramètre est absent ou vide
+
+        Returns:
+            Valeur du paramètre (int, float, bool, dict/list pour 'json', str sinon)
+        """
+        valeur = self._load().get(cle)
+        return default if valeur is None else valeur
+
+    def get_many(self, cles) -> dict:
+        """
+        Retourne plusieurs paramètres à la fois.
+
+        Args:
+            cles: Clés des paramètres
+
+        Returns:
+            dict: {cle: valeur} pour les paramètres présents et non vides
+        """
+        values = self._load()
+        return {cle: values[cle] for cle in cles if values.get(cle) is not None}
+
+    def all(self) -> dict:
+        """Retourne une copie de tous les paramètres"""
+        return dict(self._load())
+
+    def set(self, cle: str, valeur, type_valeur: str | None = None) -> tuple[bool, str]:
+        """
+        Enregistre un paramètre.
+
+        Args:
+            cle: Clé du paramètre
+            valeur: Nouvelle valeur (None pour vider le paramètre)
+            type_valeur: Type stocké (déduit de la valeur si None)
+
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        return self.set_many({cle: valeur}, {cle: type_valeur} if type_valeur else None)
+
+    def set_many(self, valeurs: dict, types: dict | None = None) -> tuple[bool, str]:
+        """
+        Enregistre plusieurs paramètres dans une même transaction,
+        puis invalide le cache (une seule nouvelle version).
+
+        Args:
+            valeurs: {cle: valeur}
+            types: {cle: type} pour imposer le type de certains paramètres
+
+        Returns:
+            tuple: (success: bool, message: str)
+        """
+        types = types or {}
+
+        try:
+            rows = {}
+            for cle, valeur in valeurs.items():
+                texte, type_valeur = serialize_value(valeur, types.get(cle))
+                if type_valeur not in TYPES:
+                    return False, f"Type de paramètre inconnu: {type_valeur}"
+                # La valeur doit pouvoir être relue dans son type
+                convert_value(texte, type_valeur)
+                rows[cle] = (texte, type_valeur)
+
+        except (TypeError, ValueError) as e:
+            return False, f"Valeur de paramètre invalide: {str(e)}"
+
+        with session_scope() as session:
+            try:
+                existants = {
+                    parametre.cle: parametre
+                    for parametre in session.query(Parametre).filter(Parametre.cle.in_(list(rows)))
+                }
+                for cle, (texte, type_valeur) in rows.items():
+                    parametre = existants.get(cle)
+                    if parametre is None:
+                        session.add(Parametre(cle=cle, valeur=texte, type=type_valeur))
+                    else:
+                        parametre.valeur = texte
+                        parametre.type = type_valeur
+                session.commit()
+
+            except Exception as e:
+                session.rollback()
+                print(f"[ERREUR] set_many: {e}")
+                return False, f"Erreur lors de l'enregistrement des paramètres: {str(e)}"
+
+        self.invalidate()
+        return True, "Paramètres enregistrés avec succès"
+
+    def invalidate(self):
+        """
+        Oublie les paramètres chargés et incrémente la version
+        (à appeler aussi après une modification de la table hors du service,
+        ex: restauration d'une sauvegarde).
+        """
+        with self.lock:
+            self._values = None
+            self.version += 1
+
+
+# Service partagé par toute l'application
+settings = SettingsService()
@@ -0,0 +1,105 @@
+"""
+Mesure du temps de démarrage de l'application
+
+L'origine de la mesure est l'import de ce module : application.py (lancé par
+main.py) l'importe avant tout le reste. Chaque étape est repérée par mark(), puis finish() affiche le
+détail et ajoute une ligne à STARTUP_TIMES_FILE pour suivre l'évolution du
+démarrage d'une version à l'autre.
+
+Usage :
+    timer = StartupTimer()
+    timer.mark("base de donnees")
+    timer.mark("premier affichage")
+    timer.finish()
+"""
+import csv
+import time
+from datetime import datetime
+from pathlib import Path
+from config import APP_VERSION, STARTUP_TIMES_FILE
+
+
+# Origine de la mesure (import du module, au lancement de l'application)
+PROCESS_START = time.perf_counter()
+
+
+class StartupTimer:
+    """Chronomètre des étapes du démarrage"""
+
+    def __init__(self, start: float | None = None):
+        """
+        Initialise le chronomètre.
+
+        Args:
+            start: Origine de la mesure (time.perf_counter), PROCESS_START par défaut
+        """
+        self.start = PROCESS_START if start is None else start
+        self.etapes: list[tuple[str, float]] = []
+
+    def mark(self, etape: str) -> float:
+        """
+        Enregistre la fin d'une étape.
+
+        Args:
+            etape: Nom de l'étape
+
+        Returns:
+            float: Temps écoulé depuis l'origine (ms)
+        """
+        elapsed = (time.perf_counter() - self.start) * 1000
+        self.etapes.append((etape, elapsed))
+        return elapsed
+
+    @property
+    def total_ms(self) -> float:
+        """Durée jusqu'à la dernière étape (ms)"""
+        return self.etapes[-1][1] if self.etapes else 0.0
+
+    def durees(self) -> list[tuple[str, float]]:
+        """
+        Retourne la durée de chaque étape.
+
+        Returns:
+            list[tuple]: (étape, durée en ms depuis l'étape précédente)
+        """
+        previous = 0.0
+        durees = []
+        for etape, elapsed in self.etapes:
+            durees.append((etape, elapsed - previous))
+            previous = elapsed
+        return durees
+
+    def report(self) -> str:
+        """Résumé sur une ligne : durée de chaque étape et total"""
+        details = ' | '.join(f"{etape} {duree:.0f} ms" for etape, duree in self.durees())
+        return f"{details} | total {self.total_ms:.0f} ms"
+
+    def save(self, path: Path | None = None):
+        """
+        Ajoute la mesure au fichier de suivi (CSV : date, version, total, détail des étapes).
+
+        Args:
+            path: Fichier de suivi (STARTUP_TIMES_FILE par défaut)
+        """
+        path = Path(path or STARTUP_TIMES_FILE)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        new_file = not path.exists()
+
+        with open(path, 'a', encoding='utf-8', newline='') as file:
+            writer = csv.writer(file, delimiter=';')
+            if new_file:
+                writer.writerow(["date", "version", "total_ms", "etapes"])
+            writer.writerow([
+                datetime.now().isoformat(timespec='seconds'),
+                APP_VERSION,
+                f"{self.total_ms:.0f}",
+                ' '.join(f"{etape.replace(' ', '_')}={duree:.0f}" for etape, duree in self.durees())
+            ])
+
+    def finish(self):
+        """Affiche la mesure et l'enregistre (une erreur d'écriture n'interrompt pas l'application)"""
+        print(f"[INFO] Demarrage : {self.report()}")
+        try:
+            self.save()
+        except OSError as e:
+            print(f"[ERREUR] Enregistrement du temps de demarrage: {e}")
@@ -1,7 +1,32 @@
 """
 Fonctions de validation pour les formulaires
+
+Deux interfaces partagent les mêmes règles (motifs compilés une seule fois) :
+- une valeur à la fois (validate_email, validate_siret...) pour la saisie ;
+- par colonnes (validate_columns, validate_clients_batch) pour les imports
+  et contrôles de cohérence portant sur un grand nombre de lignes.
 """
 import re
+from collections.abc import Sequence
+
+
+# Motifs compilés au chargement du module (chiffres ASCII uniquement)
+EMAIL_PATTERN = re.compile(r'[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}')
+CODE_POSTAL_PATTERN = re.compile(r'[0-9]{5}')
+TELEPHONE_PATTERN = re.compile(r'0[0-9]{9}')
+DIGITS_PATTERN = re.compile(r'[0-9]+')
+SIRET_PATTERN = re.compile(r'[0-9]{14}')
+
+# Caractères retirés avant validation
+SIRET_SEPARATORS = str.maketrans('', '', ' -')
+TELEPHONE_SEPARATORS = str.maketrans('', '', ' .-')
+CODE_POSTAL_SEPARATORS = str.maketrans('', '', ' ')
+
+# Algorithme de Luhn : chiffre doublé puis réduit à un chiffre (ex: 7 -> 14 -> 5)
+LUHN_DOUBLE = str.maketrans('0123456789', '0246813579')
+
+# SIREN de La Poste : ses établissements ne respectent pas la clé de Luhn
+SIREN_LA_POSTE = '356000000'
 
 
 def validate_email(email: str) -> bool:
@@ -17,9 +42,25 @@ def validate_email(email: str) -> bool:
     if not email:
         return False
 
-    # Pattern regex pour email
-    pattern = r'^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$'
-    return bool(re.match(pattern, email))
+    return EMAIL_PATTERN.fullmatch(email) is not None
+
+
+def siret_checksum_valid(siret: str) -> bool:
+    """
+    Vérifie la clé de contrôle d'un SIRET (algorithme de Luhn).
+    Les établissements de La Poste suivent une autre règle : somme des chiffres multiple de 5.
+
+    Args:
+        siret: SIRET normalisé (14 chiffres, sans espaces)
+
+    Returns:
+        bool: True si la clé de contrôle est correcte
+    """
+    # 14 chiffres : en partant de la gauche, les rangs pairs sont doublés
+    if sum(map(int, siret[0::2].translate(LUHN_DOUBLE) + siret[1::2])) % 10 == 0:
+        return True
+
+    return siret.startswith(SIREN_LA_POSTE) and sum(map(int, siret)) % 5 == 0
 
 
 def validate_siret(siret: str) -> tuple[bool, str]:
@@ -36,15 +77,18 @@ def validate_siret(siret: str) -> tuple[bool, str]:
         return False, "Le SIRET est obligatoire pour les entreprises"
 
     # Retirer les espaces et tirets
-    siret_clean = siret.replace(' ', '').replace('-', '')
+    siret_clean = siret.translate(SIRET_SEPARATORS)
 
     # Vérifier que c'est 14 chiffres
-    if not siret_clean.isdigit():
+    if not DIGITS_PATTERN.fullmatch(siret_clean):
         return False, "Le SIRET doit contenir uniquement des chiffres"
 
     if len(siret_clean) != 14:
         return False, f"Le SIRET doit contenir 14 chiffres (actuellement {len(siret_clean)})"
 
+    if not siret_checksum_valid(siret_clean):
+        return False, "Le SIRET n'est pas valide (clé de contrôle incorrecte)"
+
     return True, "SIRET valide"
 
 
@@ -61,11 +105,8 @@ def validate_code_postal(code: str) -> bool:
     if not code:
         return False
 
-    # Retirer les espaces
-    code_clean = code.replace(' ', '')
-
-    # Vérifier que c'est 5 chiffres
-    return code_clean.isdigit() and len(code_clean) == 5
+    # Retirer les espaces, puis vérifier que c'est 5 chiffres
+    return CODE_POSTAL_PATTERN.fullmatch(code.translate(CODE_POSTAL_SEPARATORS)) is not None
 
 
 def validate_telephone(tel: str) -> bool:
@@ -81,11 +122,8 @@ def validate_telephone(tel: str) -> bool:
     if not tel:
         return True  # Le téléphone est optionnel
 
-    # Retirer les espaces, points, tirets
-    tel_clean = tel.replace(' ', '').replace('.', '').replace('-', '')
-
-    # Vérifier que c'est 10 chiffres commençant par 0
-    return tel_clean.isdigit() and len(tel_clean) == 10 and tel_clean.startswith('0')
+    # Retirer les espaces, points, tirets, puis vérifier que c'est 10 chiffres commençant par 0
+    return TELEPHONE_PATTERN.fullmatch(tel.translate(TELEPHONE_SEPARATORS)) is not None
 
 
 def format_telephone(tel: str) -> str:
@@ -155,6 +193,189 @@ def validate_required_field(value: str, field_name: str = "Ce champ") -> tuple[b
     return True, ""
 
 
+def validate_client_data(data: dict) -> tuple[bool, str]:
+    """
+    Valide les données d'un client (fiche client, import).
+
+    Args:
+        data: Dictionnaire des champs du client ('type' : 'particulier' par défaut)
+
+    Returns:
+        tuple: (valid: bool, message: str) - message de la première erreur rencontrée
+    """
+    # Champs obligatoires selon le type
+    if data.get('type', 'particulier') == 'entreprise':
+        valid, msg = validate_required_field(data.get('raison_sociale', ''), "La raison sociale")
+        if not valid:
+            return False, msg
+
+        valid, msg = validate_siret(data.get('siret', ''))
+        if not valid:
+            return False, msg
+
+    else:  # particulier
+        valid, msg = validate_required_field(data.get('nom', ''), "Le nom")
+        if not valid:
+            return False, msg
+
+    valid, msg = validate_required_field(data.get('adresse', ''), "L'adresse")
+    if not valid:
+        return False, msg
+
+    if not validate_code_postal(data.get('code_postal', '')):
+        return False, "Le code postal doit contenir 5 chiffres"
+
+    valid, msg = validate_required_field(data.get('ville', ''), "La ville")
+    if not valid:
+        return False, msg
+
+    if not validate_email(data.get('email', '')):
+        return False, "L'adresse email n'est pas valide"
+
+    # Téléphone optionnel
+    telephone = data.get('telephone', '')
+    if telephone and not validate_telephone(telephone):
+        return False, "Le numéro de téléphone n'est pas valide (10 chiffres)"
+
+    return True, ""
+
+
+# --- Validation par colonnes ---
+# Chaque contrôle reçoit toutes les valeurs d'une colonne et retourne la liste
+# des résultats (True = valeur valide). Les échecs sont ensuite repérés avec
+# list.count et list.index : seules les lignes en erreur sont parcourues une à une.
+
+def normalize_column(values: Sequence[str | None], separators: dict = SIRET_SEPARATORS) -> list[str]:
+    """
+    Normalise une colonne : valeurs None remplacées par '', séparateurs retirés.
+
+    Args:
+        values: Valeurs de la colonne
+        separators: Table de str.translate (SIRET_SEPARATORS, TELEPHONE_SEPARATORS...)
+
+    Returns:
+        list[str]: Valeurs normalisées
+    """
+    # Les valeurs déjà réduites à des chiffres (cas le plus courant) ne sont pas recopiées
+    return ['' if not value else value if value.isdigit() else value.translate(separators) for value in values]
+
+
+def check_required(values: Sequence[str | None]) -> list[bool]:
+    """Valeurs non vides (hors espaces)"""
+    return [bool(value) and not value.isspace() for value in values]
+
+
+def check_email(values: Sequence[str | None]) -> list[bool]:
+    """Adresses email au bon format"""
+    fullmatch = EMAIL_PATTERN.fullmatch
+    return [bool(value) and fullmatch(value) is not None for value in values]
+
+
+def check_code_postal(values: Sequence[str | None]) -> list[bool]:
+    """Codes postaux de 5 chiffres (espaces ignorés)"""
+    fullmatch = CODE_POSTAL_PATTERN.fullmatch
+    return [fullmatch(code) is not None for code in normalize_column(values, CODE_POSTAL_SEPARATORS)]
+
+
+def check_telephone(values: Sequence[str | None]) -> list[bool]:
+    """Numéros de 10 chiffres commençant par 0 (valeur vide acceptée : champ optionnel)"""
+    fullmatch = TELEPHONE_PATTERN.fullmatch
+    return [not value or fullmatch(tel) is not None
+            for value, tel in zip(values, normalize_column(values, TELEPHONE_SEPARATORS))]
+
+
+def check_siret(values: Sequence[str | None]) -> list[bool]:
+    """SIRET de 14 chiffres (espaces et tirets ignorés) dont la clé de contrôle est correcte"""
+    fullmatch = SIRET_PATTERN.fullmatch
+    return [fullmatch(siret) is not None and siret_checksum_valid(siret) for siret in normalize_column(values)]
+
+
+def validate_columns(
+    columns: dict[str, Sequence],
+    rules: list[tuple],
+    rows: Sequence[int] | None = None,
+    errors: dict | None = None
+) -> dict[int, tuple[str, str]]:
+    """
+    Valide des lignes colonne par colonne.
+    Les règles sont appliquées dans l'ordre et seule la première erreur de chaque
+    ligne est retenue, comme avec les validateurs unitaires.
+
+    Args:
+        columns: Valeurs par champ ({'email': [...], 'siret': [...]}, toutes de même longueur)
+        rules: Règles (champ, contrôle de colonne, message) ; le message peut être
+               une fonction (valeur) -> str, appelée pour les seules valeurs en erreur
+        rows: Index des lignes à contrôler (toutes par défaut)
+        errors: Erreurs déjà relevées, complétées sur place
+
+    Returns:
+        dict: {index de ligne: (champ, message)} pour les lignes en erreur
+    """
+    errors = {} if errors is None else errors
+    nb_lignes = max((len(values) for values in columns.values()), default=0)
+    selections = {}
+
+    for champ, check, message in rules:
+        values = selections.get(champ)
+        if values is None:
+            column = columns.get(champ) or [''] * nb_lignes
+            values = selections[champ] = column if rows is None else [column[i] for i in rows]
+
+        results = check(values)
+
+        position = -1
+        for _ in range(results.count(False)):
+            position = results.index(False, position + 1)
+            i = position if rows is None else rows[position]
+            if i not in errors:
+                errors[i] = (champ, message(values[position]) if callable(message) else message)
+
+    return errors
+
+
+# Règles des clients (mêmes messages et même ordre que validate_client_data)
+CLIENT_ENTREPRISE_RULES = [
+    ('raison_sociale', check_required, "La raison sociale est obligatoire"),
+    ('siret', check_siret, lambda siret: validate_siret(siret)[1]),
+]
+
+CLIENT_PARTICULIER_RULES = [
+    ('nom', check_required, "Le nom est obligatoire"),
+]
+
+CLIENT_RULES = [
+    ('adresse', check_required, "L'adresse est obligatoire"),
+    ('code_postal', check_code_postal, "Le code postal doit contenir 5 chiffres"),
+    ('ville', check_required, "La ville est obligatoire"),
+    ('email', check_email, "L'adresse email n'est pas valide"),
+    ('telephone', check_telephone, "Le numéro de téléphone n'est pas valide (10 chiffres)"),
+]
+
+
+def validate_clients_batch(clients: Sequence[dict]) -> dict[int, tuple[str, str]]:
+    """
+    Valide un lot de clients (équivalent de validate_client_data sur chaque ligne).
+
+    Args:
+        clients: Dictionnaires des champs des clients ('type' : 'particulier' par défaut)
+
+    Returns:
+        dict: {index dans le lot: (champ, message)} pour les clients invalides
+    """
+    champs = {champ for rules in (CLIENT_ENTREPRISE_RULES, CLIENT_PARTICULIER_RULES, CLIENT_RULES)
+              for champ, _, _ in rules}
+    columns = {champ: [client.get(champ) for client in clients] for champ in champs}
+
+    types = [client.get('type', 'particulier') for client in clients]
+    entreprises = [i for i, type_client in enumerate(types) if type_client == 'entreprise']
+    particuliers = [i for i, type_client in enumerate(types) if type_client != 'entreprise']
+
+    # Règles propres au type d'abord : ce sont les premières contrôlées par validate_client_data
+    errors = validate_columns(columns, CLIENT_ENTREPRISE_RULES, entreprises)
+    validate_columns(columns, CLIENT_PARTICULIER_RULES, particuliers, errors)
+    return validate_columns(columns, CLIENT_RULES, errors=errors)
+
+
 if __name__ == "__main__":
     # Tests des validateurs
     print("=== Tests des validateurs ===\n")
@@ -167,6 +388,7 @@ if __name__ == "__main__":
     # Test SIRET
     print("\nTest SIRET:")
     print(f"  12345678901234: {validate_siret('12345678901234')}")
+    print(f"  732 829 320 00074: {validate_siret('732 829 320 00074')}")
     print(f"  123456789: {validate_siret('123456789')}")
     print(f"  Format: {format_siret('12345678901234')}")
 
@@ -180,4 +402,15 @@ if __name__ == "__main__":
     print(f"  0612345678: {validate_telephone('0612345678')}")
     print(f"  06 12 34 56 78: {validate_telephone('06 12 34 56 78')}")
     print(f"  Format: {format_telephone('0612345678')}")
-    print(f"  123: {validate_telephone('123')}")
\ No newline at end of file
+    print(f"  123: {validate_telephone('123')}")
+
+    # Test par lot
+    print("\nTest par lot:")
+    clients = [
+        {'type': 'entreprise', 'raison_sociale': 'ACME', 'siret': '732 829 320 00074',
+         'adresse': '1 rue', 'code_postal': '75001', 'ville': 'Paris', 'email': 'a@acme.fr'},
+        {'type': 'entreprise', 'raison_sociale': 'ACME', 'siret': '12345678901234',
+         'adresse': '1 rue', 'code_postal': '75001', 'ville': 'Paris', 'email': 'a@acme.fr'},
+        {'nom': 'Dupont', 'adresse': '1 rue', 'code_postal': '750', 'ville': 'Paris', 'email': 'jean@exemple.fr'},
+    ]
+    print(f"  {validate_clients_batch(clients)}")
@@ -0,0 +1,165 @@
+"""
+Délégués de rendu pour le tableau des clients (badges et boutons d'action)
+"""
+from PyQt6.QtWidgets import QStyledItemDelegate, QStyle, QApplication, QToolTip, QStyleOptionViewItem
+from PyQt6.QtCore import Qt, QRectF, QRect, QEvent, pyqtSignal
+from PyQt6.QtGui import QColor, QFont, QPainter
+from views.clients_table_model import BADGE_COLOR_ROLE
+
+
+class BadgeDelegate(QStyledItemDelegate):
+    """Dessine la valeur d'une cellule sous forme de badge arrondi coloré"""
+
+    def __init__(self, width, height, font_size, parent=None, min_width=False):
+        """
+        Initialise le délégué.
+
+        Args:
+            width: Largeur du badge en pixels (largeur minimale si min_width)
+            height: Hauteur du badge en pixels
+            font_size: Taille de police du texte en pixels
+            parent: Objet parent Qt
+            min_width: Si True, le badge s'élargit selon le texte
+        """
+        super().__init__(parent)
+        self.badge_width = width
+        self.badge_height = height
+        self.min_width = min_width
+        self.font = QFont()
+        self.font.setPixelSize(font_size)
+        self.font.setBold(True)
+
+    def paint(self, painter, option, index):
+        """Dessine le fond de cellule puis le badge"""
+        paint_cell_background(self, painter, option, index)
+
+        text = index.data(Qt.ItemDataRole.DisplayRole) or ""
+        color = index.data(BADGE_COLOR_ROLE) or "#95a5a6"
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self.font)
+
+        width = self.badge_width
+        if self.min_width:
+            width = max(width, painter.fontMetrics().horizontalAdvance(text) + 20)
+
+        rect = QRectF(
+            option.rect.center().x() - width / 2 + 0.5,
+            option.rect.center().y() - self.badge_height / 2 + 0.5,
+            width,
+            self.badge_height
+        )
+
+        painter.setPen(Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(color))
+        painter.drawRoundedRect(rect, self.badge_height / 2, self.badge_height / 2)
+
+        painter.setPen(QColor("white"))
+        painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, text)
+        painter.restore()
+
+
+class ActionsDelegate(QStyledItemDelegate):
+    """Dessine les boutons Modifier / Supprimer et gère leurs clics"""
+
+    # Signaux émis avec la ligne concernée
+    edit_clicked = pyqtSignal(int)
+    delete_clicked = pyqtSignal(int)
+
+    BUTTON_SIZE = 26
+    BUTTON_SPACING = 2
+
+    # (icône, couleur normale, couleur survol)
+    BUTTONS = (
+        ("✏️", "#1abc9c", "#16a085"),  # Modifier
+        ("🗑️", "#e74c3c", "#c0392b"),  # Supprimer
+    )
+
+    TOOLTIPS = ("Modifier ce client", "Supprimer ce client")
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.font = QFont()
+        self.font.setPixelSize(12)
+        self._hovered = None  # (ligne, numéro de bouton)
+
+    def button_rects(self, cell_rect: QRect) -> list[QRect]:
+        """Calcule la position des boutons dans une cellule"""
+        total_width = self.BUTTON_SIZE * len(self.BUTTONS) + self.BUTTON_SPACING * (len(self.BUTTONS) - 1)
+        x = cell_rect.center().x() - total_width // 2 + 1
+        y = cell_rect.center().y() - self.BUTTON_SIZE // 2 + 1
+
+        rects = []
+        for _ in self.BUTTONS:
+            rects.append(QRect(x, y, self.BUTTON_SIZE, self.BUTTON_SIZE))
+            x += self.BUTTON_SIZE + self.BUTTON_SPACING
+        return rects
+
+    def paint(self, painter, option, index):
+        """Dessine les deux boutons de la ligne"""
+        paint_cell_background(self, painter, option, index)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setFont(self.font)
+
+        for number, (rect, (icon, color, hover_color)) in enumerate(
+            zip(self.button_rects(option.rect), self.BUTTONS)
+        ):
+            hovered = self._hovered == (index.row(), number)
+            painter.setPen(Qt.PenStyle.NoPen)
+            painter.setBrush(QColor(hover_color if hovered else color))
+            painter.drawRoundedRect(QRectF(rect), 4, 4)
+
+            painter.setPen(QColor("white"))
+            painter.drawText(rect, Qt.AlignmentFlag.AlignCenter, icon)
+
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        """Détecte le survol et le clic sur les boutons"""
+        event_type = event.type()
+
+        if event_type in (QEvent.Type.MouseMove, QEvent.Type.MouseButtonRelease):
+            position = event.position().toPoint()
+            button = None
+            for number, rect in enumerate(self.button_rects(option.rect)):
+                if rect.contains(position):
+                    button = number
+                    break
+
+            hovered = (index.row(), button) if button is not None else None
+            if hovered != self._hovered:
+                self._hovered = hovered
+                if self.parent() is not None:
+                    self.parent().viewport().update()
+
+            if event_type == QEvent.Type.MouseButtonRelease and button is not None \
+                    and event.button() == Qt.MouseButton.LeftButton:
+                if button == 0:
+                    self.edit_clicked.emit(index.row())
+                else:
+                    self.delete_clicked.emit(index.row())
+                return True
+
+        return super().editorEvent(event, model, option, index)
+
+    def helpEvent(self, event, view, option, index):
+        """Affiche l'infobulle du bouton survolé"""
+        if event.type() == QEvent.Type.ToolTip:
+            for number, rect in enumerate(self.button_rects(option.rect)):
+                if rect.contains(event.pos()):
+                    QToolTip.showText(event.globalPos(), self.TOOLTIPS[number], view)
+                    return True
+        return super().helpEvent(event, view, option, index)
+
+
+def paint_cell_background(delegate, painter, option, index):
+    """Dessine le fond standard d'une cellule (alternance, sélection, survol) sans texte"""
+    style_option = QStyleOptionViewItem(option)
+    delegate.initStyleOption(style_option, index)
+    style_option.text = ""
+    widget = option.widget
+    style = widget.style() if widget is not None else QApplication.style()
+    style.drawControl(QStyle.ControlElement.CE_ItemViewItem, style_option, painter, widget)
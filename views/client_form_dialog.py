@@ -9,6 +9,7 @@ from PyQt6.QtWidgets import (
 from PyQt6.QtCore import Qt, pyqtSignal
 from PyQt6.QtGui import QFont
 from controllers.client_controller import ClientController
+from database.instrumentation import sql_action
 from models import Client
 from utils.validators import (
     validate_email, validate_siret, validate_code_postal,
@@ -37,7 +38,8 @@ class ClientFormDialog(QDialog):
 
         # Charger le client si modification
         if client_id:
-            self.client = self.controller.get_client_by_id(client_id)
+            with sql_action("clients.ouverture_fiche"):
+                self.client = self.controller.get_client_by_id(client_id)
 
         self.init_ui()
 
@@ -350,10 +352,11 @@ class ClientFormDialog(QDialog):
         data = self.get_form_data()
 
         # Créer ou modifier
-        if self.client_id:
-            success, message, client = self.controller.update_client(self.client_id, data)
-        else:
-            success, message, client = self.controller.create_client(data)
+        with sql_action("clients.enregistrement"):
+            if self.client_id:
+                success, message, client = self.controller.update_client(self.client_id, data)
+            else:
+                success, message, client = self.controller.create_client(data)
 
         if success:
             QMessageBox.information(self, "Succès", message)
@@ -0,0 +1,200 @@
+"""
+Modèle de données (Qt model/view) pour le tableau des clients
+"""
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex
+from database.instrumentation import sql_action
+from utils.validators import format_telephone
+
+
+# Rôle portant la couleur des badges (type, nb factures, statut)
+BADGE_COLOR_ROLE = Qt.ItemDataRole.UserRole + 1
+
+# Colonnes du tableau
+COLUMN_NOM = 0
+COLUMN_TYPE = 1
+COLUMN_EMAIL = 2
+COLUMN_TELEPHONE = 3
+COLUMN_FACTURES = 4
+COLUMN_STATUT = 5
+COLUMN_ACTIONS = 6
+
+HEADERS = [
+    "Nom / Raison sociale", "Type", "Email", "Téléphone",
+    "Nb factures", "Statut", "Actions"
+]
+
+# Colonnes dont le contenu est centré
+CENTERED_COLUMNS = (COLUMN_TYPE, COLUMN_TELEPHONE, COLUMN_FACTURES, COLUMN_STATUT, COLUMN_ACTIONS)
+
+# Colonnes dont l'en-tête est centré
+CENTERED_HEADERS = (COLUMN_TYPE, COLUMN_FACTURES, COLUMN_STATUT, COLUMN_ACTIONS)
+
+
+def client_to_row(client) -> dict:
+    """
+    Convertit un client en ligne d'affichage légère (indépendante de la session).
+
+    Args:
+        client: Instance Client
+
+    Returns:
+        dict: Valeurs affichées dans le tableau
+    """
+    return {
+        'id': client.id,
+        'nom_complet': client.nom_complet,
+        'type': client.type,
+        'email': client.email or "",
+        'telephone': format_telephone(client.telephone) if client.telephone else "",
+        'actif': bool(client.actif)
+    }
+
+
+class ClientsTableModel(QAbstractTableModel):
+    """Modèle du tableau des clients, alimenté page par page au défilement"""
+
+    def __init__(self, statistics_loader, parent=None):
+        """
+        Initialise le modèle.
+
+        Args:
+            statistics_loader: Fonction (list[int]) -> dict[int, dict] chargeant
+                les statistiques des clients affichés
+            parent: Objet parent Qt
+        """
+        super().__init__(parent)
+        self.statistics_loader = statistics_loader
+        self.page_loader = None
+        self._cursor = None
+        self._rows: list[dict] = []
+        self._statistics: dict[int, dict] = {}
+        self.total = 0
+        self.total_actifs = 0
+
+    def set_first_page(self, page: dict, page_loader):
+        """
+        Remplace le contenu du modèle par la première page d'une liste.
+
+        Args:
+            page: Première page (rows, cursor, total, actifs)
+            page_loader: Fonction (cursor) -> page chargeant la page suivante
+        """
+        self.beginResetModel()
+        self.page_loader = page_loader
+        self._cursor = None
+        self._rows = []
+        self._statistics = {}
+        self.total = page['total'] or 0
+        self.total_actifs = page['actifs'] or 0
+        self.endResetModel()
+
+        self._append_page(page)
+
+    def client_id(self, row: int) -> int | None:
+        """Retourne l'ID du client affiché à la ligne donnée"""
+        if 0 <= row < len(self._rows):
+            return self._rows[row]['id']
+        return None
+
+    # === Chargement incrémental ===
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return self._cursor is not None and self.page_loader is not None
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid() or not self.canFetchMore():
+            return
+
+        with sql_action("clients.page_suivante"):
+            self._append_page(self.page_loader(self._cursor))
+
+    def _append_page(self, page: dict):
+        """Ajoute une page de lignes en fin de tableau"""
+        self._cursor = page['cursor']
+        rows = page['rows']
+        if not rows:
+            return
+
+        self._statistics.update(self.statistics_loader([row['id'] for row in rows]))
+
+        start = len(self._rows)
+        self.beginInsertRows(QModelIndex(), start, start + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    # === Interface QAbstractTableModel ===
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return len(HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if orientation != Qt.Orientation.Horizontal:
+            return None
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            return HEADERS[section]
+
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if section in CENTERED_HEADERS:
+                return Qt.AlignmentFlag.AlignCenter
+            return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+
+        return None
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+
+        row = self._rows[index.row()]
+        column = index.column()
+
+        if role == Qt.ItemDataRole.UserRole:
+            return row['id']
+
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == COLUMN_NOM:
+                return row['nom_complet']
+            if column == COLUMN_TYPE:
+                return "Particulier" if row['type'] == 'particulier' else "Entreprise"
+            if column == COLUMN_EMAIL:
+                return row['email']
+            if column == COLUMN_TELEPHONE:
+                return row['telephone']
+            if column == COLUMN_FACTURES:
+                return str(self._nb_factures(row['id']))
+            if column == COLUMN_STATUT:
+                return "Actif" if row['actif'] else "Inactif"
+            return None
+
+        if role == BADGE_COLOR_ROLE:
+            if column == COLUMN_TYPE:
+                return "#3498db" if row['type'] == 'particulier' else "#e67e22"  # Bleu / Orange
+            if column == COLUMN_FACTURES:
+                return "#3498db" if self._nb_factures(row['id']) else "#95a5a6"  # Bleu / Gris
+            if column == COLUMN_STATUT:
+                return "#27ae60" if row['actif'] else "#95a5a6"  # Vert / Gris
+            return None
+
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            if column in CENTERED_COLUMNS:
+                return Qt.AlignmentFlag.AlignCenter
+            return Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter
+
+        if role == Qt.ItemDataRole.ToolTipRole and column == COLUMN_EMAIL:
+            return row['email']
+
+        return None
+
+    def _nb_factures(self, client_id: int) -> int:
+        """Retourne le nombre de factures d'un client chargé"""
+        stats = self._statistics.get(client_id)
+        return stats['nb_factures'] if stats else 0
@@ -2,15 +2,64 @@
 Vue principale pour la gestion des clients
 """
 from PyQt6.QtWidgets import (
-    QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, QTableWidgetItem,
+    QWidget, QVBoxLayout, QHBoxLayout, QTableView,
     QPushButton, QLineEdit, QComboBox, QLabel, QHeaderView, QMessageBox,
     QAbstractItemView
 )
-from PyQt6.QtCore import Qt
-from PyQt6.QtGui import QFont, QColor
+from functools import partial
+from PyQt6.QtCore import Qt, QTimer, QThreadPool
+from PyQt6.QtGui import QFont
 from controllers.client_controller import ClientController
+from database.instrumentation import sql_action
 from views.client_form_dialog import ClientFormDialog
-from utils.validators import format_telephone
+from views.clients_table_model import (
+    ClientsTableModel, client_to_row,
+    COLUMN_TYPE, COLUMN_FACTURES, COLUMN_STATUT, COLUMN_ACTIONS
+)
+from views.client_delegates import BadgeDelegate, ActionsDelegate
+from views.workers import QueryWorker
+
+
+# Délai d'attente après la dernière frappe avant de lancer la recherche
+SEARCH_DEBOUNCE_MS = 250
+
+
+def load_client_page(
+    controller: ClientController,
+    query: str,
+    type_client: str | None,
+    actif: bool | None,
+    cursor: tuple | None = None,
+    with_total: bool = True
+) -> dict:
+    """
+    Charge une page de clients et la convertit en lignes d'affichage.
+
+    Args:
+        controller: Contrôleur à utiliser
+        query: Texte de recherche
+        type_client: Filtre par type ('particulier', 'entreprise', ou None)
+        actif: Filtre par statut actif (True, False, ou None)
+        cursor: Curseur de la page précédente (None pour la première page)
+        with_total: Si True, calcule aussi les totaux
+
+    Returns:
+        dict: rows, cursor, total, actifs (voir ClientsTableModel.set_first_page)
+    """
+    page = controller.get_clients_page(
+        query, type_client, actif, cursor=cursor, with_total=with_total
+    )
+    page['rows'] = [client_to_row(client) for client in page.pop('clients')]
+    return page
+
+
+def search_first_page(query: str, type_client: str | None, actif: bool | None) -> dict:
+    """
+    Charge la première page d'une recherche.
+    Exécutée dans un thread du pool (les sessions du contrôleur sont propres au thread).
+    """
+    with sql_action("clients.recherche"):
+        return load_client_page(ClientController(), query, type_client, actif)
 
 
 class ClientsView(QWidget):
@@ -19,8 +68,23 @@ class ClientsView(QWidget):
     def __init__(self):
         super().__init__()
         self.controller = ClientController()
+
+        # Recherche en arrière-plan : un seul thread, seule la dernière demande compte
+        self.search_pool = QThreadPool(self)
+        self.search_pool.setMaxThreadCount(1)
+        self.search_generation = 0
+        self.search_filters = ("", None, None)
+
+        # Temporisation de la saisie dans la barre de recherche
+        self.search_timer = QTimer(self)
+        self.search_timer.setSingleShot(True)
+        self.search_timer.setInterval(SEARCH_DEBOUNCE_MS)
+        self.search_timer.timeout.connect(self.apply_filters)
+
         self.init_ui()
-        self.load_clients()
+
+        # Chargement lancé après le premier affichage de la vue (en arrière-plan)
+        QTimer.singleShot(0, self.load_clients)
 
     def init_ui(self):
         """Initialise l'interface utilisateur"""
@@ -162,13 +226,10 @@ class ClientsView(QWidget):
         """)
         layout.addWidget(self.counter_label)
 
-        # === Tableau des clients ===
-        self.table = QTableWidget()
-        self.table.setColumnCount(7)
-        self.table.setHorizontalHeaderLabels([
-            "Nom / Raison sociale", "Type", "Email", "Téléphone",
-            "Nb factures", "Statut", "Actions"
-        ])
+        # === Tableau des clients (model/view, lignes chargées au défilement) ===
+        self.table_model = ClientsTableModel(self.controller.get_clients_statistics, self)
+        self.table = QTableView()
+        self.table.setModel(self.table_model)
 
         # Configuration du tableau
         self.table.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
@@ -180,7 +241,7 @@ class ClientsView(QWidget):
         self.table.verticalHeader().setVisible(False)
         # Style premium avec alternance, hover fluide et bordures subtiles
         self.table.setStyleSheet("""
-            QTableWidget {
+            QTableView {
                 background-color: #ffffff;
                 alternate-background-color: #f8f9fa;
                 gridline-color: #e8ecef;
@@ -189,15 +250,15 @@ class ClientsView(QWidget):
                 font-size: 12px;
                 selection-background-color: transparent;
             }
-            QTableWidget::item {
+            QTableView::item {
                 padding: 10px 12px;
                 border-right: none;
                 border-bottom: 1px solid #e8ecef;
             }
-            QTableWidget::item:hover {
+            QTableView::item:hover {
                 background-color: #e3f2fd;
             }
-            QTableWidget::item:selected {
+            QTableView::item:selected {
                 background-color: #d6eaf8;
                 color: #2c3e50;
             }
@@ -217,14 +278,11 @@ class ClientsView(QWidget):
         # Définir la hauteur des lignes à 48px
         self.table.verticalHeader().setDefaultSectionSize(48)
         self.table.verticalHeader().setMinimumSectionSize(48)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
 
         # Ajuster les colonnes avec largeurs optimisées
         header = self.table.horizontalHeader()
         header.setDefaultAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter)
-        for column in (1, 4, 5, 6):
-            header_item = self.table.horizontalHeaderItem(column)
-            if header_item is not None:
-                header_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
         header.setSectionResizeMode(0, QHeaderView.ResizeMode.Fixed)
         header.setSectionResizeMode(1, QHeaderView.ResizeMode.Fixed)
         header.setSectionResizeMode(2, QHeaderView.ResizeMode.Stretch)
@@ -242,6 +300,19 @@ class ClientsView(QWidget):
         self.table.setColumnWidth(5, 85)   # Statut (réduit)
         self.table.setColumnWidth(6, 70)   # Actions (2 boutons 26px)
 
+        # Badges et boutons d'action dessinés par des délégués (aucun widget par ligne)
+        self.type_delegate = BadgeDelegate(96, 26, 11, self.table)
+        self.factures_delegate = BadgeDelegate(48, 24, 11, self.table, min_width=True)
+        self.status_delegate = BadgeDelegate(72, 24, 10, self.table)
+        self.actions_delegate = ActionsDelegate(self.table)
+        self.actions_delegate.edit_clicked.connect(self.on_edit_row)
+        self.actions_delegate.delete_clicked.connect(self.on_delete_row)
+
+        self.table.setItemDelegateForColumn(COLUMN_TYPE, self.type_delegate)
+        self.table.setItemDelegateForColumn(COLUMN_FACTURES, self.factures_delegate)
+        self.table.setItemDelegateForColumn(COLUMN_STATUT, self.status_delegate)
+        self.table.setItemDelegateForColumn(COLUMN_ACTIONS, self.actions_delegate)
+
         # Double-clic pour modifier
         self.table.doubleClicked.connect(self.on_row_double_clicked)
 
@@ -249,231 +320,21 @@ class ClientsView(QWidget):
 
     def load_clients(self):
         """Charge tous les clients dans le tableau"""
-        clients = self.controller.get_all_clients(actif_only=False)
-        self.populate_table(clients)
-
-    def populate_table(self, clients):
-        """Remplit le tableau avec la liste des clients"""
-        self.table.setRowCount(0)
-
-        for client in clients:
-            row = self.table.rowCount()
-            self.table.insertRow(row)
-
-            # Colonne 0: Nom / Raison sociale
-            nom_item = QTableWidgetItem(client.nom_complet)
-            nom_item.setData(Qt.ItemDataRole.UserRole, client.id)
-            self.table.setItem(row, 0, nom_item)
-
-            # Colonne 1: Type (badge coloré)
-            type_widget = self.create_type_badge(client.type)
-            self.table.setCellWidget(row, 1, type_widget)
+        self.start_search("", None, None)
 
-            # Colonne 2: Email
-            self.table.setItem(row, 2, QTableWidgetItem(client.email or ""))
-
-            # Colonne 3: Téléphone
-            tel = format_telephone(client.telephone) if client.telephone else ""
-            tel_item = QTableWidgetItem(tel)
-            tel_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-            self.table.setItem(row, 3, tel_item)
-
-            # Colonne 4: Nb factures (badge)
-            stats = self.controller.get_client_statistics(client.id)
-            factures_widget = self.create_factures_badge(stats['nb_factures'])
-            self.table.setCellWidget(row, 4, factures_widget)
-
-            # Colonne 5: Statut (badge coloré)
-            status_widget = self.create_status_badge(client.actif)
-            self.table.setCellWidget(row, 5, status_widget)
-
-            # Colonne 6: Actions
-            actions_widget = self.create_actions_widget(client.id)
-            self.table.setCellWidget(row, 6, actions_widget)
+    def populate_table(self, page, page_loader):
+        """Remplit le tableau avec la première page (les suivantes arrivent au défilement)"""
+        # Statistiques des clients affichés : une requête groupée par page (pas une par ligne)
+        with sql_action("clients.affichage"):
+            self.table_model.set_first_page(page, page_loader)
 
         # Mettre à jour le compteur
-        self.update_counter(clients)
-
-    def create_type_badge(self, type_client):
-        """Crée un badge coloré uniforme pour le type de client"""
-        widget = QWidget()
-        widget.setStyleSheet("""
-            QWidget {
-                background-color: transparent;
-                border-bottom: 1px solid #e8ecef;
-            }
-        """)
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        label = QLabel("Particulier" if type_client == "particulier" else "Entreprise")
-        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        if type_client == "particulier":
-            color = "#3498db"  # Bleu
-        else:
-            color = "#e67e22"  # Orange
-
-        label.setStyleSheet(f"""
-            QLabel {{
-                background-color: {color};
-                color: white;
-                padding: 6px 14px;
-                border-radius: 15px;
-                font-size: 11px;
-                font-weight: bold;
-                min-width: 90px;
-                max-width: 90px;
-            }}
-        """)
-        label.setFixedHeight(26)
-
-        layout.addWidget(label)
-        return widget
-
-    def create_status_badge(self, actif):
-        """Crée un badge coloré compact pour le statut"""
-        widget = QWidget()
-        widget.setStyleSheet("""
-            QWidget {
-                background-color: transparent;
-                border-bottom: 1px solid #e8ecef;
-            }
-        """)
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        label = QLabel("Actif" if actif else "Inactif")
-        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        label.setCursor(Qt.CursorShape.PointingHandCursor)
-
-        color = "#27ae60" if actif else "#95a5a6"  # Vert ou Gris
-
-        label.setStyleSheet(f"""
-            QLabel {{
-                background-color: {color};
-                color: white;
-                padding: 5px 10px;
-                border-radius: 13px;
-                font-size: 10px;
-                font-weight: bold;
-                min-width: 60px;
-                max-width: 60px;
-            }}
-        """)
-        label.setFixedHeight(24)
-
-        layout.addWidget(label)
-        return widget
-
-    def create_factures_badge(self, nb_factures):
-        """Crée un badge élégant pour le nombre de factures"""
-        widget = QWidget()
-        widget.setStyleSheet("""
-            QWidget {
-                background-color: transparent;
-                border-bottom: 1px solid #e8ecef;
-            }
-        """)
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        label = QLabel(str(nb_factures))
-        label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        # Badge gris pour 0, bleu pour >0
-        if nb_factures == 0:
-            color = "#95a5a6"  # Gris
-            text_color = "white"
-        else:
-            color = "#3498db"  # Bleu
-            text_color = "white"
-
-        label.setStyleSheet(f"""
-            QLabel {{
-                background-color: {color};
-                color: {text_color};
-                padding: 4px 10px;
-                border-radius: 12px;
-                font-size: 11px;
-                font-weight: bold;
-                min-width: 28px;
-            }}
-        """)
-        label.setFixedHeight(24)
-
-        layout.addWidget(label)
-        return widget
+        self.update_counter()
 
-    def create_actions_widget(self, client_id):
-        """Crée les boutons d'action compacts pour une ligne"""
-        widget = QWidget()
-        widget.setStyleSheet("""
-            QWidget {
-                background-color: transparent;
-                border-bottom: 1px solid #e8ecef;
-            }
-        """)
-        layout = QHBoxLayout(widget)
-        layout.setContentsMargins(0, 0, 0, 0)
-        layout.setSpacing(2)  # Espacement ultra-serré
-        layout.setAlignment(Qt.AlignmentFlag.AlignCenter)
-
-        # Bouton Modifier (26x26px ultra-compact)
-        edit_btn = QPushButton("✏️")
-        edit_btn.setFixedSize(26, 26)
-        edit_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        edit_btn.setToolTip("Modifier ce client")
-        edit_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #1abc9c;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #16a085;
-            }
-            QPushButton:pressed {
-                background-color: #138d75;
-            }
-        """)
-        edit_btn.clicked.connect(lambda: self.on_edit_client(client_id))
-        layout.addWidget(edit_btn)
-
-        # Bouton Supprimer (26x26px ultra-compact)
-        delete_btn = QPushButton("🗑️")
-        delete_btn.setFixedSize(26, 26)
-        delete_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        delete_btn.setToolTip("Supprimer ce client")
-        delete_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e74c3c;
-                color: white;
-                border: none;
-                border-radius: 4px;
-                font-size: 12px;
-            }
-            QPushButton:hover {
-                background-color: #c0392b;
-            }
-            QPushButton:pressed {
-                background-color: #a93226;
-            }
-        """)
-        delete_btn.clicked.connect(lambda: self.on_delete_client(client_id))
-        layout.addWidget(delete_btn)
-
-        return widget
-
-    def update_counter(self, clients):
+    def update_counter(self):
         """Met à jour le compteur de clients avec icône"""
-        total = len(clients)
-        actifs = sum(1 for c in clients if c.actif)
+        total = self.table_model.total
+        actifs = self.table_model.total_actifs
         self.counter_label.setText(f"👥  {total} client(s)  •  {actifs} actif(s)")
 
     def on_new_client(self):
@@ -505,7 +366,8 @@ class ClientsView(QWidget):
         )
 
         if reply == QMessageBox.StandardButton.Yes:
-            success, message = self.controller.delete_client(client_id)
+            with sql_action("clients.suppression"):
+                success, message = self.controller.delete_client(client_id)
 
             if success:
                 QMessageBox.information(self, "Succès", message)
@@ -513,15 +375,25 @@ class ClientsView(QWidget):
             else:
                 QMessageBox.warning(self, "Erreur", message)
 
+    def on_edit_row(self, row):
+        """Gère le clic sur le bouton Modifier d'une ligne"""
+        client_id = self.table_model.client_id(row)
+        if client_id is not None:
+            self.on_edit_client(client_id)
+
+    def on_delete_row(self, row):
+        """Gère le clic sur le bouton Supprimer d'une ligne"""
+        client_id = self.table_model.client_id(row)
+        if client_id is not None:
+            self.on_delete_client(client_id)
+
     def on_row_double_clicked(self, index):
         """Gère le double-clic sur une ligne"""
-        row = index.row()
-        client_id = self.table.item(row, 0).data(Qt.ItemDataRole.UserRole)
-        self.on_edit_client(client_id)
+        self.on_edit_row(index.row())
 
     def on_search_changed(self):
-        """Applique la recherche en temps réel"""
-        self.apply_filters()
+        """Relance la temporisation à chaque frappe (la recherche part après une pause)"""
+        self.search_timer.start()
 
     def apply_filters(self):
         """Applique les filtres de recherche et de type/statut"""
@@ -544,5 +416,49 @@ class ClientsView(QWidget):
             actif_filter = False
 
         # Rechercher
-        clients = self.controller.search_clients(search_query, type_filter, actif_filter)
-        self.populate_table(clients)
\ No newline at end of file
+        self.start_search(search_query, type_filter, actif_filter)
+
+    def start_search(self, search_query, type_filter, actif_filter):
+        """Lance la recherche dans le pool et invalide les recherches précédentes"""
+        self.search_timer.stop()
+        self.search_generation += 1
+
+        # Abandonner les recherches en attente qui n'ont pas encore démarré
+        self.search_pool.clear()
+
+        worker = QueryWorker(
+            self.search_generation, search_first_page,
+            search_query, type_filter, actif_filter
+        )
+        worker.signals.finished.connect(self.on_search_finished)
+        worker.signals.error.connect(self.on_search_error)
+        self.search_pool.start(worker)
+
+        self.search_filters = (search_query, type_filter, actif_filter)
+
+    def on_search_finished(self, generation, page):
+        """Applique le résultat s'il correspond à la recherche la plus récente"""
+        if generation != self.search_generation:
+            return
+
+        # Pages suivantes chargées au défilement, avec les mêmes filtres
+        page_loader = partial(self.load_next_page, *self.search_filters)
+        self.populate_table(page, page_loader)
+
+    def load_next_page(self, search_query, type_filter, actif_filter, cursor):
+        """Charge la page suivant le curseur (appelée par le modèle au défilement)"""
+        return load_client_page(
+            self.controller, search_query, type_filter, actif_filter,
+            cursor=cursor, with_total=False
+        )
+
+    def on_search_error(self, generation, message):
+        """
+        Signale l'échec de la recherche la plus récente dans le compteur.
+        Les clients déjà affichés restent visibles (la recherche suivante
+        rétablit le compteur).
+        """
+        if generation != self.search_generation:
+            return
+        print(f"[ERREUR] Recherche des clients: {message}")
+        self.counter_label.setText(f"⚠️  Recherche impossible : {message}")
\ No newline at end of file
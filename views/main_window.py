@@ -8,6 +8,18 @@ from PyQt6.QtGui import QFont
 from config import APP_NAME, WINDOW_MIN_WIDTH, WINDOW_MIN_HEIGHT
 
 
+# Sections de la navigation : (libellé du menu, titre de la vue)
+SECTIONS = [
+    ("🏠  Tableau de bord", "Tableau de bord"),
+    ("👥  Clients", "Clients"),
+    ("📋  Prestations", "Prestations"),
+    ("📄  Devis", "Devis"),
+    ("🧾  Factures", "Factures"),
+    ("💰  Avoirs", "Avoirs"),
+    ("⚙️  Paramètres", "Paramètres"),
+]
+
+
 class MainWindow(QMainWindow):
     """Fenêtre principale de l'application avec navigation latérale"""
 
@@ -39,10 +51,11 @@ class MainWindow(QMainWindow):
         self.content_stack.setStyleSheet("background-color: #f5f5f5;")
         main_layout.addWidget(self.content_stack)
 
-        # Créer les vues placeholder
+        # Emplacements des vues (chaque vue est construite à sa première ouverture)
         self.create_views()
 
         # Afficher le tableau de bord par défaut
+        self.ensure_view(0)
         self.content_stack.setCurrentIndex(0)
 
     def create_sidebar(self):
@@ -93,17 +106,7 @@ class MainWindow(QMainWindow):
         # Boutons de navigation
         self.nav_buttons = []
 
-        menu_items = [
-            ("🏠  Tableau de bord", 0),
-            ("👥  Clients", 1),
-            ("📋  Prestations", 2),
-            ("📄  Devis", 3),
-            ("🧾  Factures", 4),
-            ("💰  Avoirs", 5),
-            ("⚙️  Paramètres", 6),
-        ]
-
-        for text, index in menu_items:
+        for index, (text, _) in enumerate(SECTIONS):
             btn = QPushButton(text)
             btn.setCursor(Qt.CursorShape.PointingHandCursor)
             btn.clicked.connect(lambda checked, idx=index: self.change_view(idx))
@@ -129,21 +132,39 @@ class MainWindow(QMainWindow):
         return sidebar
 
     def create_views(self):
-        """Crée les vues pour chaque section"""
-        # Import des vues
+        """
+        Réserve un emplacement vide par section.
+        Les vues (et leurs imports, contrôleurs et données) ne sont construites
+        qu'à la première ouverture de la section, voir ensure_view.
+        """
+        # Sections disposant d'une vue complète (les autres affichent un placeholder)
+        self.view_factories = {
+            1: self.create_clients_view,
+        }
+        self.built_views = set()
+
+        for _ in SECTIONS:
+            self.content_stack.addWidget(QWidget())
+
+    def create_clients_view(self):
+        """Crée la vue des clients (module importé à la première ouverture)"""
         from views.clients_view import ClientsView
+        return ClientsView()
 
-        # Tableau de bord (placeholder)
-        self.content_stack.addWidget(self.create_placeholder_view("Tableau de bord"))
+    def ensure_view(self, index):
+        """Construit la vue d'une section si elle ne l'a pas encore été"""
+        if index in self.built_views:
+            return
 
-        # Clients (vue complète)
-        self.clients_view = ClientsView()
-        self.content_stack.addWidget(self.clients_view)
+        factory = self.view_factories.get(index)
+        view = factory() if factory else self.create_placeholder_view(SECTIONS[index][1])
 
-        # Autres sections (placeholders)
-        for view_name in ["Prestations", "Devis", "Factures", "Avoirs", "Paramètres"]:
-            placeholder = self.create_placeholder_view(view_name)
-            self.content_stack.addWidget(placeholder)
+        # Remplacer l'emplacement vide par la vue
+        empty = self.content_stack.widget(index)
+        self.content_stack.removeWidget(empty)
+        empty.deleteLater()
+        self.content_stack.insertWidget(index, view)
+        self.built_views.add(index)
 
     def create_placeholder_view(self, title):
         """Crée une vue placeholder avec un titre"""
@@ -183,5 +204,6 @@ class MainWindow(QMainWindow):
         self.nav_buttons[index].style().unpolish(self.nav_buttons[index])
         self.nav_buttons[index].style().polish(self.nav_buttons[index])
 
-        # Changer la vue
+        # Changer la vue (construite à la première ouverture)
+        self.ensure_view(index)
         self.content_stack.setCurrentIndex(index)
\ No newline at end of file
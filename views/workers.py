@@ -0,0 +1,99 @@
+"""
+Exécution de tâches en arrière-plan (QThreadPool) pour ne pas bloquer l'interface
+"""
+import threading
+from PyQt6.QtCore import QObject, QRunnable, pyqtSignal
+
+
+class WorkerSignals(QObject):
+    """Signaux émis par un worker (un QRunnable ne peut pas émettre lui-même)"""
+
+    # (génération, résultat)
+    finished = pyqtSignal(int, object)
+
+    # (génération, message d'erreur)
+    error = pyqtSignal(int, str)
+
+    # (génération, éléments traités, total)
+    progress = pyqtSignal(int, int, int)
+
+
+class QueryWorker(QRunnable):
+    """
+    Exécute une fonction dans un thread du pool et renvoie son résultat.
+
+    Chaque worker porte un numéro de génération : l'appelant n'applique que
+    le résultat de la génération la plus récente et ignore les autres.
+    """
+
+    def __init__(self, generation: int, function, *args, **kwargs):
+        """
+        Initialise le worker.
+
+        Args:
+            generation: Numéro de la demande (croissant)
+            function: Fonction à exécuter dans le thread du pool
+            *args, **kwargs: Arguments de la fonction
+        """
+        super().__init__()
+        self.generation = generation
+        self.function = function
+        self.args = args
+        self.kwargs = kwargs
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """Exécute la fonction et émet le résultat ou l'erreur"""
+        try:
+            result = self.function(*self.args, **self.kwargs)
+        except Exception as e:
+            print(f"[ERREUR] QueryWorker: {e}")
+            self.signals.error.emit(self.generation, str(e))
+            return
+
+        self.signals.finished.emit(self.generation, result)
+
+
+class BatchPDFWorker(QRunnable):
+    """
+    Exécute une génération de PDF par lot (utils.pdf_batch.BatchPDFGenerator)
+    depuis un thread du pool et publie l'avancement pour la barre de progression.
+    """
+
+    def __init__(self, generation: int, batch, facture_ids: list[int], directory=None):
+        """
+        Initialise le worker.
+
+        Args:
+            generation: Numéro de la demande (croissant)
+            batch: BatchPDFGenerator (pool de processus déjà démarré ou non)
+            facture_ids: Identifiants des factures à générer
+            directory: Dossier de destination (par défaut FACTURES_DIR/<année>/)
+        """
+        super().__init__()
+        self.generation = generation
+        self.batch = batch
+        self.facture_ids = facture_ids
+        self.directory = directory
+        self.cancel_event = threading.Event()
+        self.signals = WorkerSignals()
+
+    def cancel(self):
+        """Demande l'interruption du lot (les paquets en cours se terminent)"""
+        self.cancel_event.set()
+
+    def run(self):
+        """Génère le lot et émet l'avancement puis le résultat ou l'erreur"""
+        try:
+            result = self.batch.generate(
+                self.facture_ids,
+                directory=self.directory,
+                progress=lambda done, total: self.signals.progress.emit(self.generation, done, total),
+                cancel=self.cancel_event
+            )
+        except Exception as e:
+            print(f"[ERREUR] BatchPDFWorker: {e}")
+            self.signals.error.emit(self.generation, str(e))
+            return
+
+        self.signals.finished.emit(self.generation, result)